@@ -12,7 +12,40 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-# noinspection PyUnresolvedReferences
-from .acquantumprovider import AcQuantumProvider
-# noinspection PyUnresolvedReferences
-from .credentials import AcQuantumCredentials
+
+import importlib
+import sys
+import types
+from typing import Any, List
+
+# The public names by the module defining them. The modules are imported on first use of a name, as the provider
+# pulls in qiskit and the connector, which would otherwise dominate the start of short lived processes.
+_LAZY_ATTRIBUTES = {
+    'AcQuantumProvider': '.acquantumprovider',
+    'AcQuantumCredentials': '.credentials',
+}
+
+__all__ = sorted(_LAZY_ATTRIBUTES)
+
+
+class _LazyModule(types.ModuleType):
+    """
+        The class of this package module. Module level ``__getattr__`` (PEP 562) needs Python 3.7, the attribute
+        hooks of a module subclass work on all supported versions.
+    """
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        module_name = _LAZY_ATTRIBUTES.get(name)
+        if module_name is None:
+            raise AttributeError('module {!r} has no attribute {!r}'.format(__name__, name))
+        value = getattr(importlib.import_module(module_name, __name__), name)
+        setattr(self, name, value)
+        return value
+
+    def __dir__(self):
+        # type: () -> List[str]
+        return sorted(set(super().__dir__()) | set(_LAZY_ATTRIBUTES))
+
+
+sys.modules[__name__].__class__ = _LazyModule
@@ -12,32 +12,88 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import copy
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, Executor
+from typing import Any, Dict, List, TYPE_CHECKING
+
 from qiskit.providers import BaseBackend
-from qiskit.qobj import Qobj
 
-from acquantumconnector.connector.acquantumconnector import AcQuantumConnector
 from acquantumconnector.credentials.credentials import AcQuantumCredentials
 from acquantumconnector.model.backendtype import AcQuantumBackendType
+from acquantumconnector.model.config import AcQuantumRawConfig
 from acquantumconnector.model.errors import AcQuantumRequestError
-from .acquantumerrors import AcQuantumError, AcQuantumBackendError
+from .acquantumerrors import AcQuantumError, AcQuantumBackendError, AcQuantumJobError
 from .acquantumjob import AcQuantumJob
-from .backendconfiguration import AcQuantumBackendConfiguration
+from .acquantumjobpoller import AcQuantumJobPoller
+from .configcache import AcQuantumConfigurationCache
+from .experimentcode import DEFAULT_CODE_FORMAT
+from .gateoptimizer import DEFAULT_OPTIMIZATION_LEVEL
+from .gatetranslator import DEFAULT_SCHEDULING
+from .instrumentation import AcQuantumInstrumentation, AcQuantumInstrumentedConnector, AcQuantumListener
+from .metadatastore import AcQuantumMetadataStore, AcQuantumMemoryMetadataStore
+from .pollingstrategy import AcQuantumPollingStrategy
+from .resultcache import AcQuantumResultCache
+from .translationcache import compile_template
+
+if TYPE_CHECKING:
+    # only needed for the type comments, the modules are imported on first use to keep the import fast
+    from qiskit import QuantumCircuit
+    from qiskit.qobj import Qobj
+    from acquantumconnector.connector.acquantumconnector import AcQuantumConnector
+    from .backendconfiguration import AcQuantumBackendConfiguration
+
+# Number of experiments that are uploaded at the same time by run_batch
+DEFAULT_MAX_IN_FLIGHT = 8
 
 
 class AcQuantumBackend(BaseBackend):
 
-    def __init__(self, configuration, provider, credentials, api):
-        # type: (AcQuantumBackendConfiguration, 'AcQuantumProvider', AcQuantumCredentials, AcQuantumConnector) -> None
+    def __init__(self,
+                 configuration,  # type: AcQuantumBackendConfiguration
+                 provider,  # type: 'AcQuantumProvider'
+                 credentials,  # type: AcQuantumCredentials
+                 api,  # type: AcQuantumConnector
+                 polling_strategy=None,  # type: AcQuantumPollingStrategy
+                 result_cache=None,  # type: AcQuantumResultCache
+                 optimization_level=DEFAULT_OPTIMIZATION_LEVEL,  # type: int
+                 scheduling=DEFAULT_SCHEDULING,  # type: str
+                 code_format=DEFAULT_CODE_FORMAT,  # type: str
+                 metadata_store=None,  # type: AcQuantumMetadataStore
+                 instrumentation=None,  # type: AcQuantumInstrumentation
+                 config_cache=None  # type: AcQuantumConfigurationCache
+                 ):
+        # type: (...) -> None
         """
         :param configuration: configuration of backend
         :param provider:
         :param credentials:
         :param api: api for communicating with Alibaba Computing Quantum
+        :param polling_strategy: default strategy deciding the time between status queries of jobs
+        :param result_cache: optional on-disk cache of the results of finished jobs
+        :param optimization_level: level of the peephole optimization of the gates of submitted circuits
+        :param scheduling: scheduling policy of the columns of the gates of submitted circuits
+        :param code_format: format of the code stored with the remote experiments
+        :param metadata_store: local store of the metadata of submitted experiments, defaults to an in-memory store
+        :param instrumentation: receives the timed stages of the jobs and the requests of this backend, can be
+            shared between backends
+        :param config_cache: optional on-disk cache of the calibration of the device served by ``status()``
         """
         super().__init__(provider=provider, configuration=configuration)
 
-        self._api = api
+        self._instrumentation = instrumentation or AcQuantumInstrumentation()
+        self._api = AcQuantumInstrumentedConnector(api, self._instrumentation)
         self._credentials = credentials
+        self._polling_strategy = polling_strategy or AcQuantumPollingStrategy()
+        self._result_cache = result_cache
+        self._config_cache = config_cache
+        self._optimization_level = optimization_level
+        self._scheduling = scheduling
+        self._code_format = code_format
+        self._metadata_store = metadata_store or AcQuantumMemoryMetadataStore()
+        self._job_poller = None  # type: AcQuantumJobPoller
+        self._job_poller_lock = threading.Lock()
         try:
             self._backend_type = AcQuantumBackendType[configuration.backend_name]
         except KeyError:
@@ -49,19 +105,132 @@ class AcQuantumBackend(BaseBackend):
         job.submit()
         return job
 
+    async def run_async(self, qobj, job_name=None, executor=None):
+        # type: (Qobj, str, Executor) -> AcQuantumJob
+        """
+        Submits the qobj without blocking the event loop. The submission requests are run in ``executor``.
+
+        :param qobj: the qobj to run
+        :param job_name: optional name of the job
+        :param executor: executor running the requests, defaults to the default executor of the event loop
+        :return: the submitted job, use ``result_async`` to wait for its result
+        """
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, functools.partial(self.run, qobj, job_name=job_name))
+
+    def run_batch(self, qobjs, job_names=None, max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+        # type: (List[Qobj], List[str], int) -> List[AcQuantumJob]
+        """
+        Submits many qobjs as a pipeline: the circuits are translated one after another in the calling thread
+        while the already translated ones are created, uploaded and run by a pool of ``max_in_flight`` workers.
+        The translation never runs more than ``max_in_flight`` experiments ahead of the uploads.
+
+        A job whose translation or submission failed is returned with the status ``ERROR`` instead of aborting the
+        batch.
+
+        :param qobjs: the qobjs to run
+        :param job_names: optional names of the jobs, one per qobj
+        :param max_in_flight: number of experiments that are uploaded at the same time
+        :return: the jobs, in the order of the qobjs
+        """
+        if job_names is None:
+            job_names = [None] * len(qobjs)
+        if len(job_names) != len(qobjs):
+            raise AcQuantumBackendError('The number of job names must match the number of qobjs.')
+
+        max_in_flight = max(1, max_in_flight)
+        in_flight = threading.BoundedSemaphore(max_in_flight)
+
+        jobs = [AcQuantumJob(self, None, self._api, self._is_device(), qobj=qobj, job_name=job_name)
+                for qobj, job_name in zip(qobjs, job_names)]
+
+        def upload(job, experiment_qobj, name, gates, bit_width, qubit_layout):
+            try:
+                return job._upload_experiment(experiment_qobj, name, gates, bit_width, self._backend_type,
+                                              qubit_layout), None
+            except AcQuantumRequestError as e:
+                return None, e
+            finally:
+                in_flight.release()
+
+        futures = []
+        errors = []
+        with ThreadPoolExecutor(max_workers=max_in_flight) as executor:
+            for job in jobs:
+                job_futures = []
+                error = None
+                try:
+                    for experiment_qobj, name in job._experiments_to_submit():
+                        gates, bit_width, qubit_layout = job._translate_experiment(experiment_qobj)
+                        in_flight.acquire()
+                        job_futures.append(executor.submit(upload, job, experiment_qobj, name, gates, bit_width,
+                                                           qubit_layout))
+                except Exception as e:
+                    # only this job fails, the experiments it already uploaded are deleted on finishing it
+                    error = AcQuantumJobError('The job could not be submitted: {}'.format(getattr(e, 'message', e)))
+                futures.append(job_futures)
+                errors.append(error)
+
+        for job, job_futures, error in zip(jobs, futures, errors):
+            outcomes = [f.result() for f in job_futures]
+            if error is not None:
+                outcomes.append((None, error))
+            try:
+                job._finish_submission(outcomes)
+            except AcQuantumJobError:
+                pass
+
+        return jobs
+
+    def run_sweep(self, circuit, parameter_bindings, shots=1024, job_name=None):
+        # type: (QuantumCircuit, List[Dict[Any, float]], int, str) -> AcQuantumJob
+        """
+        Runs a circuit once for every binding of its free parameters. Free parameters are symbolic instruction
+        parameters, e.g. ``rz(circuit, 'theta', q[0])``.
+
+        The circuit is compiled and translated only once, the variants differ in the angles of their rotation
+        gates. All variants are submitted concurrently as the experiments of one job, in the order of the
+        bindings; ``job.result()`` returns them as one result.
+
+        :param circuit: the circuit with free parameters
+        :param parameter_bindings: the values of the free parameters by name or ``sympy.Symbol``, one per variant
+        :param shots: number of shots of every variant
+        :param job_name: optional name of the job
+        :return: the submitted job
+        :raises: AcQuantumBackendError: if there is no binding or a binding leaves a parameter free
+        """
+        from qiskit.converters import circuits_to_qobj
+
+        if not parameter_bindings:
+            raise AcQuantumBackendError('At least one (1) parameter binding is required.')
+
+        qobj = circuits_to_qobj(circuit, backend_name=self.name(), shots=shots)
+        _, translation_template = compile_template(qobj)
+        [template] = qobj.experiments
+        qobj.experiments = [_bind_experiment(template, binding, '{}_{}'.format(template.header.name, i))
+                            for i, binding in enumerate(parameter_bindings)]
+
+        job = AcQuantumJob(self, None, self._api, not self.configuration().simulator, qobj=qobj, job_name=job_name)
+        job._translation_template = translation_template
+        job.submit()
+        return job
+
     def properties(self):
         # TODO: Implement backend properties
         pass
 
     def status(self):
         if self._is_device():
-            return self._api.get_backend_config().system_status
+            return self._backend_config().system_status
 
         raise AcQuantumBackendError('Could not find status for Simulator')
 
     def jobs(self, limit=50, skip=0):
         # type: (int, int) -> [AcQuantumJob]
         """
+        Lists the jobs of this backend with a single request. The status of a listed job is only queried
+        when it is asked for.
 
         :param limit: number of jobs to retrieve
         :param skip: starting index of retrieval
@@ -69,37 +238,226 @@ class AcQuantumBackend(BaseBackend):
         :raises: AcQuantumRequestError
         """
 
-        job_info_list = self._api.get_experiments()
-
-        jobs = []
-
-        for job in job_info_list:
-            if job.experiment_type is self._backend_type:
-                jobs.append(AcQuantumJob(self, job.experiment_id, self._api, self._is_device(), job_name=job.name))
+        job_info_list = [job for job in self._api.get_experiments()
+                         if job.experiment_type in (self._backend_type, self._backend_type.name)]
 
-        if skip:
-            jobs = jobs[skip:]
-
-        return jobs[:limit]
+        return [AcQuantumJob(self, job.experiment_id, self._api, self._is_device(), job_name=job.name)
+                for job in job_info_list[skip:skip + limit]]
 
     def retrieve_job(self, job_id):
         # type: (str) -> AcQuantumJob
         """
-        :param job_id: job id of the job to retrieve
+        :param job_id: job id of the job to retrieve, for jobs with more than one experiment the comma
+            separated list of experiment ids
         :return: job: AcQuantum Job
         :raises: AcQuantumBackendError: if retrieval fails
         """
+        if self._result_cache is not None:
+            cached = self._result_cache.get(str(job_id))
+            if cached is not None:
+                return AcQuantumJob(self, job_id, self._api, self._is_device(), api_status='COMPLETED',
+                                    job_name=cached['results'][0]['name'])
+
+        experiment_ids = str(job_id).split(',')
         try:
-            response = self._api.get_experiment(int(job_id))
+            response = self._api.get_experiment(int(experiment_ids[0]))
         except AcQuantumRequestError as ex:
             raise AcQuantumBackendError('Failed to get job "{}" {}'.format(job_id, str(ex)))
 
-        return AcQuantumJob(self, response.detail.experiment_id, self._api, self._is_device(),
-                            job_name=response.detail.name)
+        if len(experiment_ids) > 1:
+            job_id = ','.join(experiment_ids)
+        else:
+            job_id = response.detail.experiment_id
+
+        return AcQuantumJob(self, job_id, self._api, self._is_device(), job_name=response.detail.name)
 
     def _is_device(self):
         # type: () -> bool
         return not bool(self.configuration().simulator)
 
+    def polling_strategy(self):
+        # type: () -> AcQuantumPollingStrategy
+        """
+        :return: the default strategy deciding the time between status queries of the jobs of this backend
+        """
+        return self._polling_strategy
+
+    def set_polling_strategy(self, polling_strategy):
+        # type: (AcQuantumPollingStrategy) -> None
+        """
+        :param polling_strategy: the new default strategy for the jobs of this backend. It can be overridden per
+            call of ``AcQuantumJob.result``.
+        """
+        self._polling_strategy = polling_strategy
+
+    def optimization_level(self):
+        # type: () -> int
+        """
+        :return: the level of the peephole optimization of the gates of submitted circuits, see ``gateoptimizer``
+        """
+        return self._optimization_level
+
+    def set_optimization_level(self, optimization_level):
+        # type: (int) -> None
+        """
+        :param optimization_level: the new optimization level, 0 uploads the gates as translated
+        """
+        self._optimization_level = optimization_level
+
+    def scheduling(self):
+        # type: () -> str
+        """
+        :return: the scheduling policy of the columns of the gates of submitted circuits, see
+            ``gatetranslator.schedule_operations``
+        """
+        return self._scheduling
+
+    def set_scheduling(self, scheduling):
+        # type: (str) -> None
+        """
+        :param scheduling: the new scheduling policy, ``SCHEDULE_LEGACY`` reproduces the layout of former versions
+        """
+        self._scheduling = scheduling
+
+    def code_format(self):
+        # type: () -> str
+        """
+        :return: the format of the code stored with the remote experiments, see ``experimentcode``
+        """
+        return self._code_format
+
+    def set_code_format(self, code_format):
+        # type: (str) -> None
+        """
+        :param code_format: the new format, ``CODE_FORMAT_QOBJ`` stores the complete qobj as former versions
+        """
+        self._code_format = code_format
+
+    def metadata_store(self):
+        # type: () -> AcQuantumMetadataStore
+        """
+        :return: the local store of the metadata of submitted experiments
+        """
+        return self._metadata_store
+
+    def set_metadata_store(self, metadata_store):
+        # type: (AcQuantumMetadataStore) -> None
+        """
+        :param metadata_store: the new store, e.g. an ``AcQuantumSqliteMetadataStore`` shared between processes
+        """
+        self._metadata_store = metadata_store
+
+    def result_cache(self):
+        # type: () -> AcQuantumResultCache
+        """
+        :return: the on-disk cache of the results of finished jobs, None if results are not cached
+        """
+        return self._result_cache
+
+    def set_result_cache(self, result_cache):
+        # type: (AcQuantumResultCache) -> None
+        """
+        :param result_cache: the on-disk cache of the results of finished jobs, None to disable caching
+        """
+        self._result_cache = result_cache
+
+    def config_cache(self):
+        # type: () -> AcQuantumConfigurationCache
+        """
+        :return: the on-disk cache of the calibration of the device, None if it is not cached
+        """
+        return self._config_cache
+
+    def set_config_cache(self, config_cache):
+        # type: (AcQuantumConfigurationCache) -> None
+        """
+        :param config_cache: the on-disk cache of the calibration of the device, None to disable caching
+        """
+        self._config_cache = config_cache
+
+    def instrumentation(self):
+        # type: () -> AcQuantumInstrumentation
+        """
+        :return: the instrumentation of the jobs and requests of this backend
+        """
+        return self._instrumentation
+
+    def add_listener(self, listener):
+        # type: (AcQuantumListener) -> None
+        """
+        :param listener: receives the timed stages of the jobs and the requests of this backend from now on,
+            e.g. an ``AcQuantumStatistics``
+        """
+        self._instrumentation.add_listener(listener)
+
+    def remove_listener(self, listener):
+        # type: (AcQuantumListener) -> None
+        """
+        :param listener: a listener added before
+        """
+        self._instrumentation.remove_listener(listener)
+
+    def job_poller(self):
+        # type: () -> AcQuantumJobPoller
+        """
+        :return: the poller refreshing the status of all outstanding jobs of this backend
+        """
+        with self._job_poller_lock:
+            if self._job_poller is None:
+                self._job_poller = AcQuantumJobPoller()
+            return self._job_poller
+
+    def _backend_config(self):
+        # type: () -> AcQuantumRawConfig
+        """
+        :return: the configuration of the device, served by the configuration cache while it is fresh
+        """
+        if self._config_cache is None:
+            return self._api.get_backend_config()
+        raw_config = self._config_cache.calibration()
+        if raw_config is None:
+            raw_config = self._api.get_backend_config()
+            self._config_cache.put_calibration(raw_config)
+        return raw_config
+
     def backend_type(self):
         return self._backend_type
+
+
+def _bind_experiment(experiment, binding, name):
+    # type: (Any, Dict[Any, float], str) -> Any
+    """
+    :param experiment: a qobj experiment with symbolic instruction parameters
+    :param binding: the values of the parameters by name or ``sympy.Symbol``
+    :param name: the name of the bound experiment
+    :return: a copy of the experiment with the parameters replaced by their values
+    :raises: AcQuantumBackendError: if a parameter has no value
+    """
+    import sympy
+
+    values = dict((sympy.Symbol(key) if isinstance(key, str) else key, value) for key, value in binding.items())
+
+    bound = copy.copy(experiment)
+    bound.header = copy.copy(experiment.header)
+    bound.header.name = name
+    bound.instructions = []
+    for instruction in experiment.instructions:
+        params = getattr(instruction, 'params', None)
+        if params and any(isinstance(param, sympy.Basic) and param.free_symbols for param in params):
+            instruction = copy.copy(instruction)
+            instruction.params = [_bind_parameter(param, values) for param in params]
+        bound.instructions.append(instruction)
+    return bound
+
+
+def _bind_parameter(param, values):
+    # type: (Any, Dict[Any, float]) -> Any
+    import sympy
+
+    if not isinstance(param, sympy.Basic):
+        return param
+    value = param.subs(values)
+    if value.free_symbols:
+        raise AcQuantumBackendError('No value for the parameters {} of the sweep.'.format(
+            ', '.join(sorted(str(symbol) for symbol in value.free_symbols))))
+    return float(value)
@@ -13,27 +13,46 @@
 #   limitations under the License.
 
 import datetime
-import json
-import math
+import functools
+import logging
 import time
+from concurrent.futures import ThreadPoolExecutor, Executor, Future, TimeoutError as FutureTimeoutError
 from enum import Enum
-from typing import Any, List, Dict, Union
+from typing import Any, List, Dict, Tuple, Callable, Optional, TYPE_CHECKING
 
-import qiskit
-from qiskit import QuantumCircuit, QuantumRegister
-from qiskit.dagcircuit import DAGCircuit
 from qiskit.providers import BaseJob, BaseBackend
-from qiskit.providers.models import BackendConfiguration
-from qiskit.qobj import Qobj
-from qiskit.result import Result
 
+from acquantumconnector.model.backendtype import AcQuantumBackendType
 from acquantumconnector.model.errors import AcQuantumRequestError
 from acquantumconnector.model.gates import Gate
 from acquantumconnector.model.response import AcQuantumResultResponse, AcQuantumResult
-from acquantumconnector.connector.acquantumconnector import AcQuantumConnector
 from .acquantumerrors import AcQuantumJobError
 from .acquantumerrors import AcQuantumJobTimeOutError
+from .experimentcode import AcQuantumExperimentMetadata, encode_experiment_code, decode_experiment_code, \
+    DEFAULT_CODE_FORMAT
+from .gateoptimizer import optimize_operations, DEFAULT_OPTIMIZATION_LEVEL
+from .gatetranslator import translate_dag, place_operations, DEFAULT_SCHEDULING
+from .instrumentation import AcQuantumInstrumentation, AcQuantumEvent, DISABLED_INSTRUMENTATION, STAGE_QUEUE, \
+    STAGE_RESULT, STAGE_TRANSLATION, STAGE_WAIT
+from .metadatastore import AcQuantumMetadataStore
 from .models import AcQuantumExperiment
+from .pollingstrategy import AcQuantumPollingStrategy, AcQuantumFixedPollingStrategy
+from .qubitlayout import used_qubits, compact_operations
+from .resultcache import AcQuantumResultCache
+from .translationcache import AcQuantumTranslationCache, AcQuantumTranslationTemplate, default_translation_cache
+
+if TYPE_CHECKING:
+    # only needed for the type comments, the modules are imported on first use to keep the import fast
+    from qiskit import QuantumCircuit
+    from qiskit.dagcircuit import DAGCircuit
+    from qiskit.providers.models import BackendConfiguration
+    from qiskit.qobj import Qobj
+    from qiskit.result import Result
+    from acquantumconnector.connector.acquantumconnector import AcQuantumConnector
+    from .acquantumbackend import AcQuantumBackend
+    from .acquantumjobpoller import AcQuantumJobPoller
+
+logger = logging.getLogger(__name__)
 
 
 class AcQuantumJobStatus(Enum):
@@ -53,6 +72,9 @@ JOB_FINAL_STATES = (
     AcQuantumJobStatus.ERROR
 )
 
+# Upper bound of concurrent requests used to fan out the experiments of one qobj
+DEFAULT_MAX_WORKERS = 8
+
 
 class AcQuantumJob(BaseJob):
     """
@@ -64,6 +86,9 @@ class AcQuantumJob(BaseJob):
 
             job = AcQuantumJob(..)
             job.submit() # will block!
+
+        Every experiment of the qobj is submitted as its own remote experiment. The job id of a job
+        with more than one experiment is the comma separated list of the remote experiment ids.
     """
 
     def __init__(self, backend, job_id, api, is_device, qobj=None, creation_date=None, api_status=None, job_name=None):
@@ -82,23 +107,28 @@ class AcQuantumJob(BaseJob):
 
         super().__init__(backend, job_id)
 
-        if qobj is not None:
-            # validate_qobj_against_schema(qobj)
-            self._qobj = qobj
+        # validate_qobj_against_schema(qobj)
+        self._qobj = qobj
+        self._experiment_ids = []  # type: List[int]
+        if job_id is not None:
+            self._experiment_ids = [int(i) for i in str(job_id).split(',')]
 
         self._api = api  # type: AcQuantumConnector
         self._backend = backend  # type: 'AcQuantumBackend'
         self._cancelled = False
         self._status = AcQuantumJobStatus.INITIALIZING
         self._job_name = job_name
+        # the translation all experiments are bound to instead of being translated, e.g. the variants of a sweep
+        self._translation_template = None  # type: Optional[AcQuantumTranslationTemplate]
         # In case of not providing a `qobj`, it is assumed the job already
         # exists in the API (with `job_id`).
 
         if qobj is None:
             # Some API calls (`get_status_jobs`, `get_status_job`) provide
             # enough information to recreate the `Job`. If that is the case, try
-            # to make use of that information during instantiation, as
-            # `self.status()` involves an extra call to the API.
+            # to make use of that information during instantiation. Otherwise the
+            # status is queried on the first call of `self.status()`, as it
+            # involves an extra call to the API.
             if api_status == 'VALIDATING':
                 self._status = AcQuantumJobStatus.VALIDATING
             elif api_status == 'COMPLETED':
@@ -106,10 +136,9 @@ class AcQuantumJob(BaseJob):
             elif api_status == 'CANCELLED':
                 self._status = AcQuantumJobStatus.CANCELLED
                 self._cancelled = True
-            else:
-                self.status()
         self._queue_position = None
         self._is_device = is_device
+        self._submitted_at = None  # type: Optional[float]
 
         def current_utc_time():
             """Gets the current time in UTC format"""
@@ -122,40 +151,157 @@ class AcQuantumJob(BaseJob):
         self._check_for_submission()
         return self._job_id
 
-    def submit(self, n_qubits=None):
-        # type: (int) -> None
+    def submit(self, n_qubits=None, max_workers=DEFAULT_MAX_WORKERS):
+        # type: (int, int) -> None
+        """
+        Submits every experiment of the qobj as a separate remote experiment. The experiments are translated
+        one after another, so experiments of the same structure share one translation, and more than one
+        experiment is uploaded concurrently.
+
+        :param n_qubits: bit width of the experiments, defaults to the number of qubits of the backend on devices
+            and to the number of used qubits on simulators, see ``_translate_experiment``
+        :param max_workers: maximal number of experiments submitted at the same time
+        :raises: AcQuantumJobError: if the submission of any experiment fails
+        """
+        backend_type = self._backend.backend_type()
+        experiments = [(experiment_qobj, name) + self._translate_experiment(experiment_qobj, n_qubits)
+                       for experiment_qobj, name in self._experiments_to_submit()]
+
+        def submit_experiment(args):
+            experiment_qobj, name, gates, bit_width, qubit_layout = args
+            try:
+                return self._upload_experiment(experiment_qobj, name, gates, bit_width, backend_type,
+                                               qubit_layout), None
+            except AcQuantumRequestError as e:
+                return None, e
+
+        if len(experiments) == 1:
+            outcomes = [submit_experiment(experiments[0])]
+        else:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(experiments)))) as executor:
+                outcomes = list(executor.map(submit_experiment, experiments))
 
-        if self._qobj is None:
-            raise AcQuantumJobError('Can not find qobj')
+        self._finish_submission(outcomes)
 
-        if len(self._qobj.experiments) != 1:
-            raise AcQuantumJobError('The qobj must have exactly one (1) experiment.')
+    def _experiments_to_submit(self):
+        # type: () -> List[Tuple[Qobj, str]]
+        """
+        Splits the qobj of this job into single experiment qobjs and names them.
 
-        if n_qubits is None:
-            n_qubits = self._backend.configuration().n_qubits
+        :return: list of (qobj, experiment name)
+        :raises: AcQuantumJobError: if there is nothing to submit
+        """
+        if self._qobj is None:
+            raise AcQuantumJobError('Can not find qobj')
 
-        backend_type = self._backend.backend_type()
+        if not self._qobj.experiments:
+            raise AcQuantumJobError('The qobj must have at least one (1) experiment.')
 
         if self._job_name is None:
             if self._qobj.experiments[0].header.name:
                 self._job_name = self._qobj.experiments[0].header.name
             else:
                 self._job_name = self._generate_job_name()
-        job_id = None
+
+        experiments = self._split_qobj(self._qobj)
+        if len(experiments) == 1:
+            return [(experiments[0], self._job_name)]
+        return [(e, e.experiments[0].header.name or '{}_{}'.format(self._job_name, i))
+                for i, e in enumerate(experiments)]
+
+    def _translate_experiment(self, qobj, n_qubits=None):
+        # type: (Qobj, Optional[int]) -> Tuple[List[Gate], int, Optional[List[int]]]
+        """
+        Translates a single experiment qobj. Without an explicit bit width, experiments on simulators are
+        compacted to the qubits they use, as the cost of a simulation grows exponentially with its bit width.
+        Devices keep the original qubits.
+
+        :param qobj: a qobj with exactly one (1) experiment
+        :param n_qubits: the bit width of the experiment, None to choose it
+        :return: the gates, the bit width and the qubit layout of the experiment, the layout is None if the
+            experiment is not compacted
+        """
+        options = self._translation_options()
+        with self._instrumentation().stage(STAGE_TRANSLATION) as timer:
+            if n_qubits is not None or self._is_device:
+                gates = self._gates_from_qobj(qobj, **options)
+                timer.size = len(gates)
+                return gates, n_qubits or self._backend.configuration().n_qubits, None
+
+            qubit_layout = used_qubits(qobj.experiments[0])
+            gates = self._gates_from_qobj(qobj, qubit_layout=qubit_layout, **options)
+            timer.size = len(gates)
+            return gates, max(1, len(qubit_layout)), qubit_layout
+
+    def _upload_experiment(self, qobj, name, gates, n_qubits, backend_type, qubit_layout=None):
+        # type: (Qobj, str, List[Gate], int, AcQuantumBackendType, Optional[List[int]]) -> int
+        """
+        Creates, uploads and runs a single experiment qobj. The remote experiment is deleted again on failure.
+
+        :param qubit_layout: the original qubits of a compacted experiment, stored in the code of the experiment
+        :return: the id of the remote experiment
+        :raises: AcQuantumRequestError
+        """
+        code = encode_experiment_code(qobj, qubit_layout, self._code_format())
+
+        experiment_id = self._api.create_experiment(n_qubits, backend_type, name)
         try:
-            job_id = self._api.create_experiment(n_qubits, backend_type, self._job_name)
-            self._job_id = str(job_id)
+            self._api.update_experiment(experiment_id, gates, code=code)
 
-            gates = self._gates_from_qobj(self._qobj)
-            self._api.update_experiment(job_id, gates, code=json.dumps(self._qobj.as_dict()))
+            seed = getattr(qobj.config, "seed", None)
+            self._api.run_experiment(experiment_id, experiment_type=backend_type, bit_width=n_qubits,
+                                     shots=qobj.config.shots, seed=seed)
+        except AcQuantumRequestError:
+            self._api.delete_experiment(experiment_id)
+            raise
 
-            seed = getattr(self._qobj.config, "seed", None)
-            self._api.run_experiment(job_id, experiment_type=backend_type, bit_width=n_qubits,
-                                     shots=self._qobj.config.shots, seed=seed)
-        except AcQuantumRequestError as e:
-            if job_id is not None:
-                self._api.delete_experiment(job_id)
-            raise AcQuantumJobError(e.message)
+        store = self._metadata_store()
+        if store is not None:
+            store.put(experiment_id, AcQuantumExperimentMetadata.from_qobj(qobj, qubit_layout))
+        return experiment_id
+
+    def _finish_submission(self, outcomes):
+        # type: (List[Tuple[int, AcQuantumRequestError]]) -> None
+        """
+        Records the experiment ids of a submission. If any experiment failed, all others are deleted again.
+
+        :param outcomes: list of (experiment id, error) ordered as the experiments of the qobj
+        :raises: AcQuantumJobError: if the submission of any experiment failed
+        """
+        errors = [e for _, e in outcomes if e is not None]
+        experiment_ids = [experiment_id for experiment_id, _ in outcomes if experiment_id is not None]
+        if errors:
+            store = self._metadata_store()
+            for experiment_id in experiment_ids:
+                self._api.delete_experiment(experiment_id)
+                if store is not None:
+                    store.remove(experiment_id)
+            self._status = AcQuantumJobStatus.ERROR
+            self._api_error_msg = errors[0].message
+            raise AcQuantumJobError(errors[0].message)
+
+        self._experiment_ids = experiment_ids
+        self._job_id = ','.join(str(experiment_id) for experiment_id in experiment_ids)
+        self._submitted_at = time.monotonic()
+
+    @classmethod
+    def _split_qobj(cls, qobj):
+        # type: (Qobj) -> List[Qobj]
+        """Splits a qobj into qobjs holding exactly one experiment each."""
+        if len(qobj.experiments) == 1:
+            return [qobj]
+        from qiskit.qobj import Qobj
+        qobj_dict = qobj.as_dict()
+        experiments = qobj_dict.pop('experiments')
+        return [Qobj.from_dict(dict(qobj_dict, experiments=[experiment])) for experiment in experiments]
+
+    def experiment_ids(self):
+        # type: () -> List[int]
+        """
+        :return: the ids of all remote experiments of this job
+        """
+        self._check_for_submission()
+        return list(self._experiment_ids)
 
     def cancel(self):
         # type: () -> bool
@@ -164,36 +310,110 @@ class AcQuantumJob(BaseJob):
         :raises: AcQuantumJobError: if there was some unexpected failure in the server
         """
         try:
-            # self._api.del(experiment_id=int(self._job_id))
             status = self.status()
-            if status is AcQuantumJobStatus.QUEUED:
-                result = self._api.get_result(int(self.job_id())).get_results()
+            if status is not AcQuantumJobStatus.QUEUED:
+                return False
+            cancelled = False
+            for experiment_id in self._experiment_ids:
+                result = self._api.get_result(experiment_id).get_results()
                 if result:
                     self._api.delete_result(result[-1].result_id)
-                    self._status = AcQuantumJobStatus.CANCELLED
-                    return True
-            else:
-                return False
+                    cancelled = True
+            if cancelled:
+                self._status = AcQuantumJobStatus.CANCELLED
+                self._cancelled = True
+            return cancelled
         except AcQuantumRequestError as ex:
             self._status = AcQuantumJobStatus.ERROR
             raise AcQuantumJobError('Error canceling job: {}'.format(ex.message))
 
-    def result(self, timeout=None, wait=5):
-        # type: (int, int) -> Result
+    def result(self, timeout=None, wait=None, polling_strategy=None):
+        # type: (int, float, AcQuantumPollingStrategy) -> Result
         """
         Return the result from the job.
         :param timeout: number of seconds to wait for job
-        :param wait: time between queries to Alibaba Computing Quantum
+        :param wait: fixed time between queries to Alibaba Computing Quantum, overrides the polling strategy
+        :param polling_strategy: strategy deciding the time between queries, defaults to the one of the backend
         :return: qiskit.Result
         """
-        job_response = self._wait_for_result(timeout=timeout, wait=5)
+        cached_result = self._cached_result()
+        if cached_result is not None:
+            return cached_result
+        job_response = self._wait_for_result(timeout=timeout,
+                                             polling_strategy=self._polling_strategy(wait, polling_strategy))
         return self._result_from_job_response(job_response)
 
-    def _wait_for_result(self, timeout=None, wait=5):
-        # type: (int, int) -> AcQuantumResultResponse
+    def _translation_options(self):
+        # type: () -> Dict[str, Any]
+        """
+        :return: the keyword arguments of ``_gates_from_qobj`` configured at the backend
+        """
+        options = {}  # type: Dict[str, Any]
+        if self._backend is not None and hasattr(self._backend, 'optimization_level'):
+            options['optimization_level'] = self._backend.optimization_level()
+        if self._backend is not None and hasattr(self._backend, 'scheduling'):
+            options['scheduling'] = self._backend.scheduling()
+        if self._translation_template is not None:
+            options['translation_template'] = self._translation_template
+        return options
+
+    def _code_format(self):
+        # type: () -> str
+        if self._backend is not None and hasattr(self._backend, 'code_format'):
+            return self._backend.code_format()
+        return DEFAULT_CODE_FORMAT
+
+    def _metadata_store(self):
+        # type: () -> Optional[AcQuantumMetadataStore]
+        if self._backend is not None and hasattr(self._backend, 'metadata_store'):
+            return self._backend.metadata_store()
+        return None
+
+    def _instrumentation(self):
+        # type: () -> AcQuantumInstrumentation
+        if self._backend is not None and hasattr(self._backend, 'instrumentation'):
+            instrumentation = self._backend.instrumentation()
+            if isinstance(instrumentation, AcQuantumInstrumentation):
+                return instrumentation
+        return DISABLED_INSTRUMENTATION
+
+    def _result_cache(self):
+        # type: () -> AcQuantumResultCache
+        if self._backend is not None and hasattr(self._backend, 'result_cache'):
+            return self._backend.result_cache()
+        return None
+
+    def _cached_result(self):
+        # type: () -> Optional[Result]
+        """
+        :return: the result of this job from the result cache of the backend, if any
+        """
+        cache = self._result_cache()
+        if cache is None or self._job_id is None:
+            return None
+        result_dict = cache.get(str(self._job_id))
+        if result_dict is None:
+            return None
+        self._status = AcQuantumJobStatus.DONE
+        from qiskit.result import Result
+        return Result.from_dict(result_dict)
+
+    def _polling_strategy(self, wait=None, polling_strategy=None):
+        # type: (float, AcQuantumPollingStrategy) -> AcQuantumPollingStrategy
+        if polling_strategy is not None:
+            return polling_strategy
+        if wait is not None:
+            return AcQuantumFixedPollingStrategy(wait)
+        if self._backend is not None and hasattr(self._backend, 'polling_strategy'):
+            return self._backend.polling_strategy()
+        return AcQuantumPollingStrategy()
+
+    def _wait_for_result(self, timeout=None, polling_strategy=None):
+        # type: (int, AcQuantumPollingStrategy) -> List[AcQuantumResultResponse]
         self._check_for_submission()
         try:
-            job_response = self._wait_for_job(timeout=timeout, wait=wait)
+            with self._instrumentation().stage(STAGE_WAIT, job_id=str(self._job_id)):
+                job_response = self._wait_for_job(timeout=timeout, polling_strategy=polling_strategy)
         except AcQuantumRequestError:
             raise AcQuantumJobError('Result query failed')
         status = self.status()
@@ -201,19 +421,126 @@ class AcQuantumJob(BaseJob):
             raise AcQuantumJobError('Invalid job state. The job should be DONE but it is {}'.format(str(status)))
         return job_response
 
-    def _wait_for_job(self, timeout, wait):
-        # type: (int, int) -> AcQuantumResultResponse
+    def _wait_for_job(self, timeout, polling_strategy=None):
+        # type: (int, AcQuantumPollingStrategy) -> List[AcQuantumResultResponse]
+        poller = self._job_poller()
+        if poller is not None:
+            try:
+                poller.watch(self, polling_strategy).result(timeout=timeout)
+            except FutureTimeoutError:
+                raise AcQuantumJobTimeOutError('Timeout while waiting for the job: {}'.format(self._job_id))
+            finally:
+                # a job given up on must not be polled forever
+                poller.unwatch(self)
+        else:
+            self._poll_until_final(timeout, polling_strategy)
+        if self._cancelled:
+            raise AcQuantumJobError('Job result impossible to retrieve. The job was cancelled')
+
+        return [self._api.get_result(experiment_id) for experiment_id in self._experiment_ids]
+
+    def _poll_until_final(self, timeout, polling_strategy=None):
+        # type: (int, AcQuantumPollingStrategy) -> None
+        polling_strategy = polling_strategy or self._polling_strategy()
         start_time = time.time()
+        attempt = 0
         while self.status() not in JOB_FINAL_STATES:
             elapsed_time = time.time() - start_time
             if timeout is not None and elapsed_time >= timeout:
                 raise AcQuantumJobTimeOutError('Timeout while waiting for the job: {}'.format(self._job_id))
 
-            time.sleep(wait)
+            interval = polling_strategy.interval(attempt, self._queue_position)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            time.sleep(interval)
+            attempt += 1
+
+    def _job_poller(self):
+        # type: () -> AcQuantumJobPoller
+        if self._backend is not None and hasattr(self._backend, 'job_poller'):
+            return self._backend.job_poller()
+        return None
+
+    def future(self, polling_strategy=None):
+        # type: (AcQuantumPollingStrategy) -> Future
+        """
+        Hands the job to the shared poller of its backend.
+
+        :param polling_strategy: strategy deciding the time between status queries, defaults to the one of the backend
+        :return: future resolving to the final status of the job
+        :raises: AcQuantumJobError: if the job has not been submitted or has no backend
+        """
+        self._check_for_submission()
+        poller = self._job_poller()
+        if poller is None:
+            raise AcQuantumJobError('The job has no backend to poll its status')
+        return poller.watch(self, polling_strategy)
+
+    def add_done_callback(self, fn):
+        # type: (Callable[[AcQuantumJob], None]) -> None
+        """
+        :param fn: called with this job as soon as the shared poller of the backend finds it in a final state
+        """
+        self.future().add_done_callback(lambda _: fn(self))
+
+    async def result_async(self, timeout=None, wait=None, polling_strategy=None, executor=None):
+        # type: (int, float, AcQuantumPollingStrategy, Executor) -> Result
+        """
+        Return the result from the job without blocking the event loop. Waiting between two queries is done
+        with ``asyncio.sleep``, so any number of jobs can wait on one event loop. The single requests to
+        Alibaba Computing Quantum are run in ``executor``.
+
+        :param timeout: number of seconds to wait for job
+        :param wait: fixed time between queries to Alibaba Computing Quantum, overrides the polling strategy
+        :param polling_strategy: strategy deciding the time between queries, defaults to the one of the backend
+        :param executor: executor running the requests, defaults to the default executor of the event loop
+        :return: qiskit.Result
+        """
+        cached_result = self._cached_result()
+        if cached_result is not None:
+            return cached_result
+        import asyncio
+        loop = asyncio.get_event_loop()
+        job_response = await self._wait_for_result_async(
+            timeout=timeout, polling_strategy=self._polling_strategy(wait, polling_strategy), executor=executor)
+        return await loop.run_in_executor(executor, self._result_from_job_response, job_response)
+
+    async def _wait_for_result_async(self, timeout=None, polling_strategy=None, executor=None):
+        # type: (int, AcQuantumPollingStrategy, Executor) -> List[AcQuantumResultResponse]
+        self._check_for_submission()
+        try:
+            with self._instrumentation().stage(STAGE_WAIT, job_id=str(self._job_id)):
+                job_response = await self._wait_for_job_async(timeout=timeout, polling_strategy=polling_strategy,
+                                                              executor=executor)
+        except AcQuantumRequestError:
+            raise AcQuantumJobError('Result query failed')
+        status = await self.status_async(executor=executor)
+        if status is not AcQuantumJobStatus.DONE:
+            raise AcQuantumJobError('Invalid job state. The job should be DONE but it is {}'.format(str(status)))
+        return job_response
+
+    async def _wait_for_job_async(self, timeout, polling_strategy=None, executor=None):
+        # type: (int, AcQuantumPollingStrategy, Executor) -> List[AcQuantumResultResponse]
+        import asyncio
+        polling_strategy = polling_strategy or self._polling_strategy()
+        loop = asyncio.get_event_loop()
+        start_time = loop.time()
+        attempt = 0
+        while await self.status_async(executor=executor) not in JOB_FINAL_STATES:
+            elapsed_time = loop.time() - start_time
+            if timeout is not None and elapsed_time >= timeout:
+                raise AcQuantumJobTimeOutError('Timeout while waiting for the job: {}'.format(self._job_id))
+
+            interval = polling_strategy.interval(attempt, self._queue_position)
+            if timeout is not None:
+                interval = min(interval, timeout - elapsed_time)
+            await asyncio.sleep(interval)
+            attempt += 1
         if self._cancelled:
             raise AcQuantumJobError('Job result impossible to retrieve. The job was cancelled')
 
-        return self._api.get_result(int(self._job_id))
+        return await loop.run_in_executor(
+            executor, lambda: [self._api.get_result(experiment_id) for experiment_id in self._experiment_ids])
 
     def _check_for_submission(self):
         """
@@ -225,92 +552,214 @@ class AcQuantumJob(BaseJob):
     def status(self):
         # type: () -> AcQuantumJobStatus
         """
-        Query the Api to update the status of the job
+        Query the Api to update the status of the job. A job with more than one experiment is
+        only DONE if all of its experiments are. Finished jobs are not queried again.
         :return: The status of the job, once updated
         :raises: AcQuantumJobError: if there was an unknown answer from the server
         """
-        if self._status is AcQuantumJobStatus.CANCELLED:
+        if self._status in (AcQuantumJobStatus.CANCELLED, AcQuantumJobStatus.DONE) or not self._experiment_ids:
             return self._status
 
+        statuses = []
+        self._queue_position = None
+        for experiment_id in self._experiment_ids:
+            status, queue_position = self._experiment_status(experiment_id)
+            statuses.append(status)
+            if status is AcQuantumJobStatus.QUEUED and self._queue_position is None:
+                self._queue_position = queue_position
+
+        if AcQuantumJobStatus.ERROR in statuses:
+            self._status = AcQuantumJobStatus.ERROR
+        elif all(status is AcQuantumJobStatus.DONE for status in statuses):
+            self._status = AcQuantumJobStatus.DONE
+        elif AcQuantumJobStatus.RUNNING in statuses:
+            self._status = AcQuantumJobStatus.RUNNING
+        else:
+            self._status = AcQuantumJobStatus.QUEUED
+
+        if self._submitted_at is not None and self._status is not AcQuantumJobStatus.QUEUED:
+            instrumentation = self._instrumentation()
+            if instrumentation.enabled():
+                instrumentation.emit(AcQuantumEvent(STAGE_QUEUE, time.monotonic() - self._submitted_at,
+                                                    job_id=str(self._job_id)))
+            self._submitted_at = None
+        return self._status
+
+    async def status_async(self, executor=None):
+        # type: (Executor) -> AcQuantumJobStatus
+        """
+        Query the Api to update the status of the job without blocking the event loop.
+
+        :param executor: executor running the requests, defaults to the default executor of the event loop
+        :return: The status of the job, once updated
+        :raises: AcQuantumJobError: if there was an unknown answer from the server
+        """
+        import asyncio
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(executor, self.status)
+
+    def _experiment_status(self, experiment_id):
+        # type: (int) -> (AcQuantumJobStatus, Any)
+        """
+        Query the Api for the status of a single remote experiment
+        :return: The status of the experiment and its queue position if it is queued
+        :raises: AcQuantumJobError: if there was an unknown answer from the server
+        """
         try:
-            result = self._api.get_result(experiment_id=int(self._job_id)).get_results()
-            if not result:
-                self._status = AcQuantumJobStatus.QUEUED
-            else:
-                result = result[-1]
+            result = self._api.get_result(experiment_id=experiment_id).get_results()
         except AcQuantumRequestError as e:
-            print(e)
-            self._status = AcQuantumJobStatus.ERROR
-            return self._status
+            logger.warning('Could not query the status of experiment %s: %s', experiment_id, e)
+            return AcQuantumJobStatus.ERROR, None
+
+        if not result:
+            return AcQuantumJobStatus.QUEUED, None
+        result = result[-1]
 
         if not result.finish_time:
-            self._status = AcQuantumJobStatus.RUNNING
-            queued, self._queue_position = self._is_job_queued(result)
+            queued, queue_position = self._is_job_queued(result)
             if queued:
-                self._status = AcQuantumJobStatus.QUEUED
+                return AcQuantumJobStatus.QUEUED, queue_position
+            return AcQuantumJobStatus.RUNNING, None
         elif result.exception:
-            self._status = AcQuantumJobStatus.ERROR
+            return AcQuantumJobStatus.ERROR, None
         elif result.finish_time:
-            self._status = AcQuantumJobStatus.DONE
+            return AcQuantumJobStatus.DONE, None
         else:
             raise AcQuantumJobError('Unrecognized answer from server: \n{}'.format(result))
-        return self._status
 
     def _generate_job_name(self):
         # type: () -> str
         return 'Qiskit_generated_{}'.format(self._creation_date)
 
-    def _result_from_job_response(self, job_response):
-        # type: (AcQuantumResultResponse) -> Result
+    def _experiment_metadata(self, experiment_id):
+        # type: (int) -> AcQuantumExperimentMetadata
+        """
+        :param experiment_id: the id of a remote experiment of this job
+        :return: the metadata of the experiment from the metadata store of the backend or else from the API
+        """
+        store = self._metadata_store()
+        metadata = store.get(experiment_id) if store is not None else None
+        if metadata is None:
+            experiment = self._api.get_experiment(experiment_id)  # type: AcQuantumExperiment
+            metadata = decode_experiment_code(experiment.code)
+            if store is not None:
+                store.put(experiment_id, metadata)
+        return metadata
+
+    def counts(self, experiment=0, timeout=None, wait=None, polling_strategy=None):
+        # type: (int, int, float, AcQuantumPollingStrategy) -> AcQuantumCounts
+        """
+        Returns the counts of one experiment as arrays without building the ``qiskit.Result``, e.g. for
+        marginals or the most probable outcomes of wide circuits.
 
+        :param experiment: the index of the experiment in the job
+        :param timeout: number of seconds to wait for job
+        :param wait: fixed time between queries to Alibaba Computing Quantum, overrides the polling strategy
+        :param polling_strategy: strategy deciding the time between queries, defaults to the one of the backend
+        :return: the counts of the experiment
+        """
+        from .counts import AcQuantumCounts
+        cache = self._result_cache()
+        result_dict = cache.get(str(self._job_id)) if cache is not None and self._job_id is not None else None
+        if result_dict is not None:
+            experiment_result = result_dict['results'][experiment]
+            return AcQuantumCounts.from_counts(experiment_result['data']['counts'], experiment_result['shots'])
+
+        job_responses = self._wait_for_result(timeout=timeout,
+                                              polling_strategy=self._polling_strategy(wait, polling_strategy))
+        experiment_id = self._experiment_ids[experiment]
+        experiment_result = self._experiment_results(experiment_id, job_responses[experiment])[-1]
+        return AcQuantumCounts.from_data(experiment_result.data, experiment_result.shots,
+                                         self._experiment_metadata(experiment_id).qubit_layout)
+
+    @classmethod
+    def _experiment_results(cls, experiment_id, job_response):
+        # type: (int, AcQuantumResultResponse) -> List[AcQuantumResult]
+        job_results = job_response.get_results()
+        if not job_results:
+            raise AcQuantumJobError('No result found for experiment {}'.format(experiment_id))
+        return job_results
+
+    def _result_from_job_response(self, job_responses):
+        # type: (List[AcQuantumResultResponse]) -> Result
+        """
+        Builds one result with one entry per experiment of the job. Only the success of the job is determined
+        right away, the result itself is built on first use.
+
+        :param job_responses: the result responses, ordered as the experiments of the job
+        :return: qiskit.Result
+        """
+        from .lazyresult import AcQuantumLazyResult
         backend = self.backend()  # type: BaseBackend
         config = backend.configuration()  # type: BackendConfiguration
-        experiment = self._api.get_experiment(int(self.job_id()))  # type: AcQuantumExperiment
 
-        result_details = {}
-        job_results = job_response.get_results()
-        if len(job_results) == 1:
-            experiment_result = job_results[0]  # type: AcQuantumResult
-
-            counts = dict((hex(int(k, 2)), int(v * experiment_result.shots)) for k, v in experiment_result.data.items())
-            self._qobj = Qobj.from_dict(json.loads(experiment.code))
-            self._job_name = self._qobj.experiments[0].header.name
-
-            success = experiment_result.exception is None
-
-            result_details = {
-                "status": self._status.name,
-                "success": success,
-                "name": self._job_name,
-                "seed": experiment_result.seed,
-                "shots": experiment_result.shots,
-                "data": {
-                    "counts": counts
-                },
-                "start_time": experiment_result.start_time,
-                "finish_time": experiment_result.finish_time,
-                "header": self._qobj.experiments[0].header.as_dict()
-            }
+        experiment_results = [self._experiment_results(experiment_id, job_response)
+                              for experiment_id, job_response in zip(self._experiment_ids, job_responses)]
+        success = all(len(job_results) == 1 and job_results[-1].exception is None
+                      for job_results in experiment_results)
 
-        from dateutil.parser import parser
-        date = parser().parse(result_details['finish_time'])
+        return AcQuantumLazyResult(functools.partial(self._result_dict, experiment_results),
+                                   config.backend_name, config.backend_version, str(self.job_id()), success,
+                                   instrumentation=self._instrumentation())
 
-        result_dict = {
-            'results': [result_details],
-            'backend_name': config.backend_name,
-            'backend_version': config.backend_version,
-            'qobj_id': self._qobj.qobj_id,
-            'job_id': str(self.job_id()),
-            'success': len(job_results) == 1,
-            'header': {
-                "backend_name": config.backend_name
-            },
-            "date": date.isoformat()
-        }
+    def _result_dict(self, experiment_results):
+        # type: (List[List[AcQuantumResult]]) -> Dict[str, Any]
+        """
+        :param experiment_results: the results of every experiment of the job
+        :return: the dictionary the result of the job is built from
+        """
+        from dateutil.parser import parser
+        from .counts import AcQuantumCounts
+
+        with self._instrumentation().stage(STAGE_RESULT, job_id=str(self.job_id())) as timer:
+            backend = self.backend()  # type: BaseBackend
+            config = backend.configuration()  # type: BackendConfiguration
+
+            results = []
+            dates = []
+            qobj_id = None
+            for experiment_id, job_results in zip(self._experiment_ids, experiment_results):
+                metadata = self._experiment_metadata(experiment_id)
+                qobj_id = qobj_id or metadata.qobj_id
+
+                experiment_result = job_results[-1]  # type: AcQuantumResult
+                counts = AcQuantumCounts.from_data(experiment_result.data, experiment_result.shots,
+                                                   metadata.qubit_layout).to_dict()
+
+                results.append({
+                    "status": self._status.name,
+                    "success": len(job_results) == 1 and experiment_result.exception is None,
+                    "name": metadata.name,
+                    "seed": experiment_result.seed,
+                    "shots": experiment_result.shots,
+                    "data": {
+                        "counts": counts
+                    },
+                    "start_time": experiment_result.start_time,
+                    "finish_time": experiment_result.finish_time,
+                    "header": metadata.header
+                })
+                dates.append(parser().parse(experiment_result.finish_time))
+
+            result_dict = {
+                'results': results,
+                'backend_name': config.backend_name,
+                'backend_version': config.backend_version,
+                'qobj_id': qobj_id,
+                'job_id': str(self.job_id()),
+                'success': all(r['success'] for r in results),
+                'header': {
+                    "backend_name": config.backend_name
+                },
+                "date": max(dates).isoformat()
+            }
 
-        result = Result.from_dict(result_dict)
+            timer.size = sum(len(result['data']['counts']) for result in results)
+            cache = self._result_cache()
+            if cache is not None and result_dict['success']:
+                cache.put(str(self.job_id()), result_dict)
 
-        return result
+            return result_dict
 
     @classmethod
     def _is_job_queued(cls, result):
@@ -326,198 +775,38 @@ class AcQuantumJob(BaseJob):
         return self._queue_position
 
     @classmethod
-    def _gates_from_qobj(cls, qobj):
-        # type: (Qobj) -> List[Gate]
-        import qiskit.extensions.standard as standard_gates
-        import acquantumconnector.model.gates as ac_gates
-        from qiskit.converters import qobj_to_circuits, circuit_to_dag
-
-        qubit_labels = qobj.experiments[0].header.qubit_labels  # type: List[List[Any]]
-
-        qc = qobj_to_circuits(qobj)  # type: QuantumCircuit
-        # TODO: do all circuits.
-        dag = circuit_to_dag(qc[0])  # type: DAGCircuit
-
-        # Result
-        gates = []  # type: List[Gate]
-
-        def get_q_index(qarg):
-            qubit, y = qarg
-            q_index = qubit_labels.index([qubit.name, y])
-            return q_index
-
-        current_layer_x_number = 1
-        layer = {}  # type: Dict[str, Union[DAGCircuit, list]]
-        for layer in dag.layers():
-            layer_dag = layer["graph"]  # type: DAGCircuit
-            x_numbers = dict((qubit_labels.index([r.name, i]), current_layer_x_number) for r, i in layer_dag.wires
-                             if isinstance(r, QuantumRegister))
-
-            for op_node in layer_dag.get_op_nodes(data=True):
-                # Given keys:
-                # op_node[1]["cargs"]
-                # op_node[1]["condition"]
-                # op_node[1]["name"]
-                # op_node[1]["qargs"]
-                # op_node[1]["type"]
-                # op_node[1]["op"]
-
-                if isinstance(op_node[1]["op"], standard_gates.U1Gate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.U1Gate
-                    y = get_q_index(qk_gate.qargs[0])
-                    [theta] = qk_gate.param
-                    gates.append(ac_gates.RzGate(x_numbers[y], y + y, theta))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.U2Gate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.U2Gate
-                    y = get_q_index(qk_gate.qargs[0])
-                    [phi, lam] = qk_gate.param
-
-                    # ignore global phase alpha!
-                    # alpha = lam/2 + phi/2
-                    beta = phi
-                    delta = lam
-                    gamma = math.pi / 2
-                    gates.append(ac_gates.RzGate(x_numbers[y], y + 1, delta))
-                    x_numbers[y] += 1
-                    gates.append(ac_gates.RyGate(x_numbers[y], y + 1, gamma))
-                    x_numbers[y] += 1
-                    gates.append(ac_gates.RzGate(x_numbers[y], y + 1, beta))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.U3Gate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.U3Gate
-                    # I assume that all qubits have been transformed into the qubit regsiter 'q'
-                    # and that the index simply tells me which wire this is.
-                    [theta, phi, lam] = qk_gate.param
-                    y = get_q_index(qk_gate.qargs[0])
-
-                    # ignore global phase alpha!
-                    # alpha = lam/2 + phi/2
-                    beta = phi
-                    delta = lam
-                    gamma = theta
-                    gates.append(ac_gates.RzGate(x_numbers[y], y + 1, delta))
-                    x_numbers[y] += 1
-                    gates.append(ac_gates.RyGate(x_numbers[y], y + 1, gamma))
-                    x_numbers[y] += 1
-                    gates.append(ac_gates.RzGate(x_numbers[y], y + 1, beta))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.HGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.HGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.HGate(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.RXGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.RXGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    [theta] = qk_gate.param
-                    gates.append(ac_gates.RxGate(x_numbers[y], y + 1, theta))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.RYGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.RYGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    [theta] = qk_gate.param
-                    gates.append(ac_gates.RyGate(x_numbers[y], y + 1, theta))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.RZGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.RZGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    [theta] = qk_gate.param
-                    gates.append(ac_gates.RzGate(x_numbers[y], y + 1, theta))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.XGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.XGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.XGate(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.YGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.YGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.YGate(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.ZGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.ZGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.ZGate(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.SGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.SGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.SGate(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.SdgGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.SdgGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.SDag(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.TGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.TGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.TGate(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.TdgGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.TdgGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.TDag(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.CrzGate):
-                    qk_gate = op_node[1]["op"]  # type: standard_gates.CrzGate
-                    y = get_q_index(qk_gate.qargs[0])
-                    gates.append(ac_gates.CPhase(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.CnotGate):
-                    cx = op_node[1]["op"]  # type: standard_gates.CnotGate
-                    y1 = get_q_index(cx.qargs[0])
-                    y2 = get_q_index(cx.qargs[1])
-                    gates.append(ac_gates.HGate(x_numbers[y2], y2 + 1))
-                    x_numbers[y1] += 1
-                    x_numbers[y2] += 1
-                    gates.append(ac_gates.CPhase(x_numbers[y2], [y1 + 1, y2 + 1]))
-                    x_numbers[y1] += 1
-                    x_numbers[y2] += 1
-                    gates.append(ac_gates.HGate(x_numbers[y2], y2 + 1))
-                    x_numbers[y1] += 1
-                    x_numbers[y2] += 1
-
-                elif isinstance(op_node[1]["op"], standard_gates.ToffoliGate):
-                    cx = op_node[1]["op"]  # type: standard_gates.ToffoliGate
-                    y1 = get_q_index(cx.qargs[0])
-                    y2 = get_q_index(cx.qargs[1])
-                    y3 = get_q_index(cx.qargs[2])
-                    gates.append(ac_gates.HGate(x_numbers[y3], y3 + 1))
-                    x_numbers[y1] += 1
-                    x_numbers[y2] += 1
-                    x_numbers[y3] += 1
-                    gates.append(ac_gates.CCPhase(x_numbers[y3], [y1 + 1, y2 + 1, y3 + 1]))
-                    x_numbers[y1] += 1
-                    x_numbers[y2] += 1
-                    x_numbers[y3] += 1
-                    gates.append(ac_gates.HGate(x_numbers[y3], y3 + 1))
-                    x_numbers[y1] += 1
-                    x_numbers[y2] += 1
-                    x_numbers[y3] += 1
-
-                elif isinstance(op_node[1]["op"], qiskit.circuit.Measure):
-                    measure = op_node[1]["op"]  # type: qiskit.circuit.Measure
-                    y = get_q_index(measure.qargs[0])
-                    gates.append(ac_gates.Measure(x_numbers[y], y + 1))
-                    x_numbers[y] += 1
-
-            current_layer_x_number = max(x_numbers.values())
-
-        return gates
+    def _gates_from_qobj(cls, qobj, translation_cache=default_translation_cache,
+                         optimization_level=DEFAULT_OPTIMIZATION_LEVEL, scheduling=DEFAULT_SCHEDULING,
+                         qubit_layout=None, translation_template=None):
+        # type: (Qobj, AcQuantumTranslationCache, int, str, List[int], AcQuantumTranslationTemplate) -> List[Gate]
+        """
+        :param qobj: a qobj with exactly one (1) experiment
+        :param translation_cache: the cache of translated circuit structures, None to translate from scratch
+        :param optimization_level: the level of the peephole optimization of the translated gates
+        :param scheduling: the scheduling policy of the columns of the gates
+        :param qubit_layout: the used qubits of the experiment to compact the gates to, None to keep the qubits
+        :param translation_template: the translation of the structure of the experiment to bind its parameters
+            to, takes precedence over the translation cache
+        :return: the AcQuantum gates of the experiment
+        :raises: AcQuantumJobError: if the qobj does not have exactly one (1) experiment
+        """
+        if len(qobj.experiments) != 1:
+            raise AcQuantumJobError('The qobj must have exactly one (1) experiment, use _split_qobj.')
+
+        if translation_template is not None:
+            operations = translation_template.bind(qobj.experiments[0].instructions)
+        elif translation_cache is not None:
+            operations = translation_cache.translate(qobj)
+        else:
+            from qiskit.converters import qobj_to_circuits, circuit_to_dag
+
+            qubit_labels = qobj.experiments[0].header.qubit_labels  # type: List[List[Any]]
+
+            qc = qobj_to_circuits(qobj)  # type: QuantumCircuit
+            dag = circuit_to_dag(qc[0])  # type: DAGCircuit
+            operations = translate_dag(dag, qubit_labels)
+
+        operations = optimize_operations(operations, optimization_level)
+        if qubit_layout is not None:
+            operations = compact_operations(operations, qubit_layout)
+        return place_operations(operations, scheduling)
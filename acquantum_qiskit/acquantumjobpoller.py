@@ -0,0 +1,163 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, List, TYPE_CHECKING
+
+from .acquantumjob import JOB_FINAL_STATES
+from .pollingstrategy import AcQuantumPollingStrategy
+
+if TYPE_CHECKING:
+    from .acquantumjob import AcQuantumJob
+
+# Upper bound of concurrent status queries of one sweep
+DEFAULT_MAX_WORKERS = 8
+
+
+class _WatchedJob(object):
+
+    def __init__(self, job, polling_strategy):
+        # type: ('AcQuantumJob', AcQuantumPollingStrategy) -> None
+        self.job = job
+        self.polling_strategy = polling_strategy
+        self.future = Future()  # type: Future
+        # number of watches not unwatched yet, the future is shared by all of them
+        self.watchers = 0
+        self.attempt = 0
+        self.next_poll = time.monotonic()
+
+
+class AcQuantumJobPoller(object):
+    """
+        Refreshes the status of all outstanding jobs of a backend from one background thread.
+
+        Every job is queried when its polling strategy says it is due; all jobs due at the same time are
+        queried in one sweep by at most ``max_workers`` concurrent requests. Watching a job returns a
+        ``concurrent.futures.Future`` which resolves to the final status of the job. The thread only runs
+        while there are jobs to watch.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        # type: (int) -> None
+        """
+        :param max_workers: maximal number of concurrent status queries
+        """
+        self._max_workers = max_workers
+        self._watched = {}  # type: Dict[int, _WatchedJob]
+        self._condition = threading.Condition()
+        self._thread = None  # type: threading.Thread
+        self._executor = None  # type: ThreadPoolExecutor
+
+    def watch(self, job, polling_strategy=None):
+        # type: ('AcQuantumJob', AcQuantumPollingStrategy) -> Future
+        """
+        Adds a job to the set of outstanding jobs. Watching a job twice returns the same future. The job stays
+        outstanding until it is final or every watch is undone by ``unwatch``.
+
+        :param job: the submitted job
+        :param polling_strategy: strategy deciding the time between the status queries of the job,
+            defaults to the one of the job
+        :return: future resolving to the final status of the job
+        """
+        with self._condition:
+            watched = self._watched.get(id(job))
+            if watched is None:
+                watched = _WatchedJob(job, polling_strategy or job._polling_strategy())
+                self._watched[id(job)] = watched
+            elif polling_strategy is not None:
+                watched.polling_strategy = polling_strategy
+                watched.next_poll = time.monotonic()
+            watched.watchers += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='AcQuantumJobPoller', daemon=True)
+                self._thread.start()
+            self._condition.notify_all()
+            return watched.future
+
+    def unwatch(self, job):
+        # type: ('AcQuantumJob') -> None
+        """
+        Undoes one watch of a job. Once no watch is left, the job is removed from the set of outstanding jobs and
+        its future is cancelled, so a waiter giving up does not cancel the future of the other waiters.
+
+        :param job: the watched job
+        """
+        with self._condition:
+            watched = self._watched.get(id(job))
+            if watched is None:
+                return
+            watched.watchers -= 1
+            if watched.watchers > 0:
+                return
+            del self._watched[id(job)]
+        watched.future.cancel()
+
+    def jobs(self):
+        # type: () -> List['AcQuantumJob']
+        """
+        :return: the outstanding jobs
+        """
+        with self._condition:
+            return [watched.job for watched in self._watched.values()]
+
+    def _run(self):
+        # type: () -> None
+        while True:
+            with self._condition:
+                if not self._watched:
+                    self._thread = None
+                    if self._executor is not None:
+                        self._executor.shutdown(wait=False)
+                        self._executor = None
+                    return
+                now = time.monotonic()
+                due = [w for w in self._watched.values() if w.next_poll <= now]
+                if not due:
+                    self._condition.wait(min(w.next_poll for w in self._watched.values()) - now)
+                    continue
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers)
+                executor = self._executor
+
+            outcomes = list(executor.map(self._poll, due))
+
+            with self._condition:
+                now = time.monotonic()
+                for watched, (status, error) in zip(due, outcomes):
+                    if self._watched.get(id(watched.job)) is not watched:
+                        continue
+                    if error is None and status not in JOB_FINAL_STATES:
+                        watched.next_poll = now + watched.polling_strategy.interval(watched.attempt,
+                                                                                    watched.job._queue_position)
+                        watched.attempt += 1
+                        continue
+                    del self._watched[id(watched.job)]
+                    if watched.future.cancelled():
+                        continue
+                    if error is not None:
+                        watched.future.set_exception(error)
+                    else:
+                        watched.future.set_result(status)
+
+    @classmethod
+    def _poll(cls, watched):
+        # type: (_WatchedJob) -> tuple
+        try:
+            return watched.job.status(), None
+        except Exception as ex:
+            # delivered to the waiting thread through the future
+            return None, ex
@@ -14,7 +14,7 @@
 
 import warnings
 from collections import OrderedDict
-from typing import Optional, List
+from typing import Any, Callable, Optional, List
 
 from qiskit.providers import BaseProvider
 
@@ -22,14 +22,27 @@ from acquantumconnector.credentials.credentials import AcQuantumCredentials
 from .acquantumbackend import AcQuantumBackend
 from .acquantumerrors import AcQuantumAccountError, AcQuantumBackendError
 from .acquantumsingleprovider import AcQuantumSingleProvider
+from .configcache import AcQuantumConfigurationCache
+from .connectorpool import DEFAULT_POOL_SIZE
 from .credentials import discover_credentials
 
 
 class AcQuantumProvider(BaseProvider):
 
-    def __init__(self):
+    def __init__(self, connector_factory=None, pool_size=DEFAULT_POOL_SIZE, config_cache=None):
+        # type: (Optional[Callable[[], Any]], int, Optional[AcQuantumConfigurationCache]) -> None
+        """
+        :param connector_factory: creates the connectors of every account, defaults to an ``AcQuantumConnector``.
+            E.g. returning one ``AcQuantumLocalConnector`` runs every account offline.
+        :param pool_size: the maximal number of sessions of an account used at the same time
+        :param config_cache: optional on-disk cache of the backend configurations and the calibration, e.g.
+            ``AcQuantumConfigurationCache()`` shared by all processes of the host
+        """
         super().__init__()
 
+        self._connector_factory = connector_factory
+        self._pool_size = pool_size
+        self._config_cache = config_cache
         self._accounts = OrderedDict()
 
     def backends(self, name=None, **kwargs):
@@ -52,33 +65,41 @@ class AcQuantumProvider(BaseProvider):
             raise AcQuantumBackendError('zero backends found')
         return backends
 
-    def enable_account(self, credentials=None, user=None, password=None):
-        # type: (AcQuantumProvider, AcQuantumCredentials, Optional[str], Optional[str]) -> None
+    def enable_account(self, credentials=None, user=None, password=None, warm=False):
+        # type: (AcQuantumProvider, AcQuantumCredentials, Optional[str], Optional[str], bool) -> None
         """
         Establishes a user/password connection to the API of the alibaba's quantum computing interface.
         If a `AcQuantumCredentials` is given it will be used with precedence. Else you can provide a user/password.
         If no arguments are passed, the environment variables ACQ_USER and ACQ_PWD are used, if they exist.
 
+        The account is authenticated and its backends are discovered on the first call of ``backends()``.
+
         :param credentials: optional. if given it has precedence
         :param user: optional, if given the argument password must also be given
         :param password: optional, if given the argument user must also be given
+        :param warm: whether to discover the backends right away in a background thread
         """
         if credentials is not None:
-            self._append_account(credentials)
+            single_provider = self._append_account(credentials)
         elif user is not None and password is not None:
-            self._append_account(AcQuantumCredentials(user, password))
+            single_provider = self._append_account(AcQuantumCredentials(user, password))
         else:
-            self._append_account(discover_credentials())
+            single_provider = self._append_account(discover_credentials())
 
         if not self._accounts:
             raise AcQuantumAccountError('No AcQuantum credentials found.')
+        if warm:
+            single_provider.warm()
 
-    def _append_account(self, credentials: AcQuantumCredentials):
+    def _append_account(self, credentials):
+        # type: (AcQuantumCredentials) -> AcQuantumSingleProvider
         if credentials.user_name in self._accounts.keys():
             warnings.warn('Credentials are already in use.')
 
-        single_provider = AcQuantumSingleProvider(credentials, self)
+        single_provider = AcQuantumSingleProvider(credentials, self, connector_factory=self._connector_factory,
+                                                  pool_size=self._pool_size, config_cache=self._config_cache)
         self._accounts[credentials.user_name] = single_provider
+        return single_provider
 
     @staticmethod
     def _aliased_backend_names(self):
@@ -12,28 +12,54 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
+import threading
 from collections import OrderedDict, _OrderedDictItemsView
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
 
-from acquantumconnector.connector.acquantumconnector import AcQuantumConnector
 from acquantumconnector.credentials.credentials import AcQuantumCredentials
-from jsonschema import ValidationError
 from qiskit.providers import BaseProvider
 
 from .acquantumbackend import AcQuantumBackend
-from .backendconfiguration import AcQuantumBackendConfiguration
+from .configcache import AcQuantumConfigurationCache
+from .connectorpool import AcQuantumConnectorPool, DEFAULT_POOL_SIZE
 
 
 class AcQuantumSingleProvider(BaseProvider):
+    """
+        The backends of one account. The backends are discovered on the first call of ``backends()``, or in the
+        background by ``warm()``. The account is authenticated on its first request, so discovering the backends
+        from a configuration cache does not log in.
+    """
 
-    def __init__(self, credentials, provider):
-        # type: (AcQuantumCredentials, 'AcQuantumProvider') -> None
+    def __init__(self,
+                 credentials,  # type: AcQuantumCredentials
+                 provider,  # type: 'AcQuantumProvider'
+                 connector_factory=None,  # type: Optional[Callable[[], Any]]
+                 pool_size=DEFAULT_POOL_SIZE,  # type: int
+                 config_cache=None  # type: Optional[AcQuantumConfigurationCache]
+                 ):
+        # type: (...) -> None
+        """
+        :param credentials: the credentials of the account
+        :param provider: the provider the backends belong to
+        :param connector_factory: creates the connectors, defaults to an ``AcQuantumConnector``
+        :param pool_size: the maximal number of sessions of the account used at the same time
+        :param config_cache: optional on-disk cache of the backend configurations and the calibration, the
+            entries of the account are shared with the backends
+        """
         super().__init__()
 
         self._ac_provider = provider
         self.credentials = credentials  # type: AcQuantumCredentials
-        self._api = self._authenticate(self.credentials)  # type: AcQuantumConnector
-
-        self._backends = self._discover_remote_backends()
+        self._connector_factory = connector_factory
+        self._pool_size = pool_size
+        self._config_cache = None  # type: Optional[AcQuantumConfigurationCache]
+        if config_cache is not None:
+            self._config_cache = config_cache.for_account(credentials.user_name)
+        self._api = None  # type: Optional[AcQuantumConnectorPool]
+        self._backends = None  # type: Optional[OrderedDict[str, AcQuantumBackend]]
+        self._discovery_lock = threading.Lock()
 
     def backends(self, name=None, **kwargs):
         # type: (str, dict) -> _OrderedDictItemsView
@@ -42,18 +68,63 @@ class AcQuantumSingleProvider(BaseProvider):
         :param kwargs:
         :return:
         """
-        backends = self._backends.items()
+        backends = self._discovered_backends().items()
         if name:
             backends = [b for n, b in backends if n == name]
 
         return backends
 
+    def warm(self):
+        # type: () -> Future
+        """
+        Authenticates the account and discovers its backends in a background thread, unless done already.
+
+        :return: future resolving when the backends are discovered, it holds the exception if discovery failed
+        """
+        future = Future()  # type: Future
+
+        def discover():
+            try:
+                future.set_result(self._discovered_backends())
+            except BaseException as ex:
+                future.set_exception(ex)
+
+        threading.Thread(target=discover, name='AcQuantumSingleProvider.warm', daemon=True).start()
+        return future
+
+    def is_discovered(self):
+        # type: () -> bool
+        """
+        :return: whether the backends of the account are discovered
+        """
+        return self._backends is not None
+
+    def _discovered_backends(self):
+        # type: () -> OrderedDict[str, AcQuantumBackend]
+        """
+        :return: the backends, discovered on first use. A failed discovery is tried again.
+        """
+        with self._discovery_lock:
+            if self._backends is None:
+                if self._api is None:
+                    self._api = self._connector_pool(self.credentials, self._connector_factory, self._pool_size)
+                self._backends = self._discover_remote_backends()
+            return self._backends
+
     def _discover_remote_backends(self):
         # type: () -> OrderedDict[str, AcQuantumBackend]
+        from jsonschema import ValidationError
+        from .backendconfiguration import AcQuantumBackendConfiguration
 
         ret = OrderedDict()
-        configs_list = self._api.available_backends()
+        configs_list = None
+        if self._config_cache is not None:
+            configs_list = self._config_cache.backend_configurations()
+        cached = configs_list is not None
+        if not cached:
+            configs_list = self._api.available_backends()
 
+        valid_configs = []
         for raw_config in configs_list:
             try:
                 config = AcQuantumBackendConfiguration.from_dict(raw_config)
@@ -61,18 +132,22 @@ class AcQuantumSingleProvider(BaseProvider):
                     configuration=config,
                     provider=self._ac_provider,
                     credentials=self.credentials,
-                    api=self._api)
+                    api=self._api,
+                    config_cache=self._config_cache)
+                valid_configs.append(raw_config)
             except ValidationError as ex:
                 print(
                     'Remote backend {} could not be instantiated due to an invalid config: {}'.format(
                         raw_config.get('backend_name', raw_config.get('name', 'unknown')), ex)
                 )
 
+        if self._config_cache is not None and not cached:
+            # only the valid configurations are cached, so invalid ones are not reported again
+            self._config_cache.put_backend_configurations(valid_configs)
         return ret
 
     @classmethod
-    def _authenticate(cls, credentials):
-        # type: (AcQuantumCredentials) -> AcQuantumConnector
-        connector = AcQuantumConnector()
-        connector.create_session(credentials)
-        return connector
+    def _connector_pool(cls, credentials, connector_factory=None, pool_size=DEFAULT_POOL_SIZE):
+        # type: (AcQuantumCredentials, Optional[Callable[[], Any]], int) -> AcQuantumConnectorPool
+        # the pool logs in on the first request, which a cached discovery does not make
+        return AcQuantumConnectorPool(credentials, pool_size, connector_factory, lazy=True)
@@ -0,0 +1,208 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from typing import Callable, List, Optional
+
+from acquantumconnector.model.config import AcQuantumRawConfig
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.acquantum_qiskit', 'configurations')
+DEFAULT_TTL = 10 * 60
+
+_BACKENDS_ENTRY = 'backends'
+_CALIBRATION_ENTRY = 'calibration'
+
+
+class AcQuantumConfigurationCache(object):
+    """
+        Stores the configurations of the backends and the calibration of the device on local disk for ``ttl``
+        seconds, so cold starts and repeated ``status()`` calls do not ask Alibaba Computing Quantum again.
+
+        The entries are JSON files, written atomically, so the cache can be shared by all processes on a host.
+        Accounts may see different backends, so the entries of a cache bound to an account with ``for_account``
+        are kept apart from the entries of any other account.
+        When a newly fetched calibration reports another ``last_calibration_time`` than the cached one, the cached
+        backend configurations are dropped as well.
+    """
+
+    def __init__(self, directory=None, ttl=DEFAULT_TTL, clock=time.time, account=None):
+        # type: (str, float, Callable[[], float], Optional[str]) -> None
+        """
+        :param directory: directory of the cache files, defaults to ``~/.acquantum_qiskit/configurations``
+        :param ttl: seconds an entry is served after it was stored
+        :param clock: returns the current time in seconds since the epoch, shared by all processes
+        :param account: the user name of the account the entries belong to, None for entries without account
+        """
+        self.directory = directory or DEFAULT_CACHE_DIRECTORY
+        self.ttl = ttl
+        self.account = account
+        self._clock = clock
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def for_account(self, account):
+        # type: (str) -> AcQuantumConfigurationCache
+        """
+        :param account: the user name of the account
+        :return: the cache of the entries of the account, in the same directory and with the same ttl
+        """
+        return AcQuantumConfigurationCache(self.directory, self.ttl, self._clock, account)
+
+    def backend_configurations(self):
+        # type: () -> Optional[List[dict]]
+        """
+        :return: the cached raw configurations of the backends or None if there are none or they expired
+        """
+        return self._get(_BACKENDS_ENTRY)
+
+    def put_backend_configurations(self, configs_list):
+        # type: (List[dict]) -> None
+        """
+        :param configs_list: the raw configurations of the backends as returned by ``available_backends()``
+        """
+        self._put(_BACKENDS_ENTRY, configs_list)
+
+    def calibration(self):
+        # type: () -> Optional[AcQuantumRawConfig]
+        """
+        :return: the cached configuration of the device or None if there is none or it expired
+        """
+        values = self._get(_CALIBRATION_ENTRY)
+        if values is None:
+            return None
+        return AcQuantumRawConfig.from_json(values)
+
+    def put_calibration(self, raw_config):
+        # type: (AcQuantumRawConfig) -> None
+        """
+        Stores the configuration of the device. If it was calibrated since the cached one, the cached backend
+        configurations are invalidated.
+
+        :param raw_config: the configuration of the device as returned by ``get_backend_config()``
+        """
+        calibration_time = raw_config.system_status.config_value.last_calibration_time
+        with self._lock:
+            previous_time = self.last_calibration_time()
+            self._put(_CALIBRATION_ENTRY, raw_config_to_json(raw_config))
+            if previous_time is not None and previous_time != calibration_time:
+                self.remove(_BACKENDS_ENTRY)
+
+    def last_calibration_time(self):
+        # type: () -> Optional[str]
+        """
+        :return: the calibration time of the cached configuration of the device, even if it expired
+        """
+        entry = self._load(_CALIBRATION_ENTRY)
+        if entry is None:
+            return None
+        return _last_calibration_time(entry['value'])
+
+    def remove(self, name):
+        # type: (str) -> None
+        """
+        :param name: the name of the entry, ``backends`` or ``calibration``
+        """
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        # type: () -> None
+        for name in (_BACKENDS_ENTRY, _CALIBRATION_ENTRY):
+            self.remove(name)
+
+    def _get(self, name):
+        # type: (str) -> Optional[list]
+        entry = self._load(name)
+        if entry is None or self._clock() - entry['stored_at'] > self.ttl:
+            return None
+        return entry['value']
+
+    def _load(self, name):
+        # type: (str) -> Optional[dict]
+        try:
+            with open(self._path(name), 'r') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not isinstance(entry, dict) or 'stored_at' not in entry or 'value' not in entry:
+            return None
+        return entry
+
+    def _put(self, name, value):
+        # type: (str, list) -> None
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump({'stored_at': self._clock(), 'value': value}, f)
+            os.replace(tmp_path, self._path(name))
+        except (OSError, TypeError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _path(self, name):
+        # type: (str) -> str
+        if self.account is None:
+            return os.path.join(self.directory, '{}.json'.format(name))
+        # user names are hashed, they may contain characters which are not allowed in file names
+        account_hash = hashlib.sha256(self.account.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.directory, '{}-{}.json'.format(account_hash, name))
+
+
+def raw_config_to_json(raw_config):
+    # type: (AcQuantumRawConfig) -> List[dict]
+    """
+    The inverse of ``AcQuantumRawConfig.from_json``.
+
+    :param raw_config: the configuration of the device
+    :return: the list of raw configuration items the configuration is built from
+    """
+    def item(config, config_value):
+        return {'computerId': config.computer_id, 'configKey': config.config_key, 'configValue': config_value}
+
+    system_config = raw_config.system_config.config_value
+    system_status = raw_config.system_status.config_value
+    return [
+        item(raw_config.system_config, json.dumps({
+            'oneQGates': system_config.one_q_gates,
+            'oneQGatesLabel': system_config.one_q_gates_label,
+            'twoQGates': system_config.two_q_gates,
+            'twoQGatesLabel': system_config.two_q_gates_label,
+            'measureSizeUpperLimit': system_config.measure_size_upper_limit
+        })),
+        item(raw_config.one_q_gate_fidelities, json.dumps(raw_config.one_q_gate_fidelities.config_value)),
+        item(raw_config.qubit_parameter, raw_config.qubit_parameter.config_value),
+        item(raw_config.system_status, json.dumps({
+            'status': system_status.status,
+            'fridgeTemperature': system_status.fridge_temperature,
+            'lastCalibrationTime': system_status.last_calibration_time
+        })),
+        item(raw_config.two_q_gate_fidelity, json.dumps(raw_config.two_q_gate_fidelity.config_value))
+    ]
+
+
+def _last_calibration_time(values):
+    # type: (List[dict]) -> Optional[str]
+    try:
+        return json.loads(values[3]['configValue'])['lastCalibrationTime']
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
@@ -0,0 +1,153 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""A pool of authenticated connectors of one account.
+
+A connector holds one session to Alibaba Computing Quantum and is not meant to be used by more than one thread at
+a time. The pool keeps up to ``size`` authenticated connectors and lends one to every request, so that the
+backends and jobs of an account submit and poll in parallel. Idle connectors are reused most recently returned
+first, which keeps their HTTP connections alive.
+"""
+
+import contextlib
+import threading
+from typing import Any, Callable, Iterator, List, Optional
+
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+from acquantumconnector.model.errors import AcQuantumRequestError, AcQuantumRequestForbiddenError
+
+# Number of sessions of one account
+DEFAULT_POOL_SIZE = 4
+
+
+class AcQuantumConnectorPool(object):
+    """
+        Lends authenticated connectors of one account to requests.
+
+        The pool can be used in place of a connector: calling any connector method on the pool borrows a
+        connector for the duration of the call. A connector whose session was rejected (403) is dropped, the next
+        request authenticates a new one.
+    """
+
+    def __init__(self, credentials, size=DEFAULT_POOL_SIZE, connector_factory=None, timeout=None, lazy=False):
+        # type: (AcQuantumCredentials, int, Optional[Callable[[], Any]], Optional[float], bool) -> None
+        """
+        Authenticates the first connector right away, so that invalid credentials fail early, unless ``lazy``.
+
+        :param credentials: the credentials of the account
+        :param size: the maximal number of connectors
+        :param connector_factory: creates an unauthenticated connector, defaults to an ``AcQuantumConnector``.
+            A thread safe connector, e.g. an ``AcQuantumLocalConnector``, can be shared by returning the same
+            instance every time.
+        :param timeout: seconds to wait for a connector if all are in use, None to wait forever
+        :param lazy: whether to authenticate the first connector on the first request instead
+        :raises: ValueError: if the size is smaller than 1
+        """
+        if size < 1:
+            raise ValueError('The pool needs at least one (1) connector')
+        self._credentials = credentials
+        self._size = size
+        self._connector_factory = connector_factory or _default_connector
+        self._timeout = timeout
+        self._idle = []  # type: List[Any]
+        self._created = 0
+        self._condition = threading.Condition()
+
+        if not lazy:
+            self.release(self.borrow())
+
+    def size(self):
+        # type: () -> int
+        """
+        :return: the maximal number of connectors
+        """
+        return self._size
+
+    def created(self):
+        # type: () -> int
+        """
+        :return: the number of authenticated connectors, idle or in use
+        """
+        with self._condition:
+            return self._created
+
+    def borrow(self):
+        # type: () -> Any
+        """
+        :return: an idle connector, or a newly authenticated one if all are in use and the pool is not full
+        :raises: AcQuantumRequestError: if no connector became available within the timeout
+        """
+        with self._condition:
+            while not self._idle and self._created >= self._size:
+                if not self._condition.wait(self._timeout):
+                    raise AcQuantumRequestError('All {} connectors are in use'.format(self._size))
+            if self._idle:
+                return self._idle.pop()
+            self._created += 1
+
+        try:
+            connector = self._connector_factory()
+            connector.create_session(self._credentials)
+            return connector
+        except BaseException:
+            self.release(None, discard=True)
+            raise
+
+    def release(self, connector, discard=False):
+        # type: (Any, bool) -> None
+        """
+        :param connector: a borrowed connector
+        :param discard: whether to drop the connector instead of reusing it
+        """
+        with self._condition:
+            if discard:
+                self._created -= 1
+            else:
+                self._idle.append(connector)
+            self._condition.notify()
+
+    @contextlib.contextmanager
+    def connection(self):
+        # type: () -> Iterator[Any]
+        """
+        Borrows a connector for the duration of the ``with`` block.
+        """
+        connector = self.borrow()
+        discard = False
+        try:
+            yield connector
+        except AcQuantumRequestForbiddenError:
+            discard = True
+            raise
+        finally:
+            self.release(connector, discard=discard)
+
+    def __getattr__(self, name):
+        # type: (str) -> Callable[..., Any]
+        if name.startswith('_'):
+            raise AttributeError(name)
+
+        def request(*args, **kwargs):
+            with self.connection() as connector:
+                return getattr(connector, name)(*args, **kwargs)
+
+        request.__name__ = name
+        return request
+
+
+def _default_connector():
+    # type: () -> Any
+    # the connector pulls in requests, so it is imported when the first pool is created
+    from acquantumconnector.connector.acquantumconnector import AcQuantumConnector
+    return AcQuantumConnector()
@@ -0,0 +1,137 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# Wider values do not fit into 64 bit integers and are kept as python integers
+_MAX_INT_BITS = 62
+
+
+class AcQuantumCounts(object):
+    """
+        The measured values of an experiment and their probabilities as arrays.
+
+        Bit ``i`` of a value is the outcome of qubit ``i``. Compared to the hex keyed counts dictionary of
+        ``qiskit.Result`` an outcome takes two array entries instead of a dictionary item and two strings.
+
+        Attributes:
+            values (numpy.ndarray): the measured values, each one once
+            probabilities (numpy.ndarray): the probability of every value
+            shots (int): the number of shots of the experiment
+    """
+
+    def __init__(self, values, probabilities, shots):
+        # type: (np.ndarray, np.ndarray, int) -> None
+        self.values = values
+        self.probabilities = probabilities
+        self.shots = shots
+
+    @classmethod
+    def from_data(cls, data, shots, qubit_layout=None):
+        # type: (Dict[str, float], int, Optional[List[int]]) -> AcQuantumCounts
+        """
+        :param data: the probabilities by bit string as returned by Alibaba Computing Quantum
+        :param shots: the number of shots of the experiment
+        :param qubit_layout: the original qubits of a compacted experiment
+        :return: the counts
+        """
+        values = _parse_bit_strings(list(data.keys()))
+        probabilities = np.fromiter(data.values(), dtype=np.float64, count=len(data))
+        if qubit_layout is not None:
+            values = _expand_values(values, qubit_layout)
+        return cls(values, probabilities, shots)
+
+    @classmethod
+    def from_counts(cls, counts, shots):
+        # type: (Dict[str, int], int) -> AcQuantumCounts
+        """
+        :param counts: the counts by hex value, as in ``qiskit.Result``
+        :param shots: the number of shots of the experiment
+        :return: the counts
+        """
+        values = [int(key, 16) for key in counts.keys()]
+        dtype = np.int64 if max(values, default=0).bit_length() <= _MAX_INT_BITS else object
+        probabilities = np.fromiter(counts.values(), dtype=np.float64, count=len(counts)) / max(shots, 1)
+        return cls(np.array(values, dtype=dtype), probabilities, shots)
+
+    def counts(self):
+        # type: () -> np.ndarray
+        """
+        :return: the number of shots of every value, rounded down
+        """
+        return (self.probabilities * self.shots).astype(np.int64)
+
+    def to_dict(self):
+        # type: () -> Dict[str, int]
+        """
+        :return: the counts by hex value, as in ``qiskit.Result``
+        """
+        return dict(zip(map(hex, self.values.tolist()), self.counts().tolist()))
+
+    def marginal(self, qubits):
+        # type: (Sequence[int]) -> AcQuantumCounts
+        """
+        :param qubits: the qubits to keep, qubit ``qubits[i]`` becomes bit ``i`` of the marginal values
+        :return: the counts of the outcomes of the given qubits
+        """
+        values = np.zeros(len(self.values), dtype=self.values.dtype)
+        for i, qubit in enumerate(qubits):
+            values |= ((self.values >> qubit) & 1) << i
+        unique_values, inverse = np.unique(values, return_inverse=True)
+        probabilities = np.bincount(inverse.ravel(), weights=self.probabilities, minlength=len(unique_values))
+        return AcQuantumCounts(unique_values, probabilities, self.shots)
+
+    def top_k(self, k):
+        # type: (int) -> List[Tuple[int, float]]
+        """
+        :param k: the number of outcomes
+        :return: the ``k`` most probable values and their probabilities, most probable first
+        """
+        k = min(k, len(self.values))
+        if k <= 0:
+            return []
+        indices = np.argpartition(-self.probabilities, k - 1)[:k]
+        indices = indices[np.argsort(-self.probabilities[indices], kind='stable')]
+        return list(zip(self.values[indices].tolist(), self.probabilities[indices].tolist()))
+
+    def __len__(self):
+        return len(self.values)
+
+    def __repr__(self):
+        return 'AcQuantumCounts: {{ outcomes: {}, shots: {} }}'.format(len(self), self.shots)
+
+
+def _parse_bit_strings(keys):
+    # type: (List[str]) -> np.ndarray
+    if not keys:
+        return np.zeros(0, dtype=np.int64)
+    width = len(keys[0])
+    if width > _MAX_INT_BITS or any(len(key) != width for key in keys):
+        return np.array([int(key, 2) for key in keys], dtype=object)
+    bits = np.frombuffer(''.join(keys).encode('ascii'), dtype=np.uint8).reshape(len(keys), width) - ord('0')
+    weights = np.left_shift(1, np.arange(width - 1, -1, -1, dtype=np.int64))
+    return bits.astype(np.int64).dot(weights)
+
+
+def _expand_values(values, qubit_layout):
+    # type: (np.ndarray, List[int]) -> np.ndarray
+    if values.dtype != object and max(qubit_layout, default=0) >= _MAX_INT_BITS:
+        values = values.astype(object)
+    expanded = np.zeros(len(values), dtype=values.dtype)
+    for i, qubit in enumerate(qubit_layout):
+        expanded |= ((values >> i) & 1) << qubit
+    return expanded
@@ -0,0 +1,135 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""The code of remote experiments.
+
+Every remote experiment stores a code string alongside its gates from which the result of the experiment
+is reconstructed. The formats are
+
+* ``CODE_FORMAT_COMPACT``: JSON with the qobj id, the experiment name, the experiment header and the qubit layout
+* ``CODE_FORMAT_COMPRESSED``: the compact JSON compressed with zlib, base64 encoded
+* ``CODE_FORMAT_QOBJ``: the JSON of the complete qobj, as stored by former versions
+"""
+
+import base64
+import json
+import zlib
+from typing import Any, Dict, List, Optional, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from qiskit.qobj import Qobj
+
+CODE_FORMAT_COMPACT = 'compact'
+CODE_FORMAT_COMPRESSED = 'compressed'
+CODE_FORMAT_QOBJ = 'qobj'
+DEFAULT_CODE_FORMAT = CODE_FORMAT_COMPACT
+
+# Marks the code formats written by this module, codes without it are complete qobjs
+_FORMAT_KEY = 'acquantum_code'
+_COMPACT_VERSION = 'compact-1'
+_COMPRESSED_VERSION = 'zlib-1'
+
+
+class AcQuantumExperimentMetadata(object):
+    """
+        What is needed to build the result of an experiment.
+
+        Attributes:
+            qobj_id (str): the id of the qobj the experiment was submitted with
+            name (str): the name of the experiment
+            header (dict): the header of the qobj experiment
+            qubit_layout (list[int]): the original qubits of a compacted experiment, None if it is not compacted
+    """
+
+    def __init__(self, qobj_id, name, header, qubit_layout=None):
+        # type: (str, str, Dict[str, Any], Optional[List[int]]) -> None
+        self.qobj_id = qobj_id
+        self.name = name
+        self.header = header
+        self.qubit_layout = qubit_layout
+
+    @classmethod
+    def from_qobj(cls, qobj, qubit_layout=None):
+        # type: (Qobj, Optional[List[int]]) -> AcQuantumExperimentMetadata
+        """
+        :param qobj: a qobj with exactly one (1) experiment
+        :param qubit_layout: the original qubits of a compacted experiment
+        :return: the metadata of the experiment
+        """
+        experiment = qobj.experiments[0]
+        if qubit_layout is None:
+            qubit_layout = getattr(getattr(experiment, 'config', None), 'qubit_layout', None)
+        return cls(qobj.qobj_id, experiment.header.name, experiment.header.as_dict(), qubit_layout)
+
+    def to_dict(self):
+        # type: () -> Dict[str, Any]
+        return {
+            'qobj_id': self.qobj_id,
+            'name': self.name,
+            'header': self.header,
+            'qubit_layout': self.qubit_layout
+        }
+
+    @classmethod
+    def from_dict(cls, values):
+        # type: (Dict[str, Any]) -> AcQuantumExperimentMetadata
+        return cls(values['qobj_id'], values['name'], values['header'], values.get('qubit_layout'))
+
+    def __eq__(self, other):
+        return isinstance(other, AcQuantumExperimentMetadata) and self.to_dict() == other.to_dict()
+
+    def __repr__(self):
+        return 'AcQuantumExperimentMetadata: {}'.format(self.to_dict())
+
+
+def encode_experiment_code(qobj, qubit_layout=None, code_format=DEFAULT_CODE_FORMAT):
+    # type: (Qobj, Optional[List[int]], str) -> str
+    """
+    :param qobj: a qobj with exactly one (1) experiment
+    :param qubit_layout: the original qubits of a compacted experiment
+    :param code_format: the format of the code
+    :return: the code of the experiment
+    :raises: ValueError: if the format is unknown
+    """
+    if code_format == CODE_FORMAT_QOBJ:
+        code = qobj.as_dict()
+        if qubit_layout is not None:
+            code['experiments'][0].setdefault('config', {})['qubit_layout'] = qubit_layout
+        return json.dumps(code)
+
+    metadata = AcQuantumExperimentMetadata.from_qobj(qobj, qubit_layout)
+    compact = json.dumps(dict(metadata.to_dict(), **{_FORMAT_KEY: _COMPACT_VERSION}), separators=(',', ':'))
+    if code_format == CODE_FORMAT_COMPACT:
+        return compact
+    if code_format == CODE_FORMAT_COMPRESSED:
+        data = base64.b64encode(zlib.compress(compact.encode('utf-8'))).decode('ascii')
+        return json.dumps({_FORMAT_KEY: _COMPRESSED_VERSION, 'data': data}, separators=(',', ':'))
+    raise ValueError('Unknown code format {}'.format(code_format))
+
+
+def decode_experiment_code(code):
+    # type: (str) -> AcQuantumExperimentMetadata
+    """
+    :param code: the code of an experiment in any of the formats
+    :return: the metadata of the experiment
+    """
+    values = json.loads(code)
+    version = values.get(_FORMAT_KEY)
+    if version == _COMPRESSED_VERSION:
+        values = json.loads(zlib.decompress(base64.b64decode(values['data'])).decode('utf-8'))
+        version = values.get(_FORMAT_KEY)
+    if version == _COMPACT_VERSION:
+        return AcQuantumExperimentMetadata.from_dict(values)
+    from qiskit.qobj import Qobj
+    return AcQuantumExperimentMetadata.from_qobj(Qobj.from_dict(values))
@@ -0,0 +1,136 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""Peephole optimization of translated AcQuantum operations.
+
+The translation of single qiskit instructions leaves redundant gates behind, e.g. the H-CPhase-H
+decomposition of two CNOTs on the same target uploads an H-H pair. The optimization levels are
+
+* 0: no optimization
+* 1: cancel adjacent inverse gates and drop rotations by a zero angle
+* 2: additionally merge adjacent rotations around the same axis, the merged angle is taken modulo 360
+
+Two operations are adjacent if no other operation acts on any of their qubits in between. Barriers keep the
+operations on their qubits apart and are dropped from the optimized operations.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import acquantumconnector.model.gates as ac_gates
+
+from .gatetranslator import AcQuantumBarrier, AcQuantumOperation, normalize_angle
+
+NO_OPTIMIZATION = 0
+CANCEL_INVERSES = 1
+MERGE_ROTATIONS = 2
+DEFAULT_OPTIMIZATION_LEVEL = CANCEL_INVERSES
+
+_SELF_INVERSE = (ac_gates.HGate, ac_gates.XGate, ac_gates.YGate, ac_gates.ZGate, ac_gates.CPhase, ac_gates.CCPhase)
+_INVERSES = {
+    ac_gates.SGate: ac_gates.SDag,
+    ac_gates.SDag: ac_gates.SGate,
+    ac_gates.TGate: ac_gates.TDag,
+    ac_gates.TDag: ac_gates.TGate,
+}
+_ROTATIONS = (ac_gates.RxGate, ac_gates.RyGate, ac_gates.RzGate)
+# Controlled phases are symmetric in their qubits
+_SYMMETRIC = (ac_gates.CPhase, ac_gates.CCPhase)
+
+_ZERO_TOLERANCE = 1e-12
+
+
+def optimize_operations(operations, level=DEFAULT_OPTIMIZATION_LEVEL):
+    # type: (List[AcQuantumOperation], int) -> List[AcQuantumOperation]
+    """
+    :param operations: the operations in the order of the layers of the circuit
+    :param level: the optimization level
+    :return: the optimized operations, the given operations are not modified
+    """
+    if level <= NO_OPTIMIZATION:
+        return [operation for operation in operations if operation.gate is not AcQuantumBarrier]
+
+    optimized = []  # type: List[Optional[AcQuantumOperation]]
+    # indices into ``optimized`` of the remaining operations on every qubit
+    wires = {}  # type: Dict[int, List[int]]
+
+    for operation in operations:
+        if operation.gate is AcQuantumBarrier:
+            # the operations before the barrier are no longer adjacent to any following one
+            for qubit in operation.qubits:
+                wires.pop(qubit, None)
+            continue
+        if operation.gate in _ROTATIONS and _is_zero(operation.params):
+            continue
+
+        previous_index = _previous(operation, optimized, wires)
+        if previous_index is not None:
+            previous = optimized[previous_index]
+            if _are_inverse(previous, operation):
+                _remove(previous_index, optimized, wires)
+                continue
+            if level >= MERGE_ROTATIONS and previous.gate in _ROTATIONS and previous.gate is operation.gate:
+                merged = previous.copy()
+                merged.params = (normalize_angle(previous.params[0] + operation.params[0]),)
+                if _is_zero(merged.params) or _is_zero((merged.params[0] - 360,)):
+                    _remove(previous_index, optimized, wires)
+                else:
+                    optimized[previous_index] = merged
+                continue
+
+        for qubit in operation.qubits:
+            wires.setdefault(qubit, []).append(len(optimized))
+        optimized.append(operation)
+
+    return [operation for operation in optimized if operation is not None]
+
+
+def _previous(operation, optimized, wires):
+    # type: (AcQuantumOperation, List[Optional[AcQuantumOperation]], Dict[int, List[int]]) -> Optional[int]
+    """The index of the operation directly preceding ``operation`` on exactly the same qubits, if there is one."""
+    indices = set(wires[qubit][-1] if wires.get(qubit) else None for qubit in operation.qubits)
+    if len(indices) != 1:
+        return None
+    [index] = indices
+    if index is None or len(optimized[index].qubits) != len(operation.qubits):
+        return None
+    return index
+
+
+def _remove(index, optimized, wires):
+    # type: (int, List[Optional[AcQuantumOperation]], Dict[int, List[int]]) -> None
+    for qubit in optimized[index].qubits:
+        wires[qubit].pop()
+    optimized[index] = None
+
+
+def _are_inverse(first, second):
+    # type: (AcQuantumOperation, AcQuantumOperation) -> bool
+    if first.gate in _SYMMETRIC or second.gate in _SYMMETRIC:
+        same_qubits = sorted(first.qubits) == sorted(second.qubits)
+    else:
+        same_qubits = first.qubits == second.qubits
+    if not same_qubits:
+        return False
+    if first.gate is second.gate and first.gate in _SELF_INVERSE:
+        return True
+    return _INVERSES.get(first.gate) is second.gate
+
+
+def _is_zero(params):
+    # type: (Any) -> bool
+    try:
+        return all(abs(float(param)) < _ZERO_TOLERANCE for param in params)
+    except TypeError:
+        return False
@@ -0,0 +1,385 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+"""Translation of qiskit instructions into the gates of Alibaba Computing Quantum.
+
+Every supported qiskit instruction type is mapped to a translator in a registry. A translator takes the
+instruction and the (zero based) indices of its qubits and returns the AcQuantum operations implementing
+it. Further instruction types can be supported with ``register_gate_translator``::
+
+    def translate_swap(op, qubits):
+        a, b = qubits
+        return translate_cx(None, (a, b)) + translate_cx(None, (b, a)) + translate_cx(None, (a, b))
+
+    register_gate_translator(SwapGate, translate_swap)
+"""
+
+import math
+import threading
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+import acquantumconnector.model.gates as ac_gates
+from acquantumconnector.model.gates import Gate
+
+# A translator maps a qiskit instruction and the indices of its qubits to AcQuantum operations
+Translator = Callable[[Any, Sequence[int]], List['AcQuantumOperation']]
+
+# Registered translators and the translators resolved through the class hierarchy
+_TRANSLATORS = {}  # type: Dict[type, Optional[Translator]]
+_RESOLVED = {}  # type: Dict[type, Optional[Translator]]
+_REGISTRY_LOCK = threading.RLock()
+_defaults_registered = False
+
+# Scheduling policies of the columns of the gates
+SCHEDULE_ASAP = 'asap'
+SCHEDULE_ALAP = 'alap'
+SCHEDULE_LEGACY = 'legacy'
+DEFAULT_SCHEDULING = SCHEDULE_ASAP
+
+
+class AcQuantumBarrier(object):
+    """
+        The gate of the operations translated from qiskit barriers. It is not an AcQuantum gate: operations are not
+        cancelled or merged across it by the optimization, and it is dropped when the gates are placed.
+    """
+
+
+class AcQuantumOperation(object):
+    """
+        An AcQuantum gate before it is placed on the grid of an experiment.
+
+        Attributes:
+            gate (type): the AcQuantum gate class, e.g. ``acquantumconnector.model.gates.HGate``
+            qubits (tuple[int]): zero based indices of the qubits the gate acts on
+            params (tuple[float]): the angles of rotation gates
+            layer (int): the layer of the circuit the operation stems from
+            span (tuple[int]): the qubits of the originating qiskit instruction
+            source (int): the position of the originating instruction in the circuit, None if unknown
+    """
+    __slots__ = ('gate', 'qubits', 'params', 'layer', 'span', 'source')
+
+    def __init__(self, gate, qubits, params=(), layer=0, span=None, source=None):
+        # type: (type, Sequence[int], Sequence[float], int, Sequence[int], Optional[int]) -> None
+        self.gate = gate
+        self.qubits = tuple(qubits)
+        self.params = tuple(params)
+        self.layer = layer
+        self.span = tuple(span) if span is not None else self.qubits
+        self.source = source
+
+    def copy(self):
+        # type: () -> AcQuantumOperation
+        """
+        :return: a shallow copy of the operation
+        """
+        return AcQuantumOperation(self.gate, self.qubits, self.params, self.layer, self.span, self.source)
+
+    def __eq__(self, other):
+        return isinstance(other, AcQuantumOperation) and self.gate is other.gate and self.qubits == other.qubits \
+            and self.params == other.params
+
+    def __repr__(self):
+        return 'AcQuantumOperation: {{ gate: {}, qubits: {}, params: {} }}'.format(
+            self.gate.__name__, self.qubits, self.params)
+
+
+def register_gate_translator(gate_type, translator):
+    # type: (type, Optional[Translator]) -> None
+    """
+    Registers the translator of a qiskit instruction type. Subclasses of ``gate_type`` use the same translator
+    unless they are registered themselves.
+
+    :param gate_type: the qiskit instruction class
+    :param translator: the translator, None to ignore instructions of this type
+    """
+    _register_defaults()
+    with _REGISTRY_LOCK:
+        _TRANSLATORS[gate_type] = translator
+        _RESOLVED.clear()
+
+
+def gate_translator(gate_type):
+    # type: (type) -> Optional[Translator]
+    """
+    :param gate_type: the qiskit instruction class
+    :return: the translator of the class or of its closest registered base class, None if there is none
+    """
+    try:
+        return _RESOLVED[gate_type]
+    except KeyError:
+        pass
+    _register_defaults()
+    with _REGISTRY_LOCK:
+        translator = None
+        for base in gate_type.__mro__:
+            if base in _TRANSLATORS:
+                translator = _TRANSLATORS[base]
+                break
+        _RESOLVED[gate_type] = translator
+    return translator
+
+
+def translate_dag(dag, qubit_labels, positions=None):
+    # type: (Any, List[List[Any]], Optional[Dict[int, int]]) -> List[AcQuantumOperation]
+    """
+    Translates a circuit layer by layer. Instructions without a translator are skipped.
+
+    :param dag: the circuit as ``qiskit.dagcircuit.DAGCircuit``
+    :param qubit_labels: the qubit labels ``[register name, index]`` of the qobj experiment header
+    :param positions: maps the node ids of the instructions in the dag to their position in the circuit, used as
+        source of the operations
+    :return: the operations in the order of the layers of the circuit
+    """
+    qubit_index = dict(((name, index), i) for i, (name, index) in enumerate(qubit_labels))
+    positions = positions or {}
+
+    operations = []  # type: List[AcQuantumOperation]
+    for layer_number, layer in enumerate(dag.layers()):
+        for node_id, node in layer["graph"].get_op_nodes(data=True):
+            op = node["op"]
+            translator = gate_translator(type(op))
+            if translator is None:
+                continue
+            qubits = tuple(qubit_index[(register.name, index)] for register, index in op.qargs)
+            for operation in translator(op, qubits):
+                operation.layer = layer_number
+                operation.span = qubits
+                operation.source = positions.get(node_id)
+                operations.append(operation)
+    return operations
+
+
+def place_operations(operations, scheduling=None):
+    # type: (List[AcQuantumOperation], Optional[str]) -> List[Gate]
+    """
+    Places the operations on the grid of the experiment.
+
+    :param operations: the operations in the order of the layers of the circuit
+    :param scheduling: the scheduling policy of the columns, see ``schedule_operations``
+    :return: the AcQuantum gates
+    """
+    operations = [operation for operation in operations if operation.gate is not AcQuantumBarrier]
+    columns = schedule_operations(operations, scheduling)
+    return [to_gate(operation, x) for operation, x in zip(operations, columns)]
+
+
+def schedule_operations(operations, scheduling=None):
+    # type: (List[AcQuantumOperation], Optional[str]) -> List[int]
+    """
+    Assigns the (one based) column of every operation. The policies are
+
+    * ``SCHEDULE_ASAP``: every operation is placed in the first column after the preceding operations on its qubits
+    * ``SCHEDULE_ALAP``: every operation is placed in the last column before the following operations on its
+      qubits, without making the circuit deeper than ``SCHEDULE_ASAP``
+    * ``SCHEDULE_LEGACY``: every layer of the circuit starts at the column following the last gate of the
+      previous layer and an operation occupies every qubit of its originating instruction
+
+    :param operations: the operations in the order of the layers of the circuit
+    :param scheduling: the policy, defaults to ``DEFAULT_SCHEDULING``
+    :return: the columns of the operations
+    :raises: ValueError: if the policy is unknown
+    """
+    scheduling = scheduling or DEFAULT_SCHEDULING
+    if scheduling == SCHEDULE_ASAP:
+        return _schedule_asap(operations)
+    if scheduling == SCHEDULE_ALAP:
+        return _schedule_alap(operations)
+    if scheduling == SCHEDULE_LEGACY:
+        return _schedule_legacy(operations)
+    raise ValueError('Unknown scheduling policy {}'.format(scheduling))
+
+
+def _schedule_asap(operations):
+    # type: (List[AcQuantumOperation]) -> List[int]
+    next_free = {}  # type: Dict[int, int]
+    columns = []  # type: List[int]
+    for operation in operations:
+        x = max(next_free.get(qubit, 1) for qubit in operation.qubits)
+        for qubit in operation.qubits:
+            next_free[qubit] = x + 1
+        columns.append(x)
+    return columns
+
+
+def _schedule_alap(operations):
+    # type: (List[AcQuantumOperation]) -> List[int]
+    # columns counted from the end of the circuit
+    next_free = {}  # type: Dict[int, int]
+    columns = []  # type: List[int]
+    for operation in reversed(operations):
+        x = max(next_free.get(qubit, 1) for qubit in operation.qubits)
+        for qubit in operation.qubits:
+            next_free[qubit] = x + 1
+        columns.append(x)
+    depth = max(columns, default=0)
+    return [depth + 1 - x for x in reversed(columns)]
+
+
+def _schedule_legacy(operations):
+    # type: (List[AcQuantumOperation]) -> List[int]
+    columns = []  # type: List[int]
+    current_layer_x_number = 1
+    x_numbers = {}  # type: Dict[int, int]
+    layer = None
+    for operation in operations:
+        if operation.layer != layer:
+            if x_numbers:
+                current_layer_x_number = max(x_numbers.values())
+            x_numbers = {}
+            layer = operation.layer
+        for qubit in operation.span:
+            x_numbers.setdefault(qubit, current_layer_x_number)
+        columns.append(x_numbers[operation.qubits[-1]])
+        for qubit in operation.span:
+            x_numbers[qubit] += 1
+    return columns
+
+
+def to_gate(operation, x):
+    # type: (AcQuantumOperation, int) -> Gate
+    """
+    :param operation: the operation
+    :param x: the (one based) column of the gate
+    :return: the AcQuantum gate
+    """
+    if len(operation.qubits) == 1:
+        return operation.gate(x, operation.qubits[0] + 1, *operation.params)
+    return operation.gate(x, [qubit + 1 for qubit in operation.qubits])
+
+
+def normalize_angle(angle):
+    # type: (float) -> float
+    """
+    :param angle: a rotation angle in degrees
+    :return: the equivalent angle in [0, 360), as accepted by the AcQuantum rotation gates
+    """
+    return angle % 360
+
+
+def translate_u1(op, qubits):
+    # type: (Any, Sequence[int]) -> List[AcQuantumOperation]
+    """U1 as Rz rotation."""
+    [theta] = op.param
+    return [AcQuantumOperation(ac_gates.RzGate, qubits, (theta,))]
+
+
+def translate_u2(op, qubits):
+    # type: (Any, Sequence[int]) -> List[AcQuantumOperation]
+    """U2 as Rz-Ry-Rz rotations."""
+    [phi, lam] = op.param
+    # ignore global phase alpha!
+    # alpha = lam/2 + phi/2
+    return [AcQuantumOperation(ac_gates.RzGate, qubits, (lam,)),
+            AcQuantumOperation(ac_gates.RyGate, qubits, (math.pi / 2,)),
+            AcQuantumOperation(ac_gates.RzGate, qubits, (phi,))]
+
+
+def translate_u3(op, qubits):
+    # type: (Any, Sequence[int]) -> List[AcQuantumOperation]
+    """U3 as Rz-Ry-Rz rotations."""
+    [theta, phi, lam] = op.param
+    # ignore global phase alpha!
+    # alpha = lam/2 + phi/2
+    return [AcQuantumOperation(ac_gates.RzGate, qubits, (lam,)),
+            AcQuantumOperation(ac_gates.RyGate, qubits, (theta,)),
+            AcQuantumOperation(ac_gates.RzGate, qubits, (phi,))]
+
+
+def translate_cx(op, qubits):
+    # type: (Any, Sequence[int]) -> List[AcQuantumOperation]
+    """CNOT as H-CPhase-H on the target."""
+    control, target = qubits
+    return [AcQuantumOperation(ac_gates.HGate, (target,)),
+            AcQuantumOperation(ac_gates.CPhase, (control, target)),
+            AcQuantumOperation(ac_gates.HGate, (target,))]
+
+
+def translate_crz(op, qubits):
+    # type: (Any, Sequence[int]) -> List[AcQuantumOperation]
+    """
+    Controlled Rz as Rz(theta/2)-CNOT-Rz(-theta/2)-CNOT on the target.
+
+    Former versions uploaded a single CPhase on the control qubit, which dropped the angle. The rotation by
+    -theta/2 is uploaded as the equivalent angle in [0, 360), as the AcQuantum gates reject negative angles.
+    """
+    [theta] = op.param
+    control, target = qubits
+    return [AcQuantumOperation(ac_gates.RzGate, (target,), (normalize_angle(theta / 2),))] + \
+        translate_cx(op, qubits) + \
+        [AcQuantumOperation(ac_gates.RzGate, (target,), (normalize_angle(-theta / 2),))] + \
+        translate_cx(op, qubits)
+
+
+def translate_ccx(op, qubits):
+    # type: (Any, Sequence[int]) -> List[AcQuantumOperation]
+    """Toffoli as H-CCPhase-H on the target."""
+    target = qubits[2]
+    return [AcQuantumOperation(ac_gates.HGate, (target,)),
+            AcQuantumOperation(ac_gates.CCPhase, qubits),
+            AcQuantumOperation(ac_gates.HGate, (target,))]
+
+
+def _fixed_gate_translator(gate):
+    # type: (type) -> Translator
+    def translate(op, qubits):
+        return [AcQuantumOperation(gate, qubits)]
+
+    return translate
+
+
+def _rotation_translator(gate):
+    # type: (type) -> Translator
+    def translate(op, qubits):
+        [theta] = op.param
+        return [AcQuantumOperation(gate, qubits, (theta,))]
+
+    return translate
+
+
+def _register_defaults():
+    # type: () -> None
+    global _defaults_registered
+    if _defaults_registered:
+        return
+    import qiskit.extensions.standard as standard_gates
+    from qiskit.circuit import Measure
+
+    defaults = {
+        standard_gates.U1Gate: translate_u1,
+        standard_gates.U2Gate: translate_u2,
+        standard_gates.U3Gate: translate_u3,
+        standard_gates.HGate: _fixed_gate_translator(ac_gates.HGate),
+        standard_gates.RXGate: _rotation_translator(ac_gates.RxGate),
+        standard_gates.RYGate: _rotation_translator(ac_gates.RyGate),
+        standard_gates.RZGate: _rotation_translator(ac_gates.RzGate),
+        standard_gates.XGate: _fixed_gate_translator(ac_gates.XGate),
+        standard_gates.YGate: _fixed_gate_translator(ac_gates.YGate),
+        standard_gates.ZGate: _fixed_gate_translator(ac_gates.ZGate),
+        standard_gates.SGate: _fixed_gate_translator(ac_gates.SGate),
+        standard_gates.SdgGate: _fixed_gate_translator(ac_gates.SDag),
+        standard_gates.TGate: _fixed_gate_translator(ac_gates.TGate),
+        standard_gates.TdgGate: _fixed_gate_translator(ac_gates.TDag),
+        standard_gates.CrzGate: translate_crz,
+        standard_gates.CnotGate: translate_cx,
+        standard_gates.ToffoliGate: translate_ccx,
+        Measure: _fixed_gate_translator(ac_gates.Measure),
+        standard_gates.Barrier: _fixed_gate_translator(AcQuantumBarrier),
+    }
+    with _REGISTRY_LOCK:
+        if _defaults_registered:
+            return
+        for gate_type, translator in defaults.items():
+            _TRANSLATORS.setdefault(gate_type, translator)
+        _defaults_registered = True
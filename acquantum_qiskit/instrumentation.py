@@ -0,0 +1,388 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Timing of the stages of jobs and of the requests to Alibaba Computing Quantum.
+
+Listeners attached to the ``AcQuantumInstrumentation`` of a backend receive an ``AcQuantumEvent`` for every timed
+stage of its jobs and for every request to its connector. Without a listener no event is created: a stage costs
+one check of the listeners and a request one more attribute lookup.
+
+The ``AcQuantumStatistics`` listener aggregates the events to request counts, payload sizes and percentile
+latencies per stage and per connector method.
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+# Translation of an experiment into AcQuantum gates, the size is the number of gates
+STAGE_TRANSLATION = 'translation'
+# A request to the connector, the method is the name of the connector method
+STAGE_REQUEST = 'request'
+# From the submission of a job until it is first seen running or finished
+STAGE_QUEUE = 'queue'
+# Waiting for the result of a job, including the status queries
+STAGE_WAIT = 'wait'
+# Building the result dictionary of a job from the responses, the size is the number of outcomes
+STAGE_RESULT = 'result'
+# Validating the result dictionary with ``Result.from_dict``
+STAGE_VALIDATION = 'validation'
+
+DEFAULT_PERCENTILES = (50, 90, 99)
+# Number of the latest latencies of every stage and method the percentiles are computed from
+DEFAULT_MAX_SAMPLES = 10000
+
+
+class AcQuantumEvent(object):
+    """
+        A timed stage or request.
+
+        Attributes:
+            stage (str): the stage, one of the ``STAGE_*`` constants
+            seconds (float): the duration
+            job_id (str): the id of the job, if known
+            method (str): the name of the connector method of a request
+            size (int): the size of the payload, e.g. the number of uploaded gates, if known
+            error (str): the name of the raised exception, None if the stage succeeded
+    """
+
+    __slots__ = ('stage', 'seconds', 'job_id', 'method', 'size', 'error')
+
+    def __init__(self, stage, seconds, job_id=None, method=None, size=None, error=None):
+        # type: (str, float, Optional[str], Optional[str], Optional[int], Optional[str]) -> None
+        self.stage = stage
+        self.seconds = seconds
+        self.job_id = job_id
+        self.method = method
+        self.size = size
+        self.error = error
+
+    def __repr__(self):
+        return 'AcQuantumEvent(stage={}, seconds={}, job_id={}, method={}, size={}, error={})'.format(
+            self.stage, self.seconds, self.job_id, self.method, self.size, self.error)
+
+
+class AcQuantumListener(object):
+    """The interface of the receivers of events. Listeners are called from the thread of the timed stage."""
+
+    def on_event(self, event):
+        # type: (AcQuantumEvent) -> None
+        """
+        :param event: the timed stage or request
+        """
+        raise NotImplementedError()
+
+
+class _Timer(object):
+    """Times a stage and emits its event on exit. The size can be set inside of the stage."""
+
+    __slots__ = ('_instrumentation', '_stage', '_job_id', '_method', '_start', 'size')
+
+    def __init__(self, instrumentation, stage, job_id, method):
+        # type: (AcQuantumInstrumentation, str, Optional[str], Optional[str]) -> None
+        self._instrumentation = instrumentation
+        self._stage = stage
+        self._job_id = job_id
+        self._method = method
+        self._start = None  # type: Optional[float]
+        self.size = None  # type: Optional[int]
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        seconds = time.perf_counter() - self._start
+        self._instrumentation.emit(AcQuantumEvent(self._stage, seconds, self._job_id, self._method, self.size,
+                                                  exc_type.__name__ if exc_type is not None else None))
+        return False
+
+
+class _NullTimer(object):
+    """Stands in for a timer while there is no listener."""
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        return False
+
+    def __setattr__(self, name, value):
+        pass
+
+
+_NULL_TIMER = _NullTimer()
+
+
+class AcQuantumInstrumentation(object):
+    """
+        Dispatches the events of a backend to its listeners.
+    """
+
+    def __init__(self):
+        # replaced as a whole on change, so that emitting needs no lock
+        self._listeners = ()  # type: Tuple[AcQuantumListener, ...]
+        self._lock = threading.Lock()
+
+    def add_listener(self, listener):
+        # type: (AcQuantumListener) -> None
+        """
+        :param listener: the listener to receive all further events
+        """
+        with self._lock:
+            self._listeners = self._listeners + (listener,)
+
+    def remove_listener(self, listener):
+        # type: (AcQuantumListener) -> None
+        """
+        :param listener: the listener to not receive any further events
+        """
+        with self._lock:
+            self._listeners = tuple(other for other in self._listeners if other is not listener)
+
+    def listeners(self):
+        # type: () -> List[AcQuantumListener]
+        """
+        :return: the attached listeners
+        """
+        return list(self._listeners)
+
+    def enabled(self):
+        # type: () -> bool
+        """
+        :return: whether any listener is attached
+        """
+        return bool(self._listeners)
+
+    def stage(self, stage, job_id=None, method=None):
+        # type: (str, Optional[str], Optional[str]) -> Any
+        """
+        Times a stage, use it as a context manager::
+
+            with instrumentation.stage(STAGE_TRANSLATION) as timer:
+                gates = translate()
+                timer.size = len(gates)
+
+        :param stage: the stage, one of the ``STAGE_*`` constants
+        :param job_id: the id of the job, if known
+        :param method: the name of the connector method of a request
+        :return: the timer of the stage, a no-op if no listener is attached
+        """
+        if not self._listeners:
+            return _NULL_TIMER
+        return _Timer(self, stage, job_id, method)
+
+    def emit(self, event):
+        # type: (AcQuantumEvent) -> None
+        """
+        :param event: the event to pass to every listener
+        """
+        for listener in self._listeners:
+            listener.on_event(event)
+
+
+class _DisabledInstrumentation(AcQuantumInstrumentation):
+
+    def add_listener(self, listener):
+        # type: (AcQuantumListener) -> None
+        raise ValueError('Listeners can not be added to the disabled instrumentation')
+
+
+# The instrumentation of code without a backend, it never has a listener
+DISABLED_INSTRUMENTATION = _DisabledInstrumentation()
+
+
+def _sequence_size(value):
+    # type: (Any) -> Optional[int]
+    return len(value) if value is not None else None
+
+
+def _result_size(response):
+    # type: (Any) -> Optional[int]
+    results = response.get_results() if response is not None else None
+    return sum(len(getattr(result, 'data', None) or ()) for result in results) if results else 0
+
+
+# The payload size of a request by connector method, from its arguments and its response
+_PAYLOAD_SIZES = {
+    'update_experiment': lambda args, kwargs, response: _sequence_size(args[1] if len(args) > 1
+                                                                       else kwargs.get('gates')),
+    'get_result': lambda args, kwargs, response: _result_size(response),
+    'get_experiment': lambda args, kwargs, response: _sequence_size(getattr(response, 'code', None)),
+    'get_experiments': lambda args, kwargs, response: _sequence_size(response),
+}  # type: Dict[str, Callable[[Sequence[Any], Dict[str, Any], Any], Optional[int]]]
+
+
+class AcQuantumInstrumentedConnector(object):
+    """
+        Forwards every request to a connector and times it as a ``STAGE_REQUEST`` while a listener is attached.
+
+        The payload size of ``update_experiment`` is the number of gates, of ``get_result`` the number of
+        outcomes, of ``get_experiment`` the length of the code and of ``get_experiments`` the number of experiments.
+    """
+
+    def __init__(self, connector, instrumentation):
+        # type: (Any, AcQuantumInstrumentation) -> None
+        """
+        :param connector: the connector to forward the requests to
+        :param instrumentation: the instrumentation receiving the events
+        """
+        self._connector = connector
+        self._instrumentation = instrumentation
+
+    def connector(self):
+        # type: () -> Any
+        """
+        :return: the wrapped connector
+        """
+        return self._connector
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        attribute = getattr(self._connector, name)
+        if not self._instrumentation.enabled() or not callable(attribute):
+            return attribute
+
+        instrumentation = self._instrumentation
+
+        def request(*args, **kwargs):
+            with instrumentation.stage(STAGE_REQUEST, method=name) as timer:
+                response = attribute(*args, **kwargs)
+                payload_size = _PAYLOAD_SIZES.get(name)
+                if payload_size is not None:
+                    timer.size = payload_size(args, kwargs, response)
+            return response
+
+        return request
+
+
+class _Samples(object):
+
+    def __init__(self, max_samples):
+        # type: (int) -> None
+        self.seconds = deque(maxlen=max_samples)  # type: deque
+        self.count = 0
+        self.total_seconds = 0.0
+        self.errors = 0
+        self.size = 0
+
+
+class AcQuantumStatistics(AcQuantumListener):
+    """
+        Aggregates the events to counts, errors, payload sizes and percentile latencies. Stages are keyed by
+        ``(stage, None)``, requests by ``(STAGE_REQUEST, method)``.
+
+        Counts, errors, sizes and total seconds cover all events. The percentiles are computed from the latest
+        ``max_samples`` latencies of every stage and method, so a long running process keeps a bounded memory.
+    """
+
+    def __init__(self, max_samples=DEFAULT_MAX_SAMPLES):
+        # type: (int) -> None
+        """
+        :param max_samples: the number of the latest latencies kept per stage and method
+        """
+        self._max_samples = max_samples
+        self._samples = {}  # type: Dict[Tuple[str, Optional[str]], _Samples]
+        self._lock = threading.Lock()
+
+    def on_event(self, event):
+        # type: (AcQuantumEvent) -> None
+        with self._lock:
+            samples = self._samples.get((event.stage, event.method))
+            if samples is None:
+                samples = self._samples[(event.stage, event.method)] = _Samples(self._max_samples)
+            samples.seconds.append(event.seconds)
+            samples.count += 1
+            samples.total_seconds += event.seconds
+            if event.error is not None:
+                samples.errors += 1
+            if event.size is not None:
+                samples.size += event.size
+
+    def keys(self):
+        # type: () -> List[Tuple[str, Optional[str]]]
+        """
+        :return: the stages and methods with at least one event
+        """
+        with self._lock:
+            return sorted(self._samples.keys(), key=lambda key: (key[0], key[1] or ''))
+
+    def count(self, stage, method=None):
+        # type: (str, Optional[str]) -> int
+        """
+        :param stage: the stage
+        :param method: the connector method of ``STAGE_REQUEST``
+        :return: the number of events
+        """
+        with self._lock:
+            samples = self._samples.get((stage, method))
+            return samples.count if samples is not None else 0
+
+    def percentiles(self, stage, method=None, percentiles=DEFAULT_PERCENTILES):
+        # type: (str, Optional[str], Sequence[float]) -> Dict[float, float]
+        """
+        :param stage: the stage
+        :param method: the connector method of ``STAGE_REQUEST``
+        :param percentiles: the percentiles to compute, between 0 and 100
+        :return: the latency in seconds by percentile over the latest events, empty if there was no event
+        """
+        import numpy as np
+        with self._lock:
+            samples = self._samples.get((stage, method))
+            seconds = np.array(samples.seconds) if samples is not None else None
+        if seconds is None:
+            return {}
+        return dict(zip(percentiles, np.percentile(seconds, percentiles).tolist()))
+
+    def summary(self, percentiles=DEFAULT_PERCENTILES):
+        # type: (Sequence[float]) -> List[Dict[str, Any]]
+        """
+        :param percentiles: the percentiles to compute, between 0 and 100
+        :return: one row per stage and method with the count, the errors, the total payload size, the total
+            seconds and the percentile latencies as ``p50`` etc.
+        """
+        rows = []
+        for stage, method in self.keys():
+            with self._lock:
+                samples = self._samples[(stage, method)]
+                row = {'stage': stage, 'method': method, 'count': samples.count, 'errors': samples.errors,
+                       'size': samples.size, 'seconds': samples.total_seconds}
+            for percentile, seconds in self.percentiles(stage, method, percentiles).items():
+                row['p{:g}'.format(percentile)] = seconds
+            rows.append(row)
+        return rows
+
+    def report(self, percentiles=DEFAULT_PERCENTILES):
+        # type: (Sequence[float]) -> str
+        """
+        :param percentiles: the percentiles to compute, between 0 and 100
+        :return: the summary as a table with the latencies in milliseconds
+        """
+        columns = ['p{:g}'.format(percentile) for percentile in percentiles]
+        lines = ['{:<12} {:<20} {:>8} {:>8} {:>10} '.format('stage', 'method', 'count', 'errors', 'size') +
+                 ' '.join('{:>10}'.format(column + ' [ms]') for column in columns)]
+        for row in self.summary(percentiles):
+            cells = '{:<12} {:<20} {:>8} {:>8} {:>10} '.format(row['stage'], row['method'] or '', row['count'],
+                                                               row['errors'], row['size'])
+            lines.append(cells + ' '.join('{:>10.3f}'.format(row[column] * 1000) for column in columns))
+        return '\n'.join(lines)
+
+    def reset(self):
+        # type: () -> None
+        """Drops all events."""
+        with self._lock:
+            self._samples.clear()
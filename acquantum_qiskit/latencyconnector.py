@@ -0,0 +1,208 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""A connector shim injecting network conditions, for benchmarks of polling, submission and retry strategies.
+
+The ``AcQuantumLatencyConnector`` wraps another connector, usually an ``AcQuantumLocalConnector``, and forwards
+every request after a sampled latency. Requests fail at a configurable rate or when they exceed a rate limit, and
+submitted experiments stay queued for a sampled delay. All randomness comes from a seeded generator, so that a
+benchmark is repeatable.
+
+A latency or delay is either a number of seconds or a callable drawing the seconds from a ``random.Random``, e.g.
+``uniform_latency(0.05, 0.2)``.
+"""
+
+import collections
+import copy
+import random
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+
+from acquantumconnector.model.errors import AcQuantumRequestError
+from acquantumconnector.model.response import AcQuantumResultResponse
+
+Delay = Union[float, Callable[[random.Random], float]]
+
+
+def uniform_latency(low, high):
+    # type: (float, float) -> Callable[[random.Random], float]
+    """
+    :param low: the lowest latency in seconds
+    :param high: the highest latency in seconds
+    :return: a latency drawn uniformly between both bounds
+    """
+    return lambda rng: rng.uniform(low, high)
+
+
+def lognormal_latency(median, sigma=0.5):
+    # type: (float, float) -> Callable[[random.Random], float]
+    """
+    :param median: the median latency in seconds
+    :param sigma: the standard deviation of the logarithm of the latency, larger values give a longer tail
+    :return: a log-normally distributed latency
+    """
+    return lambda rng: median * rng.lognormvariate(0, sigma)
+
+
+class AcQuantumLatencyConnector(object):
+    """
+        Forwards the requests to a connector under injected latency, errors, rate limits and queue delays.
+
+        Any method of the wrapped connector can be called on the shim. Injected failures raise an
+        ``AcQuantumRequestError`` before the request is forwarded: status 500 for the error rate and status 429 for
+        requests above the rate limit. The results of an experiment are reported as queued, without a finish time,
+        until its queue delay has passed after ``run_experiment``.
+    """
+
+    def __init__(self,
+                 connector,  # type: Any
+                 latency=0.0,  # type: Union[Delay, Dict[Optional[str], Delay]]
+                 error_rate=0.0,  # type: Union[float, Dict[Optional[str], float]]
+                 rate_limit=None,  # type: Optional[float]
+                 queue_delay=0.0,  # type: Delay
+                 seed=None,  # type: Optional[int]
+                 clock=time.monotonic,  # type: Callable[[], float]
+                 sleep=time.sleep  # type: Callable[[float], None]
+                 ):
+        # type: (...) -> None
+        """
+        :param connector: the connector to forward the requests to
+        :param latency: the latency of every request, or the latencies by method name with the key ``None`` as
+            the default
+        :param error_rate: the probability of a request to fail, or the probabilities by method name with the key
+            ``None`` as the default
+        :param rate_limit: the maximal number of requests per second, None for no limit
+        :param queue_delay: the seconds an experiment stays queued after it was run
+        :param seed: the seed of the random latencies, errors and delays
+        :param clock: the monotonic clock in seconds
+        :param sleep: the function waiting for the latency
+        """
+        self._connector = connector
+        self._latency = latency if isinstance(latency, dict) else {None: latency}
+        self._error_rate = error_rate if isinstance(error_rate, dict) else {None: error_rate}
+        self._rate_limit = rate_limit
+        self._queue_delay = queue_delay
+        self._random = random.Random(seed)
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._tokens = rate_limit
+        self._last_refill = clock()
+        self._queue = {}  # type: Dict[int, Tuple[float, float]]
+        self._requests = collections.Counter()  # type: Dict[str, int]
+        self._errors = collections.Counter()  # type: Dict[str, int]
+
+    def __getattr__(self, name):
+        # type: (str) -> Any
+        attribute = getattr(self._connector, name)
+        if not callable(attribute):
+            return attribute
+
+        def request(*args, **kwargs):
+            self._request(name)
+            return attribute(*args, **kwargs)
+
+        return request
+
+    def run_experiment(self, experiment_id, *args, **kwargs):
+        # type: (int, *Any, **Any) -> None
+        """Forwards the run and queues the experiment for a sampled delay."""
+        self._request('run_experiment')
+        self._connector.run_experiment(experiment_id, *args, **kwargs)
+        with self._lock:
+            now = self._clock()
+            self._queue[int(experiment_id)] = (now, now + self._draw(self._queue_delay))
+
+    def get_result(self, experiment_id):
+        # type: (int) -> AcQuantumResultResponse
+        """Forwards the query and hides the latest result of a queued experiment."""
+        self._request('get_result')
+        response = self._connector.get_result(experiment_id)
+        position = self._queue_position(int(experiment_id))
+        if position is None:
+            return response
+
+        response = copy.copy(response)
+        for attribute in ('simulated_result', 'real_result'):
+            results = list(getattr(response, attribute) or [])
+            if results:
+                queued = copy.copy(results[-1])
+                queued.finish_time, queued.data, queued.exception = None, None, None
+                queued.process = '[{}]'.format(position)
+                results[-1] = queued
+            setattr(response, attribute, results)
+        return response
+
+    def request_counts(self):
+        # type: () -> Dict[str, int]
+        """
+        :return: the number of requests by method name, including the failed ones
+        """
+        with self._lock:
+            return dict(self._requests)
+
+    def error_counts(self):
+        # type: () -> Dict[str, int]
+        """
+        :return: the number of injected failures by method name
+        """
+        with self._lock:
+            return dict(self._errors)
+
+    def _request(self, name):
+        # type: (str) -> None
+        with self._lock:
+            self._requests[name] += 1
+            latency = self._draw(self._latency.get(name, self._latency.get(None, 0.0)))
+            limited = not self._acquire_token()
+            failed = self._random.random() < self._error_rate.get(name, self._error_rate.get(None, 0.0))
+            if limited or failed:
+                self._errors[name] += 1
+
+        if latency > 0:
+            self._sleep(latency)
+        if limited:
+            raise AcQuantumRequestError('Rate limit of {} requests per second exceeded'.format(self._rate_limit),
+                                        status_code=429)
+        if failed:
+            raise AcQuantumRequestError('Injected failure of {}'.format(name), status_code=500)
+
+    def _acquire_token(self):
+        # type: () -> bool
+        if self._rate_limit is None:
+            return True
+        now = self._clock()
+        self._tokens = min(self._rate_limit, self._tokens + (now - self._last_refill) * self._rate_limit)
+        self._last_refill = now
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    def _queue_position(self, experiment_id):
+        # type: (int) -> Optional[int]
+        with self._lock:
+            now = self._clock()
+            for queued_id, (_, ready) in list(self._queue.items()):
+                if ready <= now:
+                    del self._queue[queued_id]
+            if experiment_id not in self._queue:
+                return None
+            submitted = self._queue[experiment_id][0]
+            return 1 + sum(1 for other, _ in self._queue.values() if other < submitted)
+
+    def _draw(self, delay):
+        # type: (Delay) -> float
+        return max(0.0, delay(self._random) if callable(delay) else float(delay))
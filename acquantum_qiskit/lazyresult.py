@@ -0,0 +1,105 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import copy
+import threading
+from typing import Any, Callable, Dict
+
+from qiskit.result import Result
+
+from .instrumentation import AcQuantumInstrumentation, DISABLED_INSTRUMENTATION, STAGE_VALIDATION
+
+# The attributes of the lazy result itself, which never trigger building the result
+_OWN_ATTRIBUTES = ('_builder', '_instrumentation', '_materialize_lock')
+
+
+class AcQuantumLazyResult(Result):
+    """
+        A ``qiskit.Result`` which is built on first use.
+
+        Building a result converts the counts of every experiment and validates the complete result against
+        its schema. The lazy result only knows the backend, the job id and whether the job succeeded; the
+        rest of the result is built by ``builder`` when any other attribute is accessed first, e.g. by
+        ``get_counts()``. Afterwards it behaves exactly as the built result. Pickling or copying the lazy result
+        yields the built result as plain ``qiskit.Result``.
+    """
+
+    def __init__(self, builder, backend_name, backend_version, job_id, success,
+                 instrumentation=DISABLED_INSTRUMENTATION):
+        # type: (Callable[[], Dict[str, Any]], str, str, str, bool, AcQuantumInstrumentation) -> None
+        """
+        :param builder: returns the dictionary the result is built from
+        :param backend_name: the name of the backend
+        :param backend_version: the version of the backend
+        :param job_id: the id of the job
+        :param success: whether all experiments of the job succeeded
+        :param instrumentation: receives the validation of the result as ``STAGE_VALIDATION``
+        """
+        # the validating initializer of Result is skipped on purpose, the built result is validated
+        self._builder = builder
+        self._instrumentation = instrumentation
+        self._materialize_lock = threading.Lock()
+        self.backend_name = backend_name
+        self.backend_version = backend_version
+        self.job_id = job_id
+        self.success = success
+
+    def materialize(self):
+        # type: () -> None
+        """
+        Builds the result, if not done yet.
+        """
+        with self._materialize_lock:
+            if self._builder is None:
+                return
+            result_dict = self._builder()
+            with self._instrumentation.stage(STAGE_VALIDATION, job_id=self.job_id):
+                result = Result.from_dict(result_dict)
+            self.__dict__.update(result.__dict__)
+            self._builder = None
+            self._instrumentation = None
+
+    def is_materialized(self):
+        # type: () -> bool
+        """
+        :return: whether the result has been built
+        """
+        return self.__dict__.get('_builder') is None
+
+    def to_result(self):
+        # type: () -> Result
+        """
+        :return: the built result as plain ``qiskit.Result``
+        """
+        self.materialize()
+        return Result(**dict((name, value) for name, value in self.__dict__.items() if name not in _OWN_ATTRIBUTES))
+
+    def __getattr__(self, name):
+        # only called for attributes which are not set yet
+        if name.startswith('__') or name in _OWN_ATTRIBUTES or self.is_materialized():
+            raise AttributeError(name)
+        self.materialize()
+        return getattr(self, name)
+
+    def __reduce__(self):
+        # the builder usually can not be pickled, a lazy result is pickled and copied as the built result
+        return self.to_result().__reduce__()
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(self.to_result(), memo)
+
+    def to_dict(self):
+        # the attributes of the lazy result itself are not part of the result
+        return self.to_result().to_dict()
@@ -0,0 +1,284 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""An in-process stand-in for the ``AcQuantumConnector``.
+
+The ``AcQuantumLocalConnector`` keeps the experiments in memory and runs them with the statevector simulator of
+``statevector`` as soon as they are submitted. It answers the requests of ``AcQuantumBackend`` and ``AcQuantumJob``
+with the model objects of the connector, so that the provider stack runs offline, e.g. for tests and benchmarks.
+"""
+
+import copy
+import itertools
+import json
+import random
+import threading
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+from acquantumconnector.model.backendtype import AcQuantumBackendType
+from acquantumconnector.model.config import AcQuantumRawConfig
+from acquantumconnector.model.errors import AcQuantumRequestError
+from acquantumconnector.model.gates import Gate
+from acquantumconnector.model.response import AcQuantumExperiment, AcQuantumExperimentDetail, AcQuantumResult, \
+    AcQuantumResultResponse
+
+from .statevector import simulate, sample
+
+_BASIS_GATES = ['x,y,z,h,s,sdg,t,tdg,rx,ry,rz,u1,u2,u3,cx,crz,ccx']
+
+_TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Seeds of numpy.random.RandomState are 32 bit unsigned integers
+_MAX_SEED = 2 ** 32
+
+
+class _LocalExperiment(object):
+
+    def __init__(self, experiment_id, name, experiment_type, bit_width):
+        # type: (int, str, AcQuantumBackendType, int) -> None
+        self.experiment_id = experiment_id
+        self.name = name
+        self.experiment_type = experiment_type
+        self.bit_width = bit_width
+        self.version = 0
+        self.data = []  # type: List[Dict[str, Any]]
+        self.code = ''
+        self.results = []  # type: List[AcQuantumResult]
+
+    def detail(self):
+        # type: () -> AcQuantumExperimentDetail
+        return AcQuantumExperimentDetail(self.name, self.version, self.experiment_id, self.experiment_type.name,
+                                         len(self.results), bit_width=self.bit_width)
+
+
+class AcQuantumLocalConnector(object):
+    """
+        Implements the requests of the ``AcQuantumConnector`` used by this package in memory. Experiments are
+        simulated synchronously by ``run_experiment``, so their results are finished once it returns.
+
+        The simulator backend has ``simulator_qubits`` qubits, the device backend ``device_qubits``; both are
+        simulated noiselessly.
+    """
+
+    def __init__(self, simulator_qubits=25, device_qubits=11):
+        # type: (int, int) -> None
+        self._simulator_qubits = simulator_qubits
+        self._device_qubits = device_qubits
+        self._experiments = {}  # type: Dict[int, _LocalExperiment]
+        self._experiment_ids = itertools.count(1)
+        self._result_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._calibration_time = datetime.now().strftime(_TIME_FORMAT)
+
+    def create_session(self, credentials):
+        # type: (AcQuantumCredentials) -> None
+        """
+        :param credentials: ignored, the local connector does not authenticate
+        """
+        pass
+
+    def create_experiment(self, bit_width, experiment_type, experiment_name):
+        # type: (int, AcQuantumBackendType, str) -> int
+        """
+        :param bit_width: bit width of the experiment
+        :param experiment_type: type of the backend the experiment should run
+        :param experiment_name: name of the experiment
+        :return: the id of the new experiment
+        :raises: AcQuantumRequestError: if the backend has fewer qubits
+        """
+        if bit_width > self._n_qubits(experiment_type):
+            raise AcQuantumRequestError('bit width {} exceeds the {} qubits of {}'.format(
+                bit_width, self._n_qubits(experiment_type), experiment_type.name))
+        with self._lock:
+            experiment_id = next(self._experiment_ids)
+            self._experiments[experiment_id] = _LocalExperiment(experiment_id, experiment_name, experiment_type,
+                                                                bit_width)
+        return experiment_id
+
+    def update_experiment(self, experiment_id, gates, code=None, override=True):
+        # type: (int, List[Gate], str, bool) -> None
+        """
+        :param experiment_id: id of the experiment
+        :param gates: the gates of the experiment
+        :param code: the code stored with the experiment
+        :param override: if False the gates are added to the existing ones
+        :raises: AcQuantumRequestError: if the experiment does not exist
+        """
+        data = [dict(gate.__dict__) for gate in gates]
+        with self._lock:
+            experiment = self._experiment(experiment_id)
+            experiment.data = data if override else data + experiment.data
+            experiment.code = code if code else ''
+            experiment.version += 1
+
+    def get_experiment(self, experiment_id):
+        # type: (int) -> AcQuantumExperiment
+        """
+        :param experiment_id: id of the experiment
+        :return: the experiment
+        :raises: AcQuantumRequestError: if the experiment does not exist
+        """
+        with self._lock:
+            experiment = self._experiment(experiment_id)
+            return AcQuantumExperiment(detail=experiment.detail(), data=copy.deepcopy(experiment.data),
+                                       code=experiment.code)
+
+    def get_experiments(self):
+        # type: () -> List[AcQuantumExperimentDetail]
+        """
+        :return: the details of all experiments
+        """
+        with self._lock:
+            return [experiment.detail() for experiment in self._experiments.values()]
+
+    def delete_experiment(self, experiment_id):
+        # type: (int) -> None
+        """
+        :param experiment_id: id of the experiment
+        :raises: AcQuantumRequestError: if the experiment does not exist
+        """
+        with self._lock:
+            self._experiment(experiment_id)
+            del self._experiments[int(experiment_id)]
+
+    def run_experiment(self, experiment_id, experiment_type, bit_width, shots, seed=None):
+        # type: (int, AcQuantumBackendType, int, int, Optional[int]) -> None
+        """
+        Simulates the experiment. A failing simulation is recorded as the exception of the result.
+
+        :param experiment_id: id of the experiment
+        :param experiment_type: type of the backend the experiment should run
+        :param bit_width: bit width of the experiment
+        :param shots: number of shots
+        :param seed: seed of the sampling, None for a random one, the used seed is recorded in the result
+        :raises: AcQuantumRequestError: if the experiment does not exist
+        """
+        with self._lock:
+            experiment = self._experiment(experiment_id)
+            gates = experiment.data
+
+        seed = random.randrange(_MAX_SEED) if seed in (None, '') else int(seed)
+        start_time = datetime.now().strftime(_TIME_FORMAT)
+        data, exception, measured = None, None, []
+        try:
+            state, measured = simulate(gates, bit_width)
+            data = sample(state, measured, shots, seed)
+        except ValueError as ex:
+            exception = str(ex)
+        result = AcQuantumResult(next(self._result_ids), seed, shots, start_time, [qubit + 1 for qubit in measured],
+                                 finish_time=datetime.now().strftime(_TIME_FORMAT), process='', data=data,
+                                 exception=exception)
+
+        with self._lock:
+            experiment = self._experiment(experiment_id)
+            experiment.experiment_type = experiment_type
+            experiment.results.append(result)
+
+    def get_result(self, experiment_id):
+        # type: (int) -> AcQuantumResultResponse
+        """
+        :param experiment_id: id of the experiment
+        :return: the results of all runs of the experiment
+        :raises: AcQuantumRequestError: if the experiment does not exist
+        """
+        with self._lock:
+            experiment = self._experiment(experiment_id)
+            results = list(experiment.results)
+        if experiment.experiment_type is AcQuantumBackendType.REAL:
+            return AcQuantumResultResponse(simulated_result=[], real_result=results)
+        return AcQuantumResultResponse(simulated_result=results, real_result=[])
+
+    def delete_result(self, result_id):
+        # type: (int) -> None
+        """
+        :param result_id: id of the result
+        """
+        with self._lock:
+            for experiment in self._experiments.values():
+                experiment.results = [result for result in experiment.results if result.result_id != result_id]
+
+    def get_backend_config(self):
+        # type: () -> AcQuantumRawConfig
+        """
+        :return: the configuration of the device backend
+        """
+        def config(key, value):
+            # type: (str, Any) -> Dict[str, Any]
+            return {'computerId': 'LOCAL', 'configKey': key, 'configValue': value}
+
+        one_q_gates = ['X', 'Y', 'Z', 'H', 'S', 'S†', 'T', 'T†', 'RX', 'RY', 'RZ']
+        qubits = ['Q{}'.format(i + 1) for i in range(self._device_qubits)]
+        return AcQuantumRawConfig.from_json([
+            config('systemConfig', json.dumps({
+                'oneQGates': one_q_gates, 'oneQGatesLabel': one_q_gates, 'twoQGates': ['CP'],
+                'twoQGatesLabel': ['CP'], 'measureSizeUpperLimit': self._device_qubits
+            })),
+            config('oneQGateFidelities', json.dumps([{'qubit': qubit, 'fidelity': 1.0} for qubit in qubits])),
+            config('qubitParameter', [{'qubit': qubit} for qubit in qubits]),
+            config('systemStatus', json.dumps({
+                'status': 'ONLINE', 'fridgeTemperature': '0', 'lastCalibrationTime': self._calibration_time
+            })),
+            config('twoQGateFidelity', json.dumps([
+                {'qubits': [first, second], 'fidelity': 1.0} for first, second in zip(qubits, qubits[1:])
+            ]))
+        ])
+
+    def available_backends(self):
+        # type: () -> List[Dict[str, Any]]
+        """
+        :return: the configurations of the simulator and the device backend
+        """
+        return [
+            {
+                'backend_name': AcQuantumBackendType.SIMULATE.name,
+                'backend_version': '0.0.1',
+                'n_qubits': self._simulator_qubits,
+                'basis_gates': list(_BASIS_GATES),
+                'gates': [],
+                'local': True,
+                'simulator': True,
+                'conditional': False,
+                'open_pulse': False,
+                'memory': False,
+                'max_shots': 8192
+            },
+            {
+                'backend_name': AcQuantumBackendType.REAL.name,
+                'backend_version': '0.0.1',
+                'n_qubits': self._device_qubits,
+                'basis_gates': list(_BASIS_GATES),
+                'gates': [],
+                'local': True,
+                'simulator': False,
+                'conditional': False,
+                'open_pulse': False,
+                'memory': False,
+                'max_shots': 20000
+            }
+        ]
+
+    def _n_qubits(self, experiment_type):
+        # type: (AcQuantumBackendType) -> int
+        if experiment_type is AcQuantumBackendType.REAL:
+            return self._device_qubits
+        return self._simulator_qubits
+
+    def _experiment(self, experiment_id):
+        # type: (int) -> _LocalExperiment
+        experiment = self._experiments.get(int(experiment_id))
+        if experiment is None:
+            raise AcQuantumRequestError('Experiment {} does not exist'.format(experiment_id), status_code=404)
+        return experiment
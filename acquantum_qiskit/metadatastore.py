@@ -0,0 +1,137 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import json
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import List, Optional
+
+from .experimentcode import AcQuantumExperimentMetadata
+
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_DATABASE_PATH = os.path.join(os.path.expanduser('~'), '.acquantum_qiskit', 'metadata.sqlite')
+
+
+class AcQuantumMetadataStore(object):
+    """
+        Stores the metadata of remote experiments locally, keyed by the experiment id.
+
+        The metadata is written when an experiment is submitted, so building its result does not need to
+        download the experiment from Alibaba Computing Quantum again.
+    """
+
+    def get(self, experiment_id):
+        # type: (int) -> Optional[AcQuantumExperimentMetadata]
+        """
+        :param experiment_id: the id of the remote experiment
+        :return: the stored metadata or None
+        """
+        raise NotImplementedError()
+
+    def put(self, experiment_id, metadata):
+        # type: (int, AcQuantumExperimentMetadata) -> None
+        """
+        :param experiment_id: the id of the remote experiment
+        :param metadata: the metadata of the experiment
+        """
+        raise NotImplementedError()
+
+    def remove(self, experiment_id):
+        # type: (int) -> None
+        """
+        :param experiment_id: the id of the remote experiment
+        """
+        raise NotImplementedError()
+
+
+class AcQuantumMemoryMetadataStore(AcQuantumMetadataStore):
+    """
+        Keeps the metadata in memory. If there are more than ``max_entries`` experiments, the least recently
+        used ones are dropped.
+    """
+
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        # type: (int) -> None
+        """
+        :param max_entries: upper bound of the number of stored experiments
+        """
+        self.max_entries = max_entries
+        self._entries = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+
+    def get(self, experiment_id):
+        # type: (int) -> Optional[AcQuantumExperimentMetadata]
+        with self._lock:
+            metadata = self._entries.get(int(experiment_id))
+            if metadata is not None:
+                self._entries.move_to_end(int(experiment_id))
+            return metadata
+
+    def put(self, experiment_id, metadata):
+        # type: (int, AcQuantumExperimentMetadata) -> None
+        with self._lock:
+            self._entries[int(experiment_id)] = metadata
+            self._entries.move_to_end(int(experiment_id))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def remove(self, experiment_id):
+        # type: (int) -> None
+        with self._lock:
+            self._entries.pop(int(experiment_id), None)
+
+
+class AcQuantumSqliteMetadataStore(AcQuantumMetadataStore):
+    """
+        Keeps the metadata in a SQLite database, so it outlives the process and is shared between processes.
+    """
+
+    def __init__(self, path=None):
+        # type: (str) -> None
+        """
+        :param path: path of the database file, defaults to ``~/.acquantum_qiskit/metadata.sqlite``
+        """
+        self.path = path or DEFAULT_DATABASE_PATH
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._execute('CREATE TABLE IF NOT EXISTS metadata (experiment_id INTEGER PRIMARY KEY, value TEXT)')
+
+    def get(self, experiment_id):
+        # type: (int) -> Optional[AcQuantumExperimentMetadata]
+        rows = self._execute('SELECT value FROM metadata WHERE experiment_id = ?', (int(experiment_id),))
+        if not rows:
+            return None
+        return AcQuantumExperimentMetadata.from_dict(json.loads(rows[0][0]))
+
+    def put(self, experiment_id, metadata):
+        # type: (int, AcQuantumExperimentMetadata) -> None
+        self._execute('INSERT OR REPLACE INTO metadata (experiment_id, value) VALUES (?, ?)',
+                      (int(experiment_id), json.dumps(metadata.to_dict())))
+
+    def remove(self, experiment_id):
+        # type: (int) -> None
+        self._execute('DELETE FROM metadata WHERE experiment_id = ?', (int(experiment_id),))
+
+    def _execute(self, statement, parameters=()):
+        # type: (str, tuple) -> List[tuple]
+        connection = sqlite3.connect(self.path, timeout=30)
+        try:
+            with connection:
+                return connection.execute(statement, parameters).fetchall()
+        finally:
+            connection.close()
@@ -0,0 +1,89 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import random
+from typing import Any, Optional
+
+
+class AcQuantumPollingStrategy(object):
+    """
+        Decides how long to wait between two status queries of a job.
+
+        The interval grows exponentially with the number of queries already made, is scaled by the
+        position of the job in the queue of Alibaba Computing Quantum and is randomized by a jitter, so
+        that many jobs submitted at the same time do not query in lock step. Jobs at the head of the
+        queue are polled often, jobs far back rarely.
+    """
+
+    def __init__(self, initial_interval=1.0, max_interval=60.0, backoff_factor=1.5, jitter=0.1,
+                 queue_factor=0.5):
+        # type: (float, float, float, float, float) -> None
+        """
+        :param initial_interval: seconds to wait after the first query
+        :param max_interval: upper bound of any interval in seconds
+        :param backoff_factor: factor the interval grows with on every query
+        :param jitter: relative random deviation of the interval, e.g. 0.1 for +/- 10 %
+        :param queue_factor: additional share of the interval per job ahead in the queue
+        """
+        if initial_interval < 0 or max_interval < initial_interval:
+            raise ValueError('Intervals must satisfy 0 <= initial_interval <= max_interval')
+        if backoff_factor < 1:
+            raise ValueError('The backoff factor must not be smaller than 1')
+        if not 0 <= jitter < 1:
+            raise ValueError('The jitter must be between 0 and 1')
+        self.initial_interval = initial_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.jitter = jitter
+        self.queue_factor = queue_factor
+
+    def interval(self, attempt, queue_position=None):
+        # type: (int, Any) -> float
+        """
+        :param attempt: number of status queries made so far, starting at 0
+        :param queue_position: position of the job in the queue as reported by the job, if queued
+        :return: seconds to wait before the next status query
+        """
+        interval = self.initial_interval * self.backoff_factor ** min(attempt, 64)
+        position = self._parse_queue_position(queue_position)
+        if position:
+            interval *= 1 + self.queue_factor * position
+        interval = min(interval, self.max_interval)
+        if self.jitter:
+            interval *= random.uniform(1 - self.jitter, 1 + self.jitter)
+        return max(0.0, min(interval, self.max_interval))
+
+    @classmethod
+    def _parse_queue_position(cls, queue_position):
+        # type: (Any) -> Optional[int]
+        try:
+            return max(0, int(queue_position))
+        except (TypeError, ValueError):
+            return None
+
+
+class AcQuantumFixedPollingStrategy(AcQuantumPollingStrategy):
+    """Waits the same number of seconds between every two status queries."""
+
+    def __init__(self, wait=5.0):
+        # type: (float) -> None
+        """
+        :param wait: seconds between two status queries
+        """
+        super().__init__(initial_interval=wait, max_interval=wait, backoff_factor=1, jitter=0, queue_factor=0)
+
+    def interval(self, attempt, queue_position=None):
+        # type: (int, Any) -> float
+        return self.initial_interval
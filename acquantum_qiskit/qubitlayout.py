@@ -0,0 +1,70 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Compaction of the qubits of an experiment.
+
+An experiment runs with as many qubits as it uses: the used qubits are renumbered to ``0 .. n - 1`` in the
+order of their index. The layout of a compacted experiment lists the original index of every compact qubit.
+"""
+
+from typing import Any, List
+
+from .gatetranslator import AcQuantumOperation
+
+# Instructions which do not act on their qubits
+_NON_OPERATIONS = ('barrier',)
+
+
+def used_qubits(experiment):
+    # type: (Any) -> List[int]
+    """
+    :param experiment: a qobj experiment
+    :return: the sorted indices of the qubits the experiment acts on
+    """
+    qubits = set()
+    for instruction in experiment.instructions:
+        if instruction.name not in _NON_OPERATIONS:
+            qubits.update(getattr(instruction, 'qubits', []))
+    return sorted(qubits)
+
+
+def compact_operations(operations, layout):
+    # type: (List[AcQuantumOperation], List[int]) -> List[AcQuantumOperation]
+    """
+    :param operations: operations on the original qubits
+    :param layout: the original index of every compact qubit
+    :return: copies of the operations on the compact qubits
+    """
+    compact = dict((qubit, i) for i, qubit in enumerate(layout))
+    compacted = []  # type: List[AcQuantumOperation]
+    for operation in operations:
+        operation = operation.copy()
+        operation.qubits = tuple(compact[qubit] for qubit in operation.qubits)
+        operation.span = tuple(compact[qubit] for qubit in operation.span if qubit in compact)
+        compacted.append(operation)
+    return compacted
+
+
+def expand_value(value, layout):
+    # type: (int, List[int]) -> int
+    """
+    :param value: a measured value of a compacted experiment, bit ``i`` belongs to compact qubit ``i``
+    :param layout: the original index of every compact qubit
+    :return: the value with every bit moved to the position of its original qubit
+    """
+    expanded = 0
+    for i, qubit in enumerate(layout):
+        if value >> i & 1:
+            expanded |= 1 << qubit
+    return expanded
@@ -0,0 +1,130 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+
+DEFAULT_CACHE_DIRECTORY = os.path.join(os.path.expanduser('~'), '.acquantum_qiskit', 'results')
+DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+
+
+class AcQuantumResultCache(object):
+    """
+        Stores the results of finished jobs on local disk, keyed by the job id.
+
+        Results of finished jobs never change, so a cached result can be served without asking
+        Alibaba Computing Quantum again. Every result is one JSON file holding the dictionary the
+        ``qiskit.Result`` is built from. If the files take more than ``max_bytes``, the least recently
+        used ones are removed.
+    """
+
+    def __init__(self, directory=None, max_bytes=DEFAULT_MAX_BYTES):
+        # type: (str, int) -> None
+        """
+        :param directory: directory of the cache files, defaults to ``~/.acquantum_qiskit/results``
+        :param max_bytes: upper bound of the size of all cache files
+        """
+        self.directory = directory or DEFAULT_CACHE_DIRECTORY
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(self.directory, exist_ok=True)
+
+    def get(self, job_id):
+        # type: (str) -> Optional[dict]
+        """
+        :param job_id: the id of the job
+        :return: the cached result dictionary or None
+        """
+        path = self._path(job_id)
+        try:
+            with open(path, 'r') as f:
+                result_dict = json.load(f)
+        except (OSError, ValueError):
+            return None
+        try:
+            # the modification time is the last use of the entry
+            os.utime(path, None)
+        except OSError:
+            pass
+        return result_dict
+
+    def put(self, job_id, result_dict):
+        # type: (str, dict) -> None
+        """
+        :param job_id: the id of the job
+        :param result_dict: the result dictionary of the finished job
+        """
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result_dict, f)
+            os.replace(tmp_path, self._path(job_id))
+        except (OSError, TypeError, ValueError):
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def remove(self, job_id):
+        # type: (str) -> None
+        """
+        :param job_id: the id of the job
+        """
+        try:
+            os.remove(self._path(job_id))
+        except FileNotFoundError:
+            pass
+
+    def clear(self):
+        # type: () -> None
+        for _, _, name in self._entries():
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+
+    def _path(self, job_id):
+        # type: (str) -> str
+        return os.path.join(self.directory, '{}.json'.format(str(job_id).replace(',', '_')))
+
+    def _entries(self):
+        # type: () -> list
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith('.json'):
+                continue
+            try:
+                stat = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name))
+        return entries
+
+    def _evict(self):
+        # type: () -> None
+        with self._lock:
+            entries = sorted(self._entries())
+            size = sum(entry[1] for entry in entries)
+            for _, entry_size, name in entries:
+                if size <= self.max_bytes:
+                    break
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    pass
+                size -= entry_size
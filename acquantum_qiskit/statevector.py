@@ -0,0 +1,136 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""A statevector simulator of AcQuantum gate lists.
+
+The gates are given as the dictionaries uploaded by ``AcQuantumConnector.update_experiment``: a one based column
+``x``, a one based qubit ``y`` (with ``y1`` and ``y2`` for the further qubits of ``CP`` and ``CCP``) and the ``text``
+of the gate. Bit ``i`` of an index into the statevector is qubit ``i``, i.e. the row ``y = i + 1``.
+
+The angles of rotations are in degrees, as accepted by the gate classes of the connector. ``CP`` and ``CCP`` flip
+the phase if all their qubits are one. Measurements are taken at the end of the experiment; without any measurement
+every qubit is measured.
+"""
+
+import math
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+_SQRT_HALF = 1 / math.sqrt(2)
+
+_FIXED_GATES = {
+    'H': np.array([[_SQRT_HALF, _SQRT_HALF], [_SQRT_HALF, -_SQRT_HALF]], dtype=np.complex128),
+    'X': np.array([[0, 1], [1, 0]], dtype=np.complex128),
+    'Y': np.array([[0, -1j], [1j, 0]], dtype=np.complex128),
+    'Z': np.array([[1, 0], [0, -1]], dtype=np.complex128),
+    'S': np.array([[1, 0], [0, 1j]], dtype=np.complex128),
+    'S†': np.array([[1, 0], [0, -1j]], dtype=np.complex128),
+    'T': np.array([[1, 0], [0, np.exp(1j * math.pi / 4)]], dtype=np.complex128),
+    'T†': np.array([[1, 0], [0, np.exp(-1j * math.pi / 4)]], dtype=np.complex128),
+}
+
+_PHASE_GATES = {'CP': ('y', 'y1'), 'CCP': ('y', 'y1', 'y2')}
+
+MEASURE = 'M'
+
+
+def rotation_matrix(axis, angle):
+    # type: (str, float) -> np.ndarray
+    """
+    :param axis: 'X', 'Y' or 'Z'
+    :param angle: the angle of the rotation in degrees
+    :return: the matrix of the rotation
+    """
+    theta = math.radians(angle) / 2
+    cos, sin = math.cos(theta), math.sin(theta)
+    if axis == 'X':
+        return np.array([[cos, -1j * sin], [-1j * sin, cos]], dtype=np.complex128)
+    if axis == 'Y':
+        return np.array([[cos, -sin], [sin, cos]], dtype=np.complex128)
+    if axis == 'Z':
+        return np.array([[cos - 1j * sin, 0], [0, cos + 1j * sin]], dtype=np.complex128)
+    raise ValueError('Unknown rotation axis {}'.format(axis))
+
+
+def gate_matrix(text):
+    # type: (str) -> np.ndarray
+    """
+    :param text: the text of a single qubit gate, e.g. 'H' or 'RZ_90'
+    :return: the matrix of the gate
+    :raises: ValueError: if the gate is unknown
+    """
+    if text in _FIXED_GATES:
+        return _FIXED_GATES[text]
+    if text[:1] == 'R' and text[2:3] == '_':
+        return rotation_matrix(text[1], float(text[3:]))
+    raise ValueError('Unknown gate {}'.format(text))
+
+
+def simulate(gates, bit_width):
+    # type: (List[Dict[str, Any]], int) -> Tuple[np.ndarray, List[int]]
+    """
+    :param gates: the gate dictionaries of an experiment
+    :param bit_width: the number of qubits of the experiment
+    :return: the final statevector and the sorted measured qubits
+    :raises: ValueError: if a gate is unknown or acts outside of the qubits of the experiment
+    """
+    state = np.zeros(2 ** bit_width, dtype=np.complex128)
+    state[0] = 1
+    indices = None  # type: Optional[np.ndarray]
+    measured = set()
+
+    for gate in sorted(gates, key=lambda g: (g['x'], g['y'])):
+        text = gate['text']
+        qubits = [gate[key] - 1 for key in _PHASE_GATES.get(text, ('y',))]
+        if any(qubit < 0 or qubit >= bit_width for qubit in qubits):
+            raise ValueError('Gate {} at row {} is outside of {} qubits'.format(text, gate['y'], bit_width))
+
+        if text == MEASURE:
+            measured.add(qubits[0])
+        elif text in _PHASE_GATES:
+            if indices is None:
+                indices = np.arange(2 ** bit_width)
+            mask = np.bitwise_and.reduce([indices >> qubit for qubit in qubits]) & 1
+            state[mask.astype(bool)] *= -1
+        else:
+            qubit = qubits[0]
+            view = state.reshape(2 ** (bit_width - qubit - 1), 2, 2 ** qubit)
+            state = np.einsum('ij,ajb->aib', gate_matrix(text), view).reshape(-1)
+
+    return state, sorted(measured) if measured else list(range(bit_width))
+
+
+def sample(state, measured, shots, seed=None):
+    # type: (np.ndarray, List[int], int, Optional[int]) -> Dict[str, float]
+    """
+    :param state: a statevector
+    :param measured: the measured qubits, the bits of the other qubits are zero
+    :param shots: the number of samples
+    :param seed: the seed of the sampling, None for a random one
+    :return: the relative frequency of every sampled outcome by bit string, bit ``i`` from the right is qubit ``i``
+    """
+    bit_width = int(state.size).bit_length() - 1
+    probabilities = np.abs(state) ** 2
+    probabilities /= probabilities.sum()
+
+    mask = sum(1 << qubit for qubit in measured)
+    outcomes = np.arange(state.size) & mask
+    occurrences = np.random.RandomState(seed).multinomial(shots, probabilities)
+    sampled = np.nonzero(occurrences)[0]
+    values, inverse = np.unique(outcomes[sampled], return_inverse=True)
+    counts = np.bincount(inverse, weights=occurrences[sampled], minlength=len(values))
+
+    return dict((format(int(value), '0{}b'.format(bit_width)), count / shots)
+                for value, count in zip(values.tolist(), counts.tolist()))
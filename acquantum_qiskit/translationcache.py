@@ -0,0 +1,220 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Caching of circuit translations by the structure of the circuit.
+
+Circuits which differ only in the parameters of their instructions, e.g. the steps of a variational algorithm,
+share the same structure. The first circuit of a structure is translated in full and kept as a template, the
+translations of further circuits copy the template and patch in the angles of the rotation gates.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Sequence, Tuple, TYPE_CHECKING
+
+import acquantumconnector.model.gates as ac_gates
+
+from .gatetranslator import AcQuantumOperation, Translator, gate_translator, translate_dag
+
+if TYPE_CHECKING:
+    from qiskit.qobj import Qobj
+
+DEFAULT_MAX_SIZE = 128
+
+# The AcQuantum gates whose angles are patched on a cache hit
+ROTATION_GATES = (ac_gates.RxGate, ac_gates.RyGate, ac_gates.RzGate)
+
+# (instruction position, translator, qubits of the instruction, indices of the operations it produced)
+Rebinding = Tuple[int, Translator, Tuple[int, ...], List[int]]
+
+
+class AcQuantumTranslationTemplate(object):
+    """
+        The translation of a circuit structure.
+    """
+
+    def __init__(self, operations, rebindings):
+        # type: (List[AcQuantumOperation], List[Rebinding]) -> None
+        """
+        :param operations: the translated operations of the circuit
+        :param rebindings: the instructions whose parameters end up in rotation gates
+        """
+        self.operations = operations
+        self.rebindings = rebindings
+
+    @classmethod
+    def from_operations(cls, operations, instruction_types):
+        # type: (List[AcQuantumOperation], Sequence[type]) -> AcQuantumTranslationTemplate
+        """
+        :param operations: the translated operations, their source is the position of the originating instruction
+        :param instruction_types: the qiskit instruction classes by position in the circuit
+        :return: the template
+        """
+        produced = OrderedDict()  # type: OrderedDict
+        for index, operation in enumerate(operations):
+            if operation.source is not None:
+                produced.setdefault(operation.source, []).append(index)
+
+        rebindings = []  # type: List[Rebinding]
+        for position, indices in produced.items():
+            if not any(operations[i].gate in ROTATION_GATES for i in indices):
+                continue
+            translator = gate_translator(instruction_types[position])
+            rebindings.append((position, translator, operations[indices[0]].span, indices))
+        return cls(operations, rebindings)
+
+    def bind(self, instructions):
+        # type: (List[Any]) -> List[AcQuantumOperation]
+        """
+        :param instructions: the qobj instructions of a circuit with the structure of the template
+        :return: the operations of the circuit
+        """
+        operations = [operation.copy() for operation in self.operations]
+        for position, translator, qubits, indices in self.rebindings:
+            instruction = instructions[position]
+            translated = translator(_instruction(instruction.name, getattr(instruction, 'params', [])), qubits)
+            for index, operation in zip(indices, translated):
+                if operations[index].gate in ROTATION_GATES:
+                    operations[index].params = operation.params
+        return operations
+
+
+class AcQuantumTranslationCache(object):
+    """
+        A least recently used cache of circuit translations keyed by the structure of the circuits.
+
+        Translators registered with ``register_gate_translator`` must only depend on the ``param`` of the
+        instruction for their results to be rebound correctly.
+    """
+
+    def __init__(self, max_size=DEFAULT_MAX_SIZE):
+        # type: (int) -> None
+        """
+        :param max_size: the maximal number of cached templates
+        """
+        self._max_size = max_size
+        self._templates = OrderedDict()  # type: OrderedDict
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def translate(self, qobj):
+        # type: (Qobj) -> List[AcQuantumOperation]
+        """
+        :param qobj: a qobj with exactly one (1) experiment
+        :return: the operations of the experiment in the order of the layers of the circuit
+        """
+        experiment = qobj.experiments[0]
+        key = structural_key(experiment)
+        template = self.get(key)
+        with self._lock:
+            if template is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        if template is not None:
+            return template.bind(experiment.instructions)
+
+        operations, template = compile_template(qobj)
+        if template is not None:
+            self.put(key, template)
+        return operations
+
+    def get(self, key):
+        # type: (Hashable) -> Optional[AcQuantumTranslationTemplate]
+        """
+        :param key: the structural key of a circuit
+        :return: the cached template, None if there is none
+        """
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+            return template
+
+    def put(self, key, template):
+        # type: (Hashable, AcQuantumTranslationTemplate) -> None
+        """
+        Caches a template and evicts the least recently used templates beyond the maximal size.
+
+        :param key: the structural key of the circuit
+        :param template: the template
+        """
+        with self._lock:
+            self._templates[key] = template
+            self._templates.move_to_end(key)
+            while len(self._templates) > self._max_size:
+                self._templates.popitem(last=False)
+
+    def clear(self):
+        # type: () -> None
+        with self._lock:
+            self._templates.clear()
+
+    def __len__(self):
+        return len(self._templates)
+
+
+def compile_template(qobj):
+    # type: (Qobj) -> Tuple[List[AcQuantumOperation], Optional[AcQuantumTranslationTemplate]]
+    """
+    Translates a circuit in full. Symbolic parameters, e.g. of a parameter sweep, end up unevaluated in the
+    template and are replaced on ``bind``.
+
+    :param qobj: a qobj with exactly one (1) experiment
+    :return: the operations of the experiment and their template, None if the circuit can not be rebound
+    """
+    from qiskit.converters import qobj_to_circuits, circuit_to_dag
+
+    experiment = qobj.experiments[0]
+    dag = circuit_to_dag(qobj_to_circuits(qobj)[0])
+    # the dag holds copies of the instructions, its node ids increase in the order of the circuit
+    nodes = sorted(node_id for node_id, data in dag.multi_graph.nodes(data=True) if data['type'] == 'op')
+    positions = dict((node_id, i) for i, node_id in enumerate(nodes))
+    operations = translate_dag(dag, experiment.header.qubit_labels, positions)
+
+    # only circuits with one instruction per qobj instruction can be rebound by position
+    if len(nodes) != len(experiment.instructions):
+        return operations, None
+    instruction_types = [type(dag.multi_graph.nodes[node_id]['op']) for node_id in nodes]
+    template = AcQuantumTranslationTemplate.from_operations(operations, instruction_types)
+    return [operation.copy() for operation in operations], template
+
+
+def structural_key(experiment):
+    # type: (Any) -> Hashable
+    """
+    :param experiment: a qobj experiment
+    :return: a key equal for all experiments which differ only in the parameters of their instructions
+    """
+    header = experiment.header
+    return (
+        tuple(tuple(label) for label in header.qubit_labels),
+        tuple(tuple(label) for label in getattr(header, 'clbit_labels', [])),
+        tuple((instruction.name,
+               tuple(getattr(instruction, 'qubits', [])),
+               tuple(getattr(instruction, 'memory', [])),
+               len(getattr(instruction, 'params', [])))
+              for instruction in experiment.instructions)
+    )
+
+
+def _instruction(name, params):
+    # type: (str, List[Any]) -> Any
+    """The parameters are converted as qiskit does when building the circuit."""
+    from qiskit.circuit import Instruction
+    return Instruction(name, list(params), [], [])
+
+
+default_translation_cache = AcQuantumTranslationCache()
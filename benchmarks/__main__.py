@@ -0,0 +1,48 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Runs all benchmarks and prints their throughput and peak memory::
+
+    python -m benchmarks [--json results.json] [suite ...]
+
+With ``--json`` the measurements are also written to a file, to compare them across releases.
+"""
+
+import argparse
+import importlib
+
+from .harness import report, write_json
+
+SUITES = ['bench_gate_translation', 'bench_submission', 'bench_results', 'bench_backend']
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.splitlines()[0])
+    parser.add_argument('suites', nargs='*', help='the suites to run, by default all of {}'.format(', '.join(SUITES)))
+    parser.add_argument('--json', help='the file to write the measurements to')
+    args = parser.parse_args()
+    unknown = set(args.suites) - set(SUITES)
+    if unknown:
+        parser.error('unknown suites: {}'.format(', '.join(sorted(unknown))))
+
+    results = []
+    for suite in args.suites or SUITES:
+        results.extend(importlib.import_module('.' + suite, __package__).benchmarks())
+    report(results)
+    if args.json:
+        write_json(results, args.json)
+
+
+if __name__ == '__main__':
+    main()
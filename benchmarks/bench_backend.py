@@ -0,0 +1,82 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Benchmark of the backend configuration and of large job listings.
+
+``AcQuantumBackendConfiguration.from_dict`` is measured with the configurations of the connector and
+``AcQuantumBackend.jobs`` with listings of a mocked connector. Run it with::
+
+    python -m benchmarks.bench_backend
+"""
+
+import itertools
+from typing import List
+from unittest.mock import Mock
+
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+from acquantumconnector.model.response import AcQuantumExperimentDetail
+
+from acquantum_qiskit.acquantumbackend import AcQuantumBackend
+from acquantum_qiskit.backendconfiguration import AcQuantumBackendConfiguration
+from acquantum_qiskit.localconnector import AcQuantumLocalConnector
+
+from .harness import BenchmarkResult, measure, report
+
+N_CONFIGURATIONS = 1000
+
+LISTING_SIZES = [1000, 10000, 100000]
+
+
+def mocked_backend(api=None):
+    # type: (Mock) -> AcQuantumBackend
+    """
+    :param api: the mocked connector, by default one which accepts every request without doing anything
+    :return: the simulator backend on the mocked connector
+    """
+    if api is None:
+        api = Mock()
+        api.create_experiment.side_effect = itertools.count(1)
+    [config] = [c for c in AcQuantumLocalConnector().available_backends() if c['simulator']]
+    return AcQuantumBackend(AcQuantumBackendConfiguration.from_dict(config), None, AcQuantumCredentials('', ''), api)
+
+
+def benchmarks():
+    # type: () -> List[BenchmarkResult]
+    results = []
+
+    configs = AcQuantumLocalConnector().available_backends()
+    results.append(measure('configuration', '{} configurations'.format(N_CONFIGURATIONS),
+                           lambda: [AcQuantumBackendConfiguration.from_dict(configs[i % len(configs)])
+                                    for i in range(N_CONFIGURATIONS)],
+                           operations=N_CONFIGURATIONS, unit='conf'))
+
+    for n_jobs in LISTING_SIZES:
+        api = Mock()
+        api.get_experiments.return_value = [
+            AcQuantumExperimentDetail('job_{}'.format(i), 1, i, ['REAL', 'SIMULATE'][i % 2], 1) for i in range(n_jobs)
+        ]
+        backend = mocked_backend(api)
+        results.append(measure('job listing', '{} jobs'.format(n_jobs), lambda: backend.jobs(),
+                               operations=n_jobs, unit='jobs'))
+        results.append(measure('job listing (all)', '{} jobs'.format(n_jobs),
+                               lambda: backend.jobs(limit=n_jobs), operations=n_jobs, unit='jobs'))
+    return results
+
+
+def main():
+    report(benchmarks())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,124 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Benchmark of the gate translation of deep circuits.
+
+Compares the registry based translation of ``acquantum_qiskit.gatetranslator`` with the former dispatch,
+which checked every instruction against a chain of ``isinstance`` tests and looked up every qubit with a
+linear scan of the qubit labels, and the complete translation into placed AcQuantum gates. Run it with::
+
+    python -m benchmarks.bench_gate_translation
+"""
+
+import random
+from typing import List
+
+from qiskit import QuantumCircuit, QuantumRegister, ClassicalRegister
+from qiskit.converters import circuit_to_dag
+from qiskit.dagcircuit import DAGCircuit
+import qiskit.extensions.standard as standard_gates
+from qiskit.circuit import Measure
+
+from acquantum_qiskit.gatetranslator import translate_dag, place_operations, gate_translator
+
+from .harness import BenchmarkResult, measure, report
+
+SIZES = [(5, 1000), (20, 10000), (25, 20000)]
+
+# The order of the former isinstance chain
+LEGACY_DISPATCH_ORDER = [
+    standard_gates.U1Gate, standard_gates.U2Gate, standard_gates.U3Gate, standard_gates.HGate,
+    standard_gates.RXGate, standard_gates.RYGate, standard_gates.RZGate, standard_gates.XGate,
+    standard_gates.YGate, standard_gates.ZGate, standard_gates.SGate, standard_gates.SdgGate,
+    standard_gates.TGate, standard_gates.TdgGate, standard_gates.CrzGate, standard_gates.CnotGate,
+    standard_gates.ToffoliGate, Measure
+]
+
+
+def random_circuit(n_qubits, n_gates, seed=42):
+    # type: (int, int, int) -> QuantumCircuit
+    rnd = random.Random(seed)
+    q = QuantumRegister(n_qubits, 'q')
+    c = ClassicalRegister(n_qubits, 'c')
+    qc = QuantumCircuit(q, c)
+    for _ in range(n_gates):
+        a, b = rnd.sample(range(n_qubits), 2)
+        choice = rnd.randrange(6)
+        if choice == 0:
+            qc.h(q[a])
+        elif choice == 1:
+            qc.cx(q[a], q[b])
+        elif choice == 2:
+            qc.t(q[a])
+        elif choice == 3:
+            qc.s(q[a])
+        elif choice == 4:
+            qc.x(q[a])
+        else:
+            qc.z(q[a])
+    qc.measure(q, c)
+    return qc
+
+
+def legacy_dispatch(dag, qubit_labels):
+    # type: (DAGCircuit, list) -> int
+    """The dispatch and qubit lookup of the former translation, without building gates."""
+    found = 0
+    for layer in dag.layers():
+        for _, node in layer["graph"].get_op_nodes(data=True):
+            op = node["op"]
+            for gate_type in LEGACY_DISPATCH_ORDER:
+                if isinstance(op, gate_type):
+                    found += sum(qubit_labels.index([r.name, i]) for r, i in op.qargs)
+                    break
+    return found
+
+
+def registry_dispatch(dag, qubit_labels):
+    # type: (DAGCircuit, list) -> int
+    """The dispatch and qubit lookup of the registry based translation, without building gates."""
+    qubit_index = dict(((name, index), i) for i, (name, index) in enumerate(qubit_labels))
+    found = 0
+    for layer in dag.layers():
+        for _, node in layer["graph"].get_op_nodes(data=True):
+            op = node["op"]
+            if gate_translator(type(op)) is not None:
+                found += sum(qubit_index[(r.name, i)] for r, i in op.qargs)
+    return found
+
+
+def benchmarks():
+    # type: () -> List[BenchmarkResult]
+    results = []
+    for n_qubits, n_gates in SIZES:
+        parameters = '{} qubits, {} gates'.format(n_qubits, n_gates)
+        dag = circuit_to_dag(random_circuit(n_qubits, n_gates))
+        qubit_labels = [['q', i] for i in range(n_qubits)]
+
+        results.append(measure('dispatch (legacy)', parameters, lambda: legacy_dispatch(dag, qubit_labels),
+                               operations=n_gates, unit='gates'))
+        results.append(measure('dispatch (registry)', parameters, lambda: registry_dispatch(dag, qubit_labels),
+                               operations=n_gates, unit='gates'))
+        results.append(measure('gate placement', parameters,
+                               lambda: place_operations(translate_dag(dag, qubit_labels)),
+                               operations=n_gates, unit='gates'))
+    return results
+
+
+def main():
+    report(benchmarks())
+
+
+if __name__ == '__main__':
+    main()
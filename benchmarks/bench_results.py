@@ -0,0 +1,84 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Benchmark of the conversion of large counts distributions into results.
+
+The responses of a mocked connector carry ``n_outcomes`` distinct bit strings per experiment. Measured are
+``AcQuantumCounts.from_data`` and the building of the ``qiskit.Result`` of a job from its responses. Run it with::
+
+    python -m benchmarks.bench_results
+"""
+
+import random
+from typing import Dict, List
+from unittest.mock import Mock
+
+from acquantumconnector.model.response import AcQuantumResult, AcQuantumResultResponse
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.counts import AcQuantumCounts
+from acquantum_qiskit.experimentcode import AcQuantumExperimentMetadata
+
+from .bench_backend import mocked_backend
+from .harness import BenchmarkResult, measure, report
+
+SIZES = [(20, 1000, 1), (20, 10000, 1), (25, 100000, 1), (20, 10000, 10)]
+
+
+def random_data(n_qubits, n_outcomes, seed=42):
+    # type: (int, int, int) -> Dict[str, float]
+    """
+    :return: ``n_outcomes`` distinct bit strings of ``n_qubits`` bits with random probabilities
+    """
+    rnd = random.Random(seed)
+    values = rnd.sample(range(2 ** n_qubits), n_outcomes)
+    weights = [rnd.random() for _ in values]
+    total = sum(weights)
+    return dict((format(value, '0{}b'.format(n_qubits)), weight / total) for value, weight in zip(values, weights))
+
+
+def benchmarks():
+    # type: () -> List[BenchmarkResult]
+    results = []
+    for n_qubits, n_outcomes, n_experiments in SIZES:
+        parameters = '{} qubits, {} outcomes, {} exp.'.format(n_qubits, n_outcomes, n_experiments)
+        data = random_data(n_qubits, n_outcomes)
+        shots = 10 * n_outcomes
+
+        results.append(measure('counts', parameters, lambda: AcQuantumCounts.from_data(data, shots),
+                               operations=n_outcomes, unit='outc'))
+
+        backend = mocked_backend()
+        experiment_ids = list(range(1, n_experiments + 1))
+        for experiment_id in experiment_ids:
+            backend.metadata_store().put(experiment_id, AcQuantumExperimentMetadata(
+                'qobj', 'circuit_{}'.format(experiment_id), {'name': 'circuit_{}'.format(experiment_id)}, None))
+        responses = [AcQuantumResultResponse(simulated_result=[
+            AcQuantumResult(experiment_id, 42, shots, '2019-01-01 00:00:00', list(range(1, n_qubits + 1)),
+                            finish_time='2019-01-01 00:00:01', process='', data=data)
+        ]) for experiment_id in experiment_ids]
+        job = AcQuantumJob(backend, ','.join(map(str, experiment_ids)), Mock(), False, api_status='COMPLETED')
+
+        results.append(measure('result conversion', parameters,
+                               lambda: job._result_from_job_response(responses).materialize(),
+                               operations=n_outcomes * n_experiments, unit='outc'))
+    return results
+
+
+def main():
+    report(benchmarks())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Benchmark of the translation and submission of synthetic circuits of increasing width and depth.
+
+``_gates_from_qobj`` is measured without and with the translation cache, ``AcQuantumBackend.run`` of distinct
+circuits against a mocked connector, starting with an empty translation cache. Run it with::
+
+    python -m benchmarks.bench_submission
+"""
+
+from typing import List
+
+from qiskit.converters import circuits_to_qobj
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.translationcache import AcQuantumTranslationCache, default_translation_cache
+
+from .bench_backend import mocked_backend
+from .bench_gate_translation import random_circuit
+from .harness import BenchmarkResult, measure, report
+
+SIZES = [(5, 100), (10, 1000), (20, 5000), (25, 20000)]
+
+N_EXPERIMENTS = 20
+
+
+def benchmarks():
+    # type: () -> List[BenchmarkResult]
+    results = []
+    for n_qubits, n_gates in SIZES:
+        parameters = '{} qubits, {} gates'.format(n_qubits, n_gates)
+        qobj = circuits_to_qobj(random_circuit(n_qubits, n_gates), backend_name='SIMULATE')
+        n_instructions = len(qobj.experiments[0].instructions)
+
+        results.append(measure('translation', parameters,
+                               lambda: AcQuantumJob._gates_from_qobj(qobj, translation_cache=None),
+                               operations=n_instructions, unit='instr'))
+
+        cache = AcQuantumTranslationCache()
+        AcQuantumJob._gates_from_qobj(qobj, translation_cache=cache)
+        results.append(measure('translation (cached)', parameters,
+                               lambda: AcQuantumJob._gates_from_qobj(qobj, translation_cache=cache),
+                               operations=n_instructions, unit='instr'))
+
+        circuits = [random_circuit(n_qubits, n_gates, seed=seed) for seed in range(N_EXPERIMENTS)]
+        batch = circuits_to_qobj(circuits, backend_name='SIMULATE')
+        backend = mocked_backend()
+        results.append(measure('submission', '{}, {} circuits'.format(parameters, N_EXPERIMENTS),
+                               lambda: backend.run(batch), operations=N_EXPERIMENTS, unit='circ',
+                               setup=default_translation_cache.clear))
+    return results
+
+
+def main():
+    report(benchmarks())
+
+
+if __name__ == '__main__':
+    main()
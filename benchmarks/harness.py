@@ -0,0 +1,115 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+"""Timing and memory measurement shared by the benchmarks.
+
+Every benchmark reports its throughput, i.e. the operations per second of the fastest of a few repetitions, and
+the peak of the memory allocated by one run as traced by ``tracemalloc``. The results can be written as JSON to
+track them across releases.
+"""
+
+import json
+import platform
+import timeit
+import tracemalloc
+from typing import Callable, List, Optional
+
+from acquantum_qiskit._version import __version__
+
+
+class BenchmarkResult(object):
+    """
+        The measurement of one benchmark.
+
+        Attributes:
+            name (str): the name of the benchmark
+            parameters (str): the size of the benchmark, e.g. the number of qubits and gates
+            operations (int): the number of operations of one run
+            unit (str): the name of an operation
+            seconds (float): the duration of the fastest run
+            peak_bytes (int): the peak of the memory allocated during one run
+    """
+
+    def __init__(self, name, parameters, operations, unit, seconds, peak_bytes):
+        # type: (str, str, int, str, float, int) -> None
+        self.name = name
+        self.parameters = parameters
+        self.operations = operations
+        self.unit = unit
+        self.seconds = seconds
+        self.peak_bytes = peak_bytes
+
+    def throughput(self):
+        # type: () -> float
+        """
+        :return: the operations per second
+        """
+        return self.operations / self.seconds if self.seconds > 0 else float('inf')
+
+    def to_dict(self):
+        # type: () -> dict
+        return dict(self.__dict__, throughput=self.throughput())
+
+
+def measure(name, parameters, function, operations=1, unit='calls', repeat=3, setup=None):
+    # type: (str, str, Callable[[], object], int, str, int, Optional[Callable[[], object]]) -> BenchmarkResult
+    """
+    :param name: the name of the benchmark
+    :param parameters: the size of the benchmark
+    :param function: one run of the benchmark
+    :param operations: the number of operations of one run
+    :param unit: the name of an operation
+    :param repeat: the number of timed runs
+    :param setup: called before every run, outside of the measurement
+    :return: the measurement
+    """
+    timer = timeit.Timer(function, setup=setup or (lambda: None))
+    seconds = min(timer.repeat(repeat=repeat, number=1))
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        function()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return BenchmarkResult(name, parameters, operations, unit, seconds, peak_bytes)
+
+
+def report(results):
+    # type: (List[BenchmarkResult]) -> None
+    """
+    :param results: the measurements to print as a table
+    """
+    print('{:<24} {:<36} {:>10} {:>20} {:>12}'.format(
+        'benchmark', 'parameters', 'time [s]', 'throughput', 'peak [MiB]'))
+    for result in results:
+        print('{:<24} {:<36} {:>10.4f} {:>12.1f} {:<7} {:>12.2f}'.format(
+            result.name, result.parameters, result.seconds, result.throughput(), result.unit + '/s',
+            result.peak_bytes / 2 ** 20))
+
+
+def write_json(results, path):
+    # type: (List[BenchmarkResult], str) -> None
+    """
+    :param results: the measurements
+    :param path: the file to write the measurements and the version of the package and python to
+    """
+    with open(path, 'w') as f:
+        json.dump({
+            'version': __version__,
+            'python': platform.python_version(),
+            'results': [result.to_dict() for result in results]
+        }, f, indent=2)
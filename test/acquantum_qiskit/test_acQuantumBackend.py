@@ -12,16 +12,47 @@
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
 
-from unittest import TestCase
+import tempfile
+from unittest import TestCase, mock
 from unittest.mock import Mock
 
 from acquantumconnector.credentials.credentials import AcQuantumCredentials
 from acquantumconnector.model.backendtype import AcQuantumBackendType
+from acquantumconnector.model.errors import AcQuantumRequestError
 from acquantumconnector.model.response import AcQuantumResult, AcQuantumResultResponse
 
 from acquantum_qiskit.acquantumbackend import AcQuantumBackend
+from acquantum_qiskit.acquantumerrors import AcQuantumBackendError
+from acquantum_qiskit.acquantumjob import AcQuantumJob, AcQuantumJobStatus
 from acquantum_qiskit.backendconfiguration import AcQuantumBackendConfiguration
+from acquantum_qiskit.experimentcode import CODE_FORMAT_QOBJ
+from acquantum_qiskit.gatetranslator import SCHEDULE_ALAP
 from acquantum_qiskit.models import AcQuantumExperimentDetail
+from acquantum_qiskit.resultcache import AcQuantumResultCache
+from acquantum_qiskit.translationcache import default_translation_cache
+
+backend_config = {
+    'backend_name': 'SIMULATE',
+    'backend_version': '0.0.1',
+    'n_qubits': 25,
+    'basis_gates': ['XGate'],
+    'gates': [
+        {'name': 'u1', 'parameters': ['lambda'], 'qasm_def': 'gate u1(lambda) q { U(0,0,lambda) q; }'},
+        {'name': 'u2', 'parameters': ['phi', 'lambda'],
+         'qasm_def': 'gate u2(phi,lambda) q { U(pi/2,phi,lambda) q; }'},
+        {'name': 'u3', 'parameters': ['theta', 'phi', 'lambda'],
+         'qasm_def': 'gate u3(theta,phi,lambda) q { U(theta,phi,lambda) q; }'},
+        {'name': 'cx', 'parameters': ['c', 't'], 'qasm_def': 'gate cx c,t { CX c,t; }'},
+        {'name': 'id', 'parameters': ['a'], 'qasm_def': 'gate id a { U(0,0,0) a; }'},
+        {'name': 'snapshot', 'parameters': ['slot'], 'qasm_def': 'gate snapshot(slot) q { TODO }'}
+    ],
+    'local': False,
+    'simulator': True,
+    'conditional': False,
+    'open_pulse': False,
+    'memory': False,
+    'max_shots': 8192
+}
 
 
 class TestAcQuantumBackend(TestCase):
@@ -32,34 +63,111 @@ class TestAcQuantumBackend(TestCase):
     def test_run(self):
         pass
 
+    def test_run_batch(self):
+        qobjs = []
+        for name in ['first', 'second', 'third']:
+            qobj = Mock(qobj_id='qobj', config=Mock(shots=100, seed=None), experiments=[Mock(instructions=[])])
+            qobj.experiments[0].header.name = name
+            qobj.experiments[0].header.as_dict.return_value = {'name': name}
+            qobjs.append(qobj)
+
+        def create_experiment(bit_width, backend_type, name):
+            if name == 'second':
+                raise AcQuantumRequestError('failed')
+            return len(name)
+
+        api_mock = Mock()
+        api_mock.create_experiment.side_effect = create_experiment
+        config = AcQuantumBackendConfiguration.from_dict(backend_config)
+        backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), api_mock)
+
+        with mock.patch.object(AcQuantumJob, '_gates_from_qobj', return_value=[]):
+            jobs = backend.run_batch(qobjs, max_in_flight=2)
+
+        self.assertEqual(len(jobs), 3)
+        self.assertEqual(jobs[0].job_id(), '5')
+        self.assertEqual(jobs[1].status(), AcQuantumJobStatus.ERROR)
+        self.assertEqual(jobs[2].job_id(), '5')
+        self.assertEqual(api_mock.run_experiment.call_count, 2)
+
+    def test_run_batch_translation_failure(self):
+        qobjs = []
+        for names in [['first'], ['second_a', 'second_b'], ['third']]:
+            experiments = [Mock(instructions=[]) for _ in names]
+            for experiment, name in zip(experiments, names):
+                experiment.header.name = name
+                experiment.header.as_dict.return_value = {'name': name}
+            qobjs.append(Mock(qobj_id='qobj', config=Mock(shots=100, seed=None), experiments=experiments))
+
+        def split_qobj(qobj):
+            return [Mock(qobj_id=qobj.qobj_id, config=qobj.config, experiments=[e]) for e in qobj.experiments]
+
+        def gates_from_qobj(qobj, **kwargs):
+            if qobj.experiments[0].header.name == 'second_b':
+                raise ValueError('unknown gate')
+            return []
+
+        api_mock = Mock()
+        api_mock.create_experiment.side_effect = lambda bit_width, backend_type, name: len(name)
+        config = AcQuantumBackendConfiguration.from_dict(backend_config)
+        backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), api_mock)
+
+        with mock.patch.object(AcQuantumJob, '_split_qobj', side_effect=split_qobj), \
+                mock.patch.object(AcQuantumJob, '_gates_from_qobj', side_effect=gates_from_qobj):
+            jobs = backend.run_batch(qobjs, max_in_flight=2)
+
+        self.assertEqual(len(jobs), 3)
+        self.assertEqual(jobs[0].job_id(), '5')
+        self.assertEqual(jobs[1].status(), AcQuantumJobStatus.ERROR)
+        self.assertEqual(jobs[2].job_id(), '5')
+        # the experiment of the failed job uploaded before the failure is deleted again
+        api_mock.delete_experiment.assert_called_once_with(8)
+
+    def test_run_sweep(self):
+        import qiskit.extensions.standard as standard
+        from qiskit.circuit.measure import measure
+        from qiskit.circuit import QuantumCircuit, QuantumRegister, ClassicalRegister
+
+        q = QuantumRegister(1, "q")
+        c = ClassicalRegister(1, "c")
+        qc = QuantumCircuit(q, c, name="Sweep")
+        standard.h(qc, q[0])
+        standard.rz(qc, 'theta', q[0])
+        measure(qc, q, c)
+
+        uploads = []
+
+        def upload(experiment_qobj, name, gates, n_qubits, backend_type, qubit_layout=None):
+            h, rz, m = [gate.text for gate in gates]
+            uploads.append((experiment_qobj.experiments[0].header.name, h, rz[:3], float(rz[3:]), m))
+            return len(uploads)
+
+        config = AcQuantumBackendConfiguration.from_dict(backend_config)
+        backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), Mock())
+
+        cache = default_translation_cache
+        lookups = (cache.hits, cache.misses)
+        with mock.patch.object(AcQuantumJob, '_upload_experiment', side_effect=upload):
+            job = backend.run_sweep(qc, [{'theta': 90}, {'theta': 180}, {'theta': 270}], shots=100)
+
+        # the variants are bound to the translation of the sweep, not looked up in the shared cache
+        self.assertEqual((cache.hits, cache.misses), lookups)
+        self.assertEqual(len(job.experiment_ids()), 3)
+        self.assertListEqual(sorted(uploads), [
+            ('Sweep_0', 'H', 'RZ_', 90, 'M'),
+            ('Sweep_1', 'H', 'RZ_', 180, 'M'),
+            ('Sweep_2', 'H', 'RZ_', 270, 'M')
+        ])
+
+        with self.assertRaises(AcQuantumBackendError):
+            backend.run_sweep(qc, [{'phi': 90}])
+
     def test_properties(self):
         pass
 
     def test_jobs(self):
         api_mock = Mock()
         jobs = [AcQuantumExperimentDetail('test', 1, 123, AcQuantumBackendType.SIMULATE, 0, 11)]
-        backend_config = {
-            'backend_name': 'SIMULATE',
-            'backend_version': '0.0.1',
-            'n_qubits': 25,
-            'basis_gates': ['XGate'],
-            'gates': [
-                {'name': 'u1', 'parameters': ['lambda'], 'qasm_def': 'gate u1(lambda) q { U(0,0,lambda) q; }'},
-                {'name': 'u2', 'parameters': ['phi', 'lambda'],
-                 'qasm_def': 'gate u2(phi,lambda) q { U(pi/2,phi,lambda) q; }'},
-                {'name': 'u3', 'parameters': ['theta', 'phi', 'lambda'],
-                 'qasm_def': 'gate u3(theta,phi,lambda) q { U(theta,phi,lambda) q; }'},
-                {'name': 'cx', 'parameters': ['c', 't'], 'qasm_def': 'gate cx c,t { CX c,t; }'},
-                {'name': 'id', 'parameters': ['a'], 'qasm_def': 'gate id a { U(0,0,0) a; }'},
-                {'name': 'snapshot', 'parameters': ['slot'], 'qasm_def': 'gate snapshot(slot) q { TODO }'}
-            ],
-            'local': False,
-            'simulator': True,
-            'conditional': False,
-            'open_pulse': False,
-            'memory': False,
-            'max_shots': 8192
-        }
         config = AcQuantumBackendConfiguration.from_dict(backend_config)
         api_mock.get_experiments.return_value = jobs
         api_mock.get_result.return_value = AcQuantumResultResponse(
@@ -71,3 +179,45 @@ class TestAcQuantumBackend(TestCase):
         backend = AcQuantumBackend(config, None, cred, api_mock)
         jobs = backend.jobs()
         self.assertEqual(jobs[0].job_id(), 123)
+        api_mock.get_result.assert_not_called()
+
+    def test_jobs_limit_skip(self):
+        api_mock = Mock()
+        api_mock.get_experiments.return_value = [
+            AcQuantumExperimentDetail('test', 1, i, 'REAL' if i % 2 else 'SIMULATE', 0, 11) for i in range(5000)
+        ]
+        config = AcQuantumBackendConfiguration.from_dict(backend_config)
+        backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), api_mock)
+
+        jobs = backend.jobs(limit=50, skip=10)
+
+        self.assertListEqual([job.job_id() for job in jobs], list(range(20, 120, 2)))
+        api_mock.get_experiments.assert_called_once_with()
+        api_mock.get_result.assert_not_called()
+
+    def test_setters(self):
+        config = AcQuantumBackendConfiguration.from_dict(backend_config)
+        backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), Mock())
+        metadata_store = backend.metadata_store()
+
+        backend.set_optimization_level(0)
+        backend.set_scheduling(SCHEDULE_ALAP)
+        backend.set_code_format(CODE_FORMAT_QOBJ)
+
+        self.assertEqual(backend.optimization_level(), 0)
+        self.assertEqual(backend.scheduling(), SCHEDULE_ALAP)
+        self.assertEqual(backend.code_format(), CODE_FORMAT_QOBJ)
+        self.assertIs(backend.metadata_store(), metadata_store)
+
+    def test_retrieve_job_from_result_cache(self):
+        api_mock = Mock()
+        config = AcQuantumBackendConfiguration.from_dict(backend_config)
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AcQuantumResultCache(directory)
+            cache.put('123', {'results': [{'name': 'test'}]})
+            backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), api_mock, result_cache=cache)
+            job = backend.retrieve_job('123')
+
+        self.assertEqual(job.status(), AcQuantumJobStatus.DONE)
+        api_mock.get_experiment.assert_not_called()
+        api_mock.get_result.assert_not_called()
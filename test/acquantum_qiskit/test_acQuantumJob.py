@@ -11,18 +11,23 @@
 #   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #   See the License for the specific language governing permissions and
 #   limitations under the License.
-from unittest import TestCase, skip
+import asyncio
+from types import SimpleNamespace
+from unittest import TestCase, skip, mock
 from unittest.mock import Mock
 
 import qiskit as qiskit
 from qiskit.result import Result
 
 from acquantumconnector.model.backendtype import AcQuantumBackendType
+from acquantumconnector.model.errors import AcQuantumRequestError
 from acquantumconnector.model.response import AcQuantumResultResponse, AcQuantumResult
 from acquantum_qiskit.acquantumbackend import AcQuantumBackend
-from acquantum_qiskit.acquantumerrors import AcQuantumJobError
+from acquantum_qiskit.acquantumerrors import AcQuantumJobError, AcQuantumJobTimeOutError
 from acquantum_qiskit.acquantumjob import AcQuantumJob, AcQuantumJobStatus
+from acquantum_qiskit.acquantumjobpoller import AcQuantumJobPoller
 from acquantum_qiskit.acquantumprovider import AcQuantumProvider
+from acquantum_qiskit.experimentcode import CODE_FORMAT_COMPACT
 
 
 class TestAcQuantumJob(TestCase):
@@ -130,6 +135,147 @@ class TestAcQuantumJob(TestCase):
         status = job.status()
         self.assertEqual(status, AcQuantumJobStatus.ERROR)
 
+    def test_status_request_error(self):
+        api_mock = Mock()
+        api_mock.get_result.side_effect = AcQuantumRequestError('failed')
+
+        job = AcQuantumJob(None, '100', api_mock, True)
+        with self.assertLogs('acquantum_qiskit.acquantumjob', level='WARNING'):
+            status = job.status()
+        self.assertEqual(status, AcQuantumJobStatus.ERROR)
+
+    def test_status_multiple_experiments(self):
+        running = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='', measure_qubits=11,
+                                         process='c3c')])
+        done = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=13, seed=100, shots=10, start_time='', measure_qubits=11,
+                                         finish_time='2019-01-08')])
+        responses = {100: done, 101: running}
+        api_mock = Mock()
+        api_mock.get_result.side_effect = lambda experiment_id: responses[experiment_id]
+
+        job = AcQuantumJob(None, '100,101', api_mock, True)
+        self.assertEqual(job.status(), AcQuantumJobStatus.QUEUED)
+        self.assertEqual(job.get_queue_position(), '3')
+
+        responses[101] = done
+        self.assertEqual(job.status(), AcQuantumJobStatus.DONE)
+        self.assertListEqual(job.experiment_ids(), [100, 101])
+
+    def test_submit_multiple_experiments(self):
+        names = ['circuit_0', 'circuit_1', 'circuit_2']
+        experiment_qobjs = []
+        for name in names:
+            experiment_qobj = Mock(qobj_id='qobj', config=Mock(shots=100, seed=None),
+                                   experiments=[Mock(instructions=[])])
+            experiment_qobj.experiments[0].header.name = name
+            experiment_qobj.experiments[0].header.as_dict.return_value = {'name': name}
+            experiment_qobjs.append(experiment_qobj)
+        qobj_mock = Mock(experiments=[e.experiments[0] for e in experiment_qobjs])
+
+        api_mock = Mock()
+        api_mock.create_experiment.side_effect = lambda bit_width, backend_type, name: names.index(name) + 1
+        backend_mock = Mock()
+        backend_mock.configuration.return_value = Mock(n_qubits=5)
+        backend_mock.backend_type.return_value = AcQuantumBackendType.SIMULATE
+        backend_mock.code_format.return_value = CODE_FORMAT_COMPACT
+
+        job = AcQuantumJob(backend_mock, None, api_mock, False, qobj_mock)
+        with mock.patch.object(AcQuantumJob, '_split_qobj', return_value=experiment_qobjs), \
+                mock.patch.object(AcQuantumJob, '_gates_from_qobj', return_value=[]):
+            job.submit(max_workers=2)
+
+        self.assertEqual(job.job_id(), '1,2,3')
+        self.assertEqual(api_mock.create_experiment.call_count, 3)
+        self.assertEqual(api_mock.run_experiment.call_count, 3)
+        api_mock.delete_experiment.assert_not_called()
+
+    def test__translate_experiment(self):
+        experiment_qobj = Mock(experiments=[Mock(instructions=[
+            SimpleNamespace(name='h', qubits=[4]),
+            SimpleNamespace(name='cx', qubits=[4, 2]),
+            SimpleNamespace(name='barrier', qubits=[0, 1, 2, 4])
+        ])])
+        backend_mock = Mock()
+        backend_mock.configuration.return_value = Mock(n_qubits=20)
+
+        with mock.patch.object(AcQuantumJob, '_gates_from_qobj', return_value=[]) as gates_mock:
+            job = AcQuantumJob(backend_mock, None, Mock(), False, experiment_qobj)
+            self.assertEqual(job._translate_experiment(experiment_qobj), ([], 2, [2, 4]))
+            self.assertListEqual(gates_mock.call_args[1]['qubit_layout'], [2, 4])
+
+            self.assertEqual(job._translate_experiment(experiment_qobj, n_qubits=5), ([], 5, None))
+
+            job = AcQuantumJob(backend_mock, None, Mock(), True, experiment_qobj)
+            self.assertEqual(job._translate_experiment(experiment_qobj), ([], 20, None))
+
+    def test_status_async(self):
+        api_mock = Mock()
+        api_mock.get_result.return_value = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='2019-01-11', measure_qubits=11,
+                                         finish_time='2019-01-08')])
+
+        job = AcQuantumJob(None, '100', api_mock, True)
+        status = asyncio.get_event_loop().run_until_complete(job.status_async())
+        self.assertEqual(status, AcQuantumJobStatus.DONE)
+
+    def test_result_async(self):
+        queued = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='', measure_qubits=11,
+                                         process='c1c')])
+        done = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='', measure_qubits=11,
+                                         finish_time='2019-01-08')])
+
+        jobs = []
+        for i in range(100):
+            api_mock = Mock()
+            api_mock.get_result.side_effect = [queued, queued] + [done] * 3
+            jobs.append(AcQuantumJob(None, str(i), api_mock, True))
+
+        async def wait_for_all():
+            return await asyncio.gather(*[job.result_async(wait=0.01) for job in jobs])
+
+        with mock.patch.object(AcQuantumJob, '_result_from_job_response', side_effect=lambda r: r):
+            results = asyncio.get_event_loop().run_until_complete(wait_for_all())
+
+        self.assertEqual(len(results), 100)
+        self.assertListEqual(results[0], [done])
+        for job in jobs:
+            self.assertEqual(job._api.get_result.call_count, 4)
+
+    def test_result_async_timeout(self):
+        api_mock = Mock()
+        api_mock.get_result.return_value = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='', measure_qubits=11,
+                                         process='c1c')])
+        job = AcQuantumJob(None, '100', api_mock, True)
+        with self.assertRaises(AcQuantumJobTimeOutError):
+            asyncio.get_event_loop().run_until_complete(job.result_async(timeout=0.05, wait=0.01))
+
+    def test_result_timeout_unwatches(self):
+        api_mock = Mock()
+        api_mock.get_result.return_value = AcQuantumResultResponse(
+            real_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='', measure_qubits=11,
+                                         process='c1c')])
+        poller = AcQuantumJobPoller()
+        backend = Mock(spec=['job_poller'])
+        backend.job_poller.return_value = poller
+        job = AcQuantumJob(backend, '100', api_mock, True)
+
+        with self.assertRaises(AcQuantumJobTimeOutError):
+            job.result(timeout=0.05, wait=0.01)
+        self.assertListEqual(poller.jobs(), [])
+
+        # another waiter on the job keeps its future when one waiter times out
+        future = job.future()
+        with self.assertRaises(AcQuantumJobTimeOutError):
+            job.result(timeout=0.05, wait=0.01)
+        self.assertFalse(future.cancelled())
+        self.assertListEqual(poller.jobs(), [job])
+        poller.unwatch(job)
+
     def test__result_from_job_response(self):
         # TODO: Implement Result
         pass
@@ -0,0 +1,90 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import threading
+from unittest import TestCase
+from unittest.mock import Mock
+
+from acquantum_qiskit.acquantumerrors import AcQuantumJobError
+from acquantum_qiskit.acquantumjob import AcQuantumJobStatus
+from acquantum_qiskit.acquantumjobpoller import AcQuantumJobPoller
+from acquantum_qiskit.pollingstrategy import AcQuantumFixedPollingStrategy
+
+
+def job_mock(statuses):
+    job = Mock(_queue_position=None)
+    job.status.side_effect = statuses
+    job._polling_strategy.return_value = AcQuantumFixedPollingStrategy(0.01)
+    return job
+
+
+class TestAcQuantumJobPoller(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_watch(self):
+        poller = AcQuantumJobPoller(max_workers=4)
+        jobs = [job_mock([AcQuantumJobStatus.QUEUED] * i + [AcQuantumJobStatus.DONE]) for i in range(20)]
+        futures = [poller.watch(job) for job in jobs]
+
+        for job, future in zip(jobs, futures):
+            self.assertEqual(future.result(timeout=5), AcQuantumJobStatus.DONE)
+        for i, job in enumerate(jobs):
+            self.assertEqual(job.status.call_count, i + 1)
+        self.assertListEqual(poller.jobs(), [])
+
+    def test_watch_twice(self):
+        poller = AcQuantumJobPoller()
+        job = job_mock([AcQuantumJobStatus.RUNNING] * 3 + [AcQuantumJobStatus.ERROR])
+        self.assertIs(poller.watch(job), poller.watch(job))
+        self.assertEqual(poller.watch(job).result(timeout=5), AcQuantumJobStatus.ERROR)
+
+    def test_done_callback(self):
+        poller = AcQuantumJobPoller()
+        job = job_mock([AcQuantumJobStatus.QUEUED, AcQuantumJobStatus.DONE])
+        done = threading.Event()
+        poller.watch(job).add_done_callback(lambda f: done.set())
+        self.assertTrue(done.wait(timeout=5))
+
+    def test_error(self):
+        poller = AcQuantumJobPoller()
+        job = job_mock(AcQuantumJobError('Unrecognized answer from server'))
+        with self.assertRaises(AcQuantumJobError):
+            poller.watch(job).result(timeout=5)
+
+    def test_unwatch(self):
+        poller = AcQuantumJobPoller()
+        job = job_mock([AcQuantumJobStatus.QUEUED] * 1000)
+        job._polling_strategy.return_value = AcQuantumFixedPollingStrategy(10)
+        future = poller.watch(job)
+        poller.unwatch(job)
+        self.assertTrue(future.cancelled())
+        self.assertListEqual(poller.jobs(), [])
+
+    def test_unwatch_shared(self):
+        poller = AcQuantumJobPoller()
+        job = job_mock([AcQuantumJobStatus.QUEUED] * 1000)
+        job._polling_strategy.return_value = AcQuantumFixedPollingStrategy(10)
+        future = poller.watch(job)
+        poller.watch(job)
+
+        poller.unwatch(job)
+        self.assertFalse(future.cancelled())
+        self.assertListEqual(poller.jobs(), [job])
+
+        poller.unwatch(job)
+        self.assertTrue(future.cancelled())
+        self.assertListEqual(poller.jobs(), [])
@@ -21,14 +21,19 @@ from acquantum_qiskit.acquantumprovider import AcQuantumProvider
 
 class SingleMock:
 
-    def __init__(self, credentials, provider):
+    def __init__(self, credentials, provider, connector_factory=None, pool_size=None, config_cache=None):
         self.provider = provider
         self.credentials = credentials
+        self.connector_factory = connector_factory
+        self.warmed = False
 
     def authenticate(self):
         print(self.credentials)
         print('auth called')
 
+    def warm(self):
+        self.warmed = True
+
     def backends(self, name=None, **kwargs):
         print('backends called')
         if self.credentials:
@@ -67,3 +72,18 @@ class TestAcQuantumProvider(TestCase):
         with self.assertRaises(AcQuantumBackendError):
             provider.backends()
             single_prov_mock.backends.assert_called_once()
+
+    @mock.patch('acquantum_qiskit.acquantumprovider.AcQuantumSingleProvider', side_effect=SingleMock)
+    def test_connector_factory(self, single_prov_mock):
+        factory = mock.Mock()
+        provider = AcQuantumProvider(connector_factory=factory)
+        provider.enable_account(user='user', password='password')
+        self.assertIs(provider._accounts['user'].connector_factory, factory)
+
+    @mock.patch('acquantum_qiskit.acquantumprovider.AcQuantumSingleProvider', side_effect=SingleMock)
+    def test_warm(self, single_prov_mock):
+        provider = AcQuantumProvider()
+        provider.enable_account(user='user', password='password')
+        provider.enable_account(user='other', password='password', warm=True)
+        self.assertFalse(provider._accounts['user'].warmed)
+        self.assertTrue(provider._accounts['other'].warmed)
@@ -13,11 +13,13 @@
 #   limitations under the License.
 
 import os
+import tempfile
 from unittest import TestCase, mock
 from unittest.mock import Mock
 
 from acquantumconnector.credentials.credentials import AcQuantumCredentials
 from acquantum_qiskit.acquantumsingleprovider import AcQuantumSingleProvider
+from acquantum_qiskit.configcache import AcQuantumConfigurationCache
 
 backends_config = [
     {
@@ -68,17 +70,47 @@ class TestAcQuantumSingleProvider(TestCase):
         super().setUp()
         self._cred = AcQuantumCredentials(os.environ['ACQ_USER'], os.environ['ACQ_PWD'])
 
-    @mock.patch('acquantum_qiskit.acquantumsingleprovider.AcQuantumConnector.create_session')
-    @mock.patch('acquantum_qiskit.acquantumsingleprovider.AcQuantumConnector.available_backends',
+    @mock.patch('acquantumconnector.connector.acquantumconnector.AcQuantumConnector.create_session')
+    @mock.patch('acquantumconnector.connector.acquantumconnector.AcQuantumConnector.available_backends',
                 return_value=backends_config)
     def test_init(self, available_backends, create_session):
         provider = Mock()
-        AcQuantumSingleProvider(self._cred, provider)
+        single_provider = AcQuantumSingleProvider(self._cred, provider)
+        create_session.assert_not_called()
+        available_backends.assert_not_called()
+        self.assertFalse(single_provider.is_discovered())
+
+        single_provider.backends()
+        single_provider.backends()
         create_session.assert_called_once_with(self._cred)
         available_backends.assert_called_once_with()
+        self.assertTrue(single_provider.is_discovered())
+
+    @mock.patch('acquantumconnector.connector.acquantumconnector.AcQuantumConnector.create_session')
+    @mock.patch('acquantumconnector.connector.acquantumconnector.AcQuantumConnector.available_backends',
+                return_value=backends_config)
+    def test_warm(self, available_backends, create_session):
+        single_provider = AcQuantumSingleProvider(self._cred, Mock())
+
+        backends = single_provider.warm().result(timeout=10)
+
+        self.assertListEqual(list(backends.keys()), ['SIMULATE', 'REAL'])
+        self.assertEqual(len(list(single_provider.backends())), 2)
+        create_session.assert_called_once_with(self._cred)
+        available_backends.assert_called_once_with()
+
+    def test_failed_discovery(self):
+        connector = Mock()
+        connector.available_backends.side_effect = [Exception('Connection refused'), backends_config]
+        single_provider = AcQuantumSingleProvider(self._cred, Mock(), connector_factory=lambda: connector)
 
-    @mock.patch('acquantum_qiskit.acquantumsingleprovider.AcQuantumConnector.create_session')
-    @mock.patch('acquantum_qiskit.acquantumsingleprovider.AcQuantumConnector.available_backends',
+        with self.assertRaises(Exception):
+            single_provider.warm().result(timeout=10)
+        self.assertEqual(len(list(single_provider.backends())), 2)
+        connector.create_session.assert_called_once_with(self._cred)
+
+    @mock.patch('acquantumconnector.connector.acquantumconnector.AcQuantumConnector.create_session')
+    @mock.patch('acquantumconnector.connector.acquantumconnector.AcQuantumConnector.available_backends',
                 return_value=backends_config)
     def test_backends(self, available_backends, create_session):
         provider = Mock()
@@ -92,3 +124,39 @@ class TestAcQuantumSingleProvider(TestCase):
         self.assertEqual('REAL', real)
         create_session.assert_called_once_with(self._cred)
         available_backends.assert_called_once_with()
+
+    def test_connector_factory(self):
+        connector = Mock()
+        connector.available_backends.return_value = backends_config
+
+        single_provider = AcQuantumSingleProvider(self._cred, Mock(), connector_factory=lambda: connector)
+
+        self.assertEqual(len(list(single_provider.backends())), 2)
+        connector.create_session.assert_called_once_with(self._cred)
+
+    def test_config_cache(self):
+        connector = Mock()
+        connector.available_backends.return_value = backends_config
+
+        with tempfile.TemporaryDirectory() as directory:
+            cache = AcQuantumConfigurationCache(directory)
+            single_provider = AcQuantumSingleProvider(self._cred, Mock(), connector_factory=lambda: connector,
+                                                      config_cache=cache)
+            self.assertEqual(len(list(single_provider.backends())), 2)
+            self.assertListEqual(cache.for_account(self._cred.user_name).backend_configurations(), backends_config)
+
+            cold_start = AcQuantumSingleProvider(self._cred, Mock(), connector_factory=lambda: connector,
+                                                 config_cache=cache)
+            backends = list(cold_start.backends())
+            self.assertEqual(len(backends), 2)
+            # the cached discovery does not log in
+            connector.create_session.assert_called_once_with(self._cred)
+            connector.available_backends.assert_called_once_with()
+
+            other_account = AcQuantumSingleProvider(AcQuantumCredentials('other', 'password'), Mock(),
+                                                    connector_factory=lambda: connector, config_cache=cache)
+            self.assertEqual(len(list(other_account.backends())), 2)
+            self.assertEqual(connector.available_backends.call_count, 2)
+
+        self.assertEqual(backends[1][1].config_cache().directory, directory)
+        self.assertEqual(backends[1][1].config_cache().account, self._cred.user_name)
@@ -0,0 +1,128 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import json
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+from acquantumconnector.model.config import AcQuantumRawConfig
+
+from acquantum_qiskit.acquantumbackend import AcQuantumBackend
+from acquantum_qiskit.backendconfiguration import AcQuantumBackendConfiguration
+from acquantum_qiskit.configcache import AcQuantumConfigurationCache, raw_config_to_json
+from acquantum_qiskit.localconnector import AcQuantumLocalConnector
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def calibrated_at(raw_config, last_calibration_time):
+    values = raw_config_to_json(raw_config)
+    status = json.loads(values[3]['configValue'])
+    status['lastCalibrationTime'] = last_calibration_time
+    values[3]['configValue'] = json.dumps(status)
+    return AcQuantumRawConfig.from_json(values)
+
+
+class TestAcQuantumConfigurationCache(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._directory = tempfile.TemporaryDirectory()
+        self._clock = Clock()
+        self._cache = AcQuantumConfigurationCache(self._directory.name, ttl=60, clock=self._clock)
+        self._raw_config = AcQuantumLocalConnector().get_backend_config()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        super().tearDown()
+
+    def test_backend_configurations(self):
+        configs_list = [{'backend_name': 'SIMULATE'}, {'backend_name': 'REAL'}]
+        self.assertIsNone(self._cache.backend_configurations())
+        self._cache.put_backend_configurations(configs_list)
+        self.assertListEqual(self._cache.backend_configurations(), configs_list)
+
+        other_process = AcQuantumConfigurationCache(self._directory.name, ttl=60, clock=self._clock)
+        self.assertListEqual(other_process.backend_configurations(), configs_list)
+
+        self._clock.now += 61
+        self.assertIsNone(self._cache.backend_configurations())
+
+    def test_accounts(self):
+        configs_list = [{'backend_name': 'SIMULATE'}]
+        first = self._cache.for_account('first@example.com')
+        first.put_backend_configurations(configs_list)
+
+        self.assertEqual(first.account, 'first@example.com')
+        self.assertListEqual(self._cache.for_account('first@example.com').backend_configurations(), configs_list)
+        self.assertIsNone(self._cache.for_account('second@example.com').backend_configurations())
+        self.assertIsNone(self._cache.backend_configurations())
+
+    def test_calibration(self):
+        self._cache.put_calibration(self._raw_config)
+        cached = self._cache.calibration()
+
+        self.assertListEqual(raw_config_to_json(cached), raw_config_to_json(self._raw_config))
+        self.assertEqual(cached.system_status.config_value.status, 'ONLINE')
+        self.assertEqual(self._cache.last_calibration_time(),
+                         self._raw_config.system_status.config_value.last_calibration_time)
+
+        self._clock.now += 61
+        self.assertIsNone(self._cache.calibration())
+        self.assertIsNotNone(self._cache.last_calibration_time())
+
+    def test_recalibration_invalidates(self):
+        configs_list = [{'backend_name': 'REAL'}]
+        self._cache.put_calibration(calibrated_at(self._raw_config, '2019-01-01 00:00:00'))
+        self._cache.put_backend_configurations(configs_list)
+
+        self._cache.put_calibration(calibrated_at(self._raw_config, '2019-01-01 00:00:00'))
+        self.assertListEqual(self._cache.backend_configurations(), configs_list)
+
+        self._cache.put_calibration(calibrated_at(self._raw_config, '2019-01-02 00:00:00'))
+        self.assertIsNone(self._cache.backend_configurations())
+        self.assertEqual(self._cache.last_calibration_time(), '2019-01-02 00:00:00')
+
+    def test_corrupt_entry(self):
+        with open(os.path.join(self._directory.name, 'calibration.json'), 'w') as f:
+            f.write('{')
+        self.assertIsNone(self._cache.calibration())
+        self._cache.put_calibration(self._raw_config)
+        self.assertIsNotNone(self._cache.calibration())
+
+        self._cache.clear()
+        self.assertIsNone(self._cache.calibration())
+
+    def test_backend_status(self):
+        api = Mock(wraps=AcQuantumLocalConnector())
+        config = AcQuantumBackendConfiguration.from_dict(api.available_backends()[1])
+        backend = AcQuantumBackend(config, None, AcQuantumCredentials('', ''), api, config_cache=self._cache)
+
+        for _ in range(3):
+            self.assertEqual(backend.status().config_value.status, 'ONLINE')
+        self.assertEqual(api.get_backend_config.call_count, 1)
+
+        self._clock.now += 61
+        backend.status()
+        self.assertEqual(api.get_backend_config.call_count, 2)
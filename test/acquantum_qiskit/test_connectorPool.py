@@ -0,0 +1,96 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+from acquantumconnector.model.errors import AcQuantumRequestError, AcQuantumRequestForbiddenError
+
+from acquantum_qiskit.connectorpool import AcQuantumConnectorPool
+
+
+class TestConnectorPool(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.credentials = AcQuantumCredentials('user', 'password')
+        self.connectors = []
+        self.refused = False
+
+    def connector_factory(self):
+        connector = Mock()
+        if self.refused:
+            connector.create_session.side_effect = Exception('Connection refused')
+        connector.get_experiments.return_value = [len(self.connectors)]
+        self.connectors.append(connector)
+        return connector
+
+    def test_authenticates_eagerly(self):
+        pool = AcQuantumConnectorPool(self.credentials, 2, self.connector_factory)
+
+        self.assertEqual(pool.created(), 1)
+        self.connectors[0].create_session.assert_called_once_with(self.credentials)
+        with self.assertRaises(ValueError):
+            AcQuantumConnectorPool(self.credentials, 0, self.connector_factory)
+
+    def test_authenticates_lazily(self):
+        pool = AcQuantumConnectorPool(self.credentials, 2, self.connector_factory, lazy=True)
+        self.assertEqual(pool.created(), 0)
+
+        self.assertListEqual(pool.get_experiments(), [0])
+        self.assertEqual(pool.created(), 1)
+        self.connectors[0].create_session.assert_called_once_with(self.credentials)
+
+    def test_request(self):
+        pool = AcQuantumConnectorPool(self.credentials, 2, self.connector_factory)
+
+        self.assertListEqual(pool.get_experiments(), [0])
+        self.assertListEqual(pool.get_experiments(), [0])
+        self.assertEqual(pool.created(), 1)
+
+        with pool.connection() as first:
+            self.assertListEqual(pool.get_experiments(), [1])
+            with pool.connection() as second:
+                self.assertIsNot(first, second)
+        self.assertEqual(pool.created(), 2)
+
+    def test_exhausted(self):
+        pool = AcQuantumConnectorPool(self.credentials, 1, self.connector_factory, timeout=0.01)
+        connector = pool.borrow()
+        with self.assertRaises(AcQuantumRequestError):
+            pool.borrow()
+
+        pool.release(connector)
+        self.assertIs(pool.borrow(), connector)
+
+    def test_forbidden(self):
+        pool = AcQuantumConnectorPool(self.credentials, 1, self.connector_factory)
+        self.connectors[0].get_experiments.side_effect = AcQuantumRequestForbiddenError()
+
+        with self.assertRaises(AcQuantumRequestForbiddenError):
+            pool.get_experiments()
+
+        self.assertEqual(pool.created(), 0)
+        self.assertListEqual(pool.get_experiments(), [1])
+        self.connectors[1].create_session.assert_called_once_with(self.credentials)
+
+    def test_failed_authentication(self):
+        pool = AcQuantumConnectorPool(self.credentials, 2, self.connector_factory)
+        with pool.connection():
+            self.refused = True
+            with self.assertRaises(Exception):
+                pool.borrow()
+        self.assertEqual(pool.created(), 1)
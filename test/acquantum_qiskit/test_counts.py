@@ -0,0 +1,92 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+from acquantumconnector.model.response import AcQuantumResultResponse, AcQuantumResult
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.counts import AcQuantumCounts
+from acquantum_qiskit.experimentcode import AcQuantumExperimentMetadata
+from acquantum_qiskit.metadatastore import AcQuantumMemoryMetadataStore
+
+data = {'000': 0.5, '011': 0.25, '110': 0.125, '111': 0.125}
+
+
+class TestAcQuantumCounts(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_from_data(self):
+        counts = AcQuantumCounts.from_data(data, 1000)
+
+        self.assertListEqual(counts.values.tolist(), [0, 3, 6, 7])
+        self.assertListEqual(counts.counts().tolist(), [500, 250, 125, 125])
+        self.assertDictEqual(counts.to_dict(), dict((hex(int(k, 2)), int(v * 1000)) for k, v in data.items()))
+
+    def test_from_data_with_layout(self):
+        counts = AcQuantumCounts.from_data(data, 1000, qubit_layout=[1, 4, 70])
+
+        self.assertListEqual(counts.values.tolist(), [0, 0b10010, (1 << 70) | 0b10000, (1 << 70) | 0b10010])
+
+    def test_wide_values(self):
+        wide = {'1' + '0' * 69: 0.5, '0' * 70: 0.5}
+        counts = AcQuantumCounts.from_data(wide, 10)
+
+        self.assertListEqual(counts.values.tolist(), [1 << 69, 0])
+        self.assertDictEqual(counts.to_dict(), {hex(1 << 69): 5, '0x0': 5})
+        self.assertListEqual(counts.marginal([69]).values.tolist(), [0, 1])
+
+    def test_from_counts(self):
+        counts = AcQuantumCounts.from_counts({'0x0': 500, '0x3': 500}, 1000)
+
+        self.assertListEqual(counts.values.tolist(), [0, 3])
+        self.assertListEqual(counts.probabilities.tolist(), [0.5, 0.5])
+
+    def test_marginal(self):
+        marginal = AcQuantumCounts.from_data(data, 1000).marginal([2])
+
+        self.assertListEqual(marginal.values.tolist(), [0, 1])
+        self.assertListEqual(marginal.probabilities.tolist(), [0.75, 0.25])
+
+        marginal = AcQuantumCounts.from_data(data, 1000).marginal([1, 0])
+        self.assertDictEqual(marginal.to_dict(), {'0x0': 500, '0x1': 125, '0x3': 375})
+
+    def test_top_k(self):
+        counts = AcQuantumCounts.from_data(data, 1000)
+
+        self.assertListEqual(counts.top_k(2), [(0, 0.5), (3, 0.25)])
+        self.assertEqual(len(counts.top_k(10)), 4)
+        self.assertListEqual(counts.top_k(0), [])
+
+    def test_job_counts(self):
+        api_mock = Mock()
+        api_mock.get_result.return_value = AcQuantumResultResponse(
+            simulated_result=[AcQuantumResult(result_id=12, seed=100, shots=1000, start_time='2019-01-11',
+                                              measure_qubits=3, finish_time='2019-01-12', data=data)])
+        store = AcQuantumMemoryMetadataStore()
+        store.put(5, AcQuantumExperimentMetadata('qobj', 'circuit', {}, [0, 1, 3]))
+        backend_mock = Mock()
+        backend_mock.metadata_store.return_value = store
+        backend_mock.result_cache.return_value = None
+        backend_mock.job_poller.return_value = None
+
+        job = AcQuantumJob(backend_mock, '5', api_mock, False)
+        counts = job.counts(wait=0)
+
+        self.assertListEqual(counts.values.tolist(), [0, 3, 0b1010, 0b1011])
+        api_mock.get_experiment.assert_not_called()
@@ -0,0 +1,74 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import copy
+import json
+from unittest import TestCase
+from unittest.mock import Mock
+
+from acquantum_qiskit.experimentcode import AcQuantumExperimentMetadata, encode_experiment_code, \
+    decode_experiment_code, CODE_FORMAT_COMPACT, CODE_FORMAT_COMPRESSED, CODE_FORMAT_QOBJ
+
+header = {'name': 'circuit', 'qubit_labels': [['q', 0], ['q', 1]], 'clbit_labels': [['c', 0], ['c', 1]],
+          'memory_slots': 2, 'creg_sizes': [['c', 2]]}
+
+qobj_dict = {
+    'qobj_id': 'id',
+    'schema_version': '1.0.0',
+    'type': 'QASM',
+    'config': {'shots': 100, 'memory_slots': 2, 'n_qubits': 2},
+    'header': {'backend_name': 'SIMULATE'},
+    'experiments': [{
+        'header': header,
+        'config': {'memory_slots': 2, 'n_qubits': 2},
+        'instructions': [{'name': 'h', 'qubits': [0]}] * 1000 + [{'name': 'measure', 'qubits': [0], 'memory': [0]}]
+    }]
+}
+
+
+def qobj_mock():
+    qobj = Mock(qobj_id='id', experiments=[Mock(config=None)])
+    qobj.experiments[0].header.name = 'circuit'
+    qobj.experiments[0].header.as_dict.return_value = header
+    qobj.as_dict.side_effect = lambda: copy.deepcopy(qobj_dict)
+    return qobj
+
+
+class TestExperimentCode(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_compact(self):
+        code = encode_experiment_code(qobj_mock(), [0, 3], CODE_FORMAT_COMPACT)
+
+        self.assertLess(len(code), len(json.dumps(qobj_dict)) / 10)
+        self.assertEqual(decode_experiment_code(code), AcQuantumExperimentMetadata('id', 'circuit', header, [0, 3]))
+
+    def test_compressed(self):
+        code = encode_experiment_code(qobj_mock(), None, CODE_FORMAT_COMPRESSED)
+
+        self.assertEqual(decode_experiment_code(code), AcQuantumExperimentMetadata('id', 'circuit', header))
+
+    def test_unknown_format(self):
+        with self.assertRaises(ValueError):
+            encode_experiment_code(qobj_mock(), None, 'unknown')
+
+    def test_qobj(self):
+        code = encode_experiment_code(qobj_mock(), [1, 2], CODE_FORMAT_QOBJ)
+        self.assertEqual(json.loads(code)['experiments'][0]['config']['qubit_layout'], [1, 2])
+
+        metadata = decode_experiment_code(json.dumps(qobj_dict))
+        self.assertEqual(metadata, AcQuantumExperimentMetadata('id', 'circuit', header))
@@ -0,0 +1,113 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+
+import acquantumconnector.model.gates as ac_gates
+
+from acquantum_qiskit.gateoptimizer import optimize_operations, NO_OPTIMIZATION, CANCEL_INVERSES, \
+    MERGE_ROTATIONS
+from acquantum_qiskit.gatetranslator import AcQuantumBarrier, AcQuantumOperation, translate_cx
+from acquantum_qiskit.translationcache import AcQuantumTranslationCache
+
+
+def op(gate, *qubits, params=()):
+    return AcQuantumOperation(gate, qubits, params)
+
+
+class TestGateOptimizer(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_no_optimization(self):
+        operations = translate_cx(None, (0, 1)) + translate_cx(None, (0, 1))
+        self.assertListEqual(optimize_operations(operations, NO_OPTIMIZATION), operations)
+
+    def test_cancel_inverses(self):
+        operations = translate_cx(None, (0, 1)) + translate_cx(None, (0, 1))
+        self.assertListEqual(optimize_operations(operations, CANCEL_INVERSES), [])
+
+        operations = [op(ac_gates.SGate, 0), op(ac_gates.HGate, 1), op(ac_gates.SDag, 0), op(ac_gates.TGate, 1)]
+        self.assertListEqual(optimize_operations(operations, CANCEL_INVERSES),
+                             [op(ac_gates.HGate, 1), op(ac_gates.TGate, 1)])
+
+        operations = [op(ac_gates.CPhase, 0, 1), op(ac_gates.CPhase, 1, 0)]
+        self.assertListEqual(optimize_operations(operations, CANCEL_INVERSES), [])
+
+    def test_keep_separated_gates(self):
+        operations = [op(ac_gates.HGate, 1), op(ac_gates.CPhase, 0, 1), op(ac_gates.HGate, 1),
+                      op(ac_gates.XGate, 0), op(ac_gates.Measure, 0), op(ac_gates.XGate, 0)]
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS), operations)
+
+    def test_zero_rotations(self):
+        operations = [op(ac_gates.RzGate, 0, params=(0,)), op(ac_gates.HGate, 0), op(ac_gates.RyGate, 0, params=(0.0,))]
+        self.assertListEqual(optimize_operations(operations, CANCEL_INVERSES), [op(ac_gates.HGate, 0)])
+
+    def test_merge_rotations(self):
+        operations = [op(ac_gates.RzGate, 0, params=(30,)), op(ac_gates.RzGate, 1, params=(10,)),
+                      op(ac_gates.RzGate, 0, params=(60,)), op(ac_gates.RxGate, 0, params=(10,))]
+        self.assertListEqual(optimize_operations(operations, CANCEL_INVERSES), operations)
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS), [
+            op(ac_gates.RzGate, 0, params=(90,)), op(ac_gates.RzGate, 1, params=(10,)),
+            op(ac_gates.RxGate, 0, params=(10,))
+        ])
+
+        operations = [op(ac_gates.HGate, 0), op(ac_gates.RzGate, 0, params=(30,)),
+                      op(ac_gates.RzGate, 0, params=(-30,)), op(ac_gates.HGate, 0)]
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS), [])
+        self.assertEqual(operations[1].params, (30,))
+
+    def test_merge_rotations_wrap_around(self):
+        operations = [op(ac_gates.RzGate, 0, params=(270,)), op(ac_gates.RzGate, 0, params=(180,))]
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS), [op(ac_gates.RzGate, 0, params=(90,))])
+
+        operations = [op(ac_gates.RyGate, 0, params=(300,)), op(ac_gates.RyGate, 0, params=(60,))]
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS), [])
+
+        operations = [op(ac_gates.RxGate, 0, params=(0.1,)), op(ac_gates.RxGate, 0, params=(359.9,))]
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS), [])
+
+    def test_barriers(self):
+        operations = [op(ac_gates.XGate, 0), op(AcQuantumBarrier, 0, 1), op(ac_gates.XGate, 0),
+                      op(ac_gates.RzGate, 1, params=(30,)), op(AcQuantumBarrier, 1),
+                      op(ac_gates.RzGate, 1, params=(60,))]
+        self.assertListEqual(optimize_operations(operations, NO_OPTIMIZATION), [
+            op(ac_gates.XGate, 0), op(ac_gates.XGate, 0), op(ac_gates.RzGate, 1, params=(30,)),
+            op(ac_gates.RzGate, 1, params=(60,))
+        ])
+        self.assertListEqual(optimize_operations(operations, MERGE_ROTATIONS),
+                             optimize_operations(operations, NO_OPTIMIZATION))
+
+        operations = [op(ac_gates.XGate, 0), op(AcQuantumBarrier, 1), op(ac_gates.XGate, 0)]
+        self.assertListEqual(optimize_operations(operations, CANCEL_INVERSES), [])
+
+    def test_barrier_circuit(self):
+        import qiskit.extensions.standard as standard
+        from qiskit.circuit import QuantumCircuit, QuantumRegister
+        from qiskit.converters import circuits_to_qobj
+        from acquantum_qiskit.acquantumjob import AcQuantumJob
+
+        q = QuantumRegister(1, "q")
+        qc = QuantumCircuit(q, name="Barrier")
+        standard.x(qc, q[0])
+        standard.barrier(qc, q)
+        standard.x(qc, q[0])
+        qobj = circuits_to_qobj([qc], backend_name='SIMULATE')
+
+        for translation_cache in [None, AcQuantumTranslationCache()]:
+            gates = AcQuantumJob._gates_from_qobj(qobj, translation_cache=translation_cache,
+                                                  optimization_level=MERGE_ROTATIONS)
+            self.assertListEqual([(type(g), g.x) for g in gates], [(ac_gates.XGate, 1), (ac_gates.XGate, 2)])
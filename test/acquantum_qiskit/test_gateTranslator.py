@@ -0,0 +1,137 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+import acquantumconnector.model.gates as ac_gates
+
+from acquantum_qiskit.gatetranslator import AcQuantumBarrier, AcQuantumOperation, register_gate_translator, \
+    gate_translator, translate_dag, place_operations, translate_cx, translate_crz, schedule_operations, SCHEDULE_ASAP, \
+    SCHEDULE_ALAP, SCHEDULE_LEGACY
+
+
+class Register:
+
+    def __init__(self, name):
+        self.name = name
+
+
+class CustomGate:
+
+    def __init__(self, qargs, param=None):
+        self.qargs = qargs
+        self.param = param or []
+
+
+class DerivedCustomGate(CustomGate):
+    pass
+
+
+def translate_custom(op, qubits):
+    return [AcQuantumOperation(ac_gates.XGate, qubits)]
+
+
+def dag_mock(layers):
+    layer_mocks = []
+    for ops in layers:
+        graph = Mock()
+        graph.get_op_nodes.return_value = [(i, {'op': op}) for i, op in enumerate(ops)]
+        layer_mocks.append({'graph': graph})
+    dag = Mock()
+    dag.layers.return_value = layer_mocks
+    return dag
+
+
+class TestGateTranslator(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        register_gate_translator(CustomGate, translate_custom)
+
+    def test_registry(self):
+        self.assertIs(gate_translator(CustomGate), translate_custom)
+        self.assertIs(gate_translator(DerivedCustomGate), translate_custom)
+        self.assertIsNone(gate_translator(Register))
+
+        register_gate_translator(DerivedCustomGate, None)
+        self.assertIsNone(gate_translator(DerivedCustomGate))
+        self.assertIs(gate_translator(CustomGate), translate_custom)
+
+    def test_translate_dag(self):
+        q, r = Register('q'), Register('r')
+        qubit_labels = [['q', 0], ['q', 1], ['r', 0]]
+        dag = dag_mock([
+            [CustomGate([(q, 1)]), CustomGate([(r, 0)])],
+            [Register('unsupported')],
+            [CustomGate([(q, 0)])],
+        ])
+
+        operations = translate_dag(dag, qubit_labels)
+
+        self.assertListEqual(operations, [AcQuantumOperation(ac_gates.XGate, (1,)),
+                                          AcQuantumOperation(ac_gates.XGate, (2,)),
+                                          AcQuantumOperation(ac_gates.XGate, (0,))])
+        self.assertListEqual([o.layer for o in operations], [0, 0, 2])
+
+    def test_place_operations(self):
+        operations = [AcQuantumOperation(ac_gates.HGate, (0,), layer=0)]
+        for operation in translate_cx(None, (0, 1)):
+            operation.layer = 1
+            operation.span = (0, 1)
+            operations.append(operation)
+        operations.append(AcQuantumOperation(ac_gates.RzGate, (1,), (90,), layer=2))
+
+        gates = place_operations(operations, SCHEDULE_LEGACY)
+
+        self.assertListEqual([type(g) for g in gates],
+                             [ac_gates.HGate, ac_gates.HGate, ac_gates.CPhase, ac_gates.HGate, ac_gates.RzGate])
+        self.assertListEqual([(g.x, g.y) for g in gates], [(1, 1), (2, 2), (3, 1), (4, 2), (5, 2)])
+        self.assertEqual(gates[2].y1, 2)
+        self.assertEqual(gates[4].text, 'RZ_90')
+
+        gates = place_operations(operations)
+        self.assertListEqual([(g.x, g.y) for g in gates], [(1, 1), (1, 2), (2, 1), (3, 2), (4, 2)])
+
+    def test_place_barrier(self):
+        operations = [AcQuantumOperation(ac_gates.HGate, (0,)), AcQuantumOperation(AcQuantumBarrier, (0, 1)),
+                      AcQuantumOperation(ac_gates.HGate, (1,))]
+
+        gates = place_operations(operations)
+        self.assertListEqual([(type(g), g.x, g.y) for g in gates], [(ac_gates.HGate, 1, 1), (ac_gates.HGate, 1, 2)])
+
+    def test_translate_crz(self):
+        operations = translate_crz(CustomGate([], param=[90]), (0, 1))
+
+        self.assertListEqual([o.gate for o in operations], [ac_gates.RzGate, ac_gates.HGate, ac_gates.CPhase,
+                                                            ac_gates.HGate, ac_gates.RzGate, ac_gates.HGate,
+                                                            ac_gates.CPhase, ac_gates.HGate])
+        self.assertTupleEqual(operations[0].params, (45,))
+        self.assertTupleEqual(operations[4].params, (315,))
+        gates = place_operations(operations)
+        self.assertListEqual([gates[0].text, gates[4].text], ['RZ_45.0', 'RZ_315.0'])
+
+    def test_schedule_operations(self):
+        operations = [AcQuantumOperation(ac_gates.HGate, (0,)),
+                      AcQuantumOperation(ac_gates.XGate, (0,)),
+                      AcQuantumOperation(ac_gates.HGate, (1,)),
+                      AcQuantumOperation(ac_gates.CPhase, (0, 2)),
+                      AcQuantumOperation(ac_gates.Measure, (1,))]
+
+        self.assertListEqual(schedule_operations(operations, SCHEDULE_ASAP), [1, 2, 1, 3, 2])
+        self.assertListEqual(schedule_operations(operations, SCHEDULE_ALAP), [1, 2, 2, 3, 3])
+        self.assertListEqual(schedule_operations([], SCHEDULE_ALAP), [])
+        with self.assertRaises(ValueError):
+            schedule_operations(operations, 'unknown')
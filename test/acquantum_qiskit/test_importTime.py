@@ -0,0 +1,74 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+import json
+import subprocess
+import sys
+from unittest import TestCase
+
+# Seconds a fresh interpreter may spend on ``import acquantum_qiskit``. It takes a few hundredths of a second
+# when only the lazy public names are set up, importing qiskit and the connector takes seconds.
+IMPORT_TIME_BUDGET = 0.5
+
+# Modules of this package and the connector loaded on first use only
+LAZY_MODULES = ['acquantumconnector.connector.acquantumconnector', 'acquantum_qiskit.backendconfiguration',
+                'acquantum_qiskit.counts', 'acquantum_qiskit.lazyresult']
+
+# Dependencies not loaded by ``import acquantum_qiskit``, qiskit itself imports them once it is loaded
+DEPENDENCIES = ['qiskit', 'marshmallow', 'numpy', 'requests']
+
+_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{'seconds': seconds, 'modules': sorted(sys.modules)}}))
+"""
+
+
+def import_in_subprocess(module):
+    # type: (str) -> dict
+    output = subprocess.check_output([sys.executable, '-c', _SCRIPT.format(module=module)])
+    return json.loads(output.decode('utf-8').strip().splitlines()[-1])
+
+
+class TestImportTime(TestCase):
+
+    def test_package_import(self):
+        # the best of three runs, so a busy machine does not fail the test
+        imports = [import_in_subprocess('acquantum_qiskit') for _ in range(3)]
+
+        self.assertLess(min(i['seconds'] for i in imports), IMPORT_TIME_BUDGET)
+        modules = imports[0]['modules']
+        self.assertNotIn('acquantum_qiskit.acquantumprovider', modules)
+        for module in LAZY_MODULES + DEPENDENCIES:
+            self.assertNotIn(module, modules)
+
+    def test_provider_import(self):
+        modules = import_in_subprocess('acquantum_qiskit.acquantumprovider')['modules']
+
+        self.assertIn('acquantum_qiskit.acquantumjob', modules)
+        for module in LAZY_MODULES:
+            self.assertNotIn(module, modules)
+
+    def test_lazy_attributes(self):
+        import acquantum_qiskit
+        from acquantum_qiskit.acquantumprovider import AcQuantumProvider
+        from acquantumconnector.credentials.credentials import AcQuantumCredentials
+
+        self.assertIs(acquantum_qiskit.AcQuantumProvider, AcQuantumProvider)
+        self.assertIs(acquantum_qiskit.AcQuantumCredentials, AcQuantumCredentials)
+        self.assertIn('AcQuantumProvider', dir(acquantum_qiskit))
+        with self.assertRaises(AttributeError):
+            getattr(acquantum_qiskit, 'AcQuantumUnknown')
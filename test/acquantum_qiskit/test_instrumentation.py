@@ -0,0 +1,145 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase, mock
+from unittest.mock import Mock
+
+import acquantumconnector.model.gates as ac_gates
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+
+from acquantum_qiskit.acquantumbackend import AcQuantumBackend
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.backendconfiguration import AcQuantumBackendConfiguration
+from acquantum_qiskit.instrumentation import AcQuantumInstrumentation, AcQuantumInstrumentedConnector, \
+    AcQuantumListener, AcQuantumStatistics, AcQuantumEvent, DISABLED_INSTRUMENTATION, STAGE_TRANSLATION, \
+    STAGE_REQUEST, STAGE_QUEUE, STAGE_WAIT, STAGE_RESULT, STAGE_VALIDATION
+from acquantum_qiskit.localconnector import AcQuantumLocalConnector
+
+
+class RecordingListener(AcQuantumListener):
+
+    def __init__(self):
+        self.events = []
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+class TestInstrumentation(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.instrumentation = AcQuantumInstrumentation()
+        self.listener = RecordingListener()
+
+    def test_stage(self):
+        with self.instrumentation.stage(STAGE_TRANSLATION) as timer:
+            timer.size = 3
+        self.assertIs(self.instrumentation.stage(STAGE_TRANSLATION), DISABLED_INSTRUMENTATION.stage(STAGE_RESULT))
+
+        self.instrumentation.add_listener(self.listener)
+        with self.instrumentation.stage(STAGE_TRANSLATION, job_id='1') as timer:
+            timer.size = 3
+        with self.assertRaises(KeyError):
+            with self.instrumentation.stage(STAGE_RESULT):
+                raise KeyError()
+        self.instrumentation.remove_listener(self.listener)
+        with self.instrumentation.stage(STAGE_WAIT):
+            pass
+
+        self.assertListEqual([(e.stage, e.job_id, e.size, e.error) for e in self.listener.events],
+                             [(STAGE_TRANSLATION, '1', 3, None), (STAGE_RESULT, None, None, 'KeyError')])
+        with self.assertRaises(ValueError):
+            DISABLED_INSTRUMENTATION.add_listener(self.listener)
+
+    def test_instrumented_connector(self):
+        api = Mock()
+        api.get_experiments.return_value = [1, 2, 3]
+        connector = AcQuantumInstrumentedConnector(api, self.instrumentation)
+
+        self.assertIs(connector.get_experiments, api.get_experiments)
+
+        self.instrumentation.add_listener(self.listener)
+        self.assertListEqual(connector.get_experiments(), [1, 2, 3])
+        connector.update_experiment(1, [Mock(), Mock()], code='')
+        api.delete_experiment.side_effect = RuntimeError()
+        with self.assertRaises(RuntimeError):
+            connector.delete_experiment(1)
+
+        self.assertListEqual([(e.stage, e.method, e.size, e.error) for e in self.listener.events], [
+            (STAGE_REQUEST, 'get_experiments', 3, None),
+            (STAGE_REQUEST, 'update_experiment', 2, None),
+            (STAGE_REQUEST, 'delete_experiment', None, 'RuntimeError')
+        ])
+
+    def test_statistics(self):
+        statistics = AcQuantumStatistics()
+        for seconds in range(1, 101):
+            statistics.on_event(AcQuantumEvent(STAGE_REQUEST, seconds / 1000, method='get_result', size=2))
+        statistics.on_event(AcQuantumEvent(STAGE_WAIT, 1.0, error='AcQuantumJobTimeOutError'))
+
+        self.assertListEqual(statistics.keys(), [(STAGE_REQUEST, 'get_result'), (STAGE_WAIT, None)])
+        self.assertEqual(statistics.count(STAGE_REQUEST, 'get_result'), 100)
+        self.assertAlmostEqual(statistics.percentiles(STAGE_REQUEST, 'get_result')[50], 0.0505)
+        self.assertDictEqual(statistics.percentiles(STAGE_TRANSLATION), {})
+
+        [request, wait] = statistics.summary(percentiles=(90,))
+        self.assertEqual(request['size'], 200)
+        self.assertAlmostEqual(request['p90'], 0.0901)
+        self.assertEqual(wait['errors'], 1)
+        self.assertEqual(len(statistics.report().splitlines()), 3)
+
+        statistics.reset()
+        self.assertListEqual(statistics.keys(), [])
+
+    def test_statistics_bounded(self):
+        statistics = AcQuantumStatistics(max_samples=10)
+        for seconds in range(1, 101):
+            statistics.on_event(AcQuantumEvent(STAGE_REQUEST, seconds / 1000, method='get_result'))
+
+        [request] = statistics.summary(percentiles=(0,))
+        self.assertEqual(request['count'], 100)
+        self.assertAlmostEqual(request['seconds'], 5.05)
+        # the percentiles cover the latest ten events only
+        self.assertAlmostEqual(request['p0'], 0.091)
+
+    def test_backend(self):
+        connector = AcQuantumLocalConnector()
+        [config] = [c for c in connector.available_backends() if c['simulator']]
+        backend = AcQuantumBackend(AcQuantumBackendConfiguration.from_dict(config), None,
+                                   AcQuantumCredentials('', ''), connector)
+        statistics = AcQuantumStatistics()
+        backend.add_listener(statistics)
+
+        instruction = Mock(qubits=[0])
+        instruction.name = 'x'
+        experiment = Mock(instructions=[instruction], config=Mock(qubit_layout=None))
+        qobj = Mock(qobj_id='qobj', config=Mock(shots=100, seed=3), experiments=[experiment])
+        qobj.experiments[0].header.name = 'x'
+        qobj.experiments[0].header.as_dict.return_value = {'name': 'x'}
+        gates = [ac_gates.XGate(1, 1), ac_gates.Measure(2, 1)]
+
+        with mock.patch.object(AcQuantumJob, '_gates_from_qobj', return_value=gates):
+            job = backend.run(qobj)
+        job.result(wait=0).materialize()
+        self.assertListEqual(job.counts().values.tolist(), [1])
+
+        keys = statistics.keys()
+        for key in [(STAGE_TRANSLATION, None), (STAGE_QUEUE, None), (STAGE_WAIT, None), (STAGE_RESULT, None),
+                    (STAGE_VALIDATION, None), (STAGE_REQUEST, 'create_experiment'),
+                    (STAGE_REQUEST, 'update_experiment'), (STAGE_REQUEST, 'run_experiment'),
+                    (STAGE_REQUEST, 'get_result')]:
+            self.assertIn(key, keys)
+        self.assertEqual(statistics.summary()[keys.index((STAGE_TRANSLATION, None))]['size'], 2)
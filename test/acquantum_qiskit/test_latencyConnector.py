@@ -0,0 +1,126 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase, mock
+from unittest.mock import Mock
+
+import acquantumconnector.model.gates as ac_gates
+from acquantumconnector.credentials.credentials import AcQuantumCredentials
+from acquantumconnector.model.backendtype import AcQuantumBackendType
+from acquantumconnector.model.errors import AcQuantumRequestError
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob, AcQuantumJobStatus
+from acquantum_qiskit.acquantumprovider import AcQuantumProvider
+from acquantum_qiskit.latencyconnector import AcQuantumLatencyConnector, uniform_latency
+from acquantum_qiskit.localconnector import AcQuantumLocalConnector
+
+
+class Clock:
+
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class TestLatencyConnector(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.clock = Clock()
+
+    def connector(self, **kwargs):
+        return AcQuantumLatencyConnector(AcQuantumLocalConnector(), clock=self.clock, sleep=self.clock.sleep,
+                                         seed=1, **kwargs)
+
+    def test_latency(self):
+        connector = self.connector(latency={None: 0.1, 'get_experiments': uniform_latency(1, 2)})
+
+        connector.available_backends()
+        connector.get_experiments()
+
+        self.assertEqual(self.clock.sleeps[0], 0.1)
+        self.assertTrue(1 <= self.clock.sleeps[1] <= 2)
+        self.assertDictEqual(connector.request_counts(), {'available_backends': 1, 'get_experiments': 1})
+
+    def test_errors(self):
+        connector = self.connector(error_rate={None: 0.0, 'get_experiments': 1.0})
+
+        connector.available_backends()
+        with self.assertRaises(AcQuantumRequestError) as context:
+            connector.get_experiments()
+        self.assertEqual(context.exception.status_code, 500)
+        self.assertDictEqual(connector.error_counts(), {'get_experiments': 1})
+
+    def test_rate_limit(self):
+        connector = self.connector(rate_limit=2)
+
+        connector.get_experiments()
+        connector.get_experiments()
+        with self.assertRaises(AcQuantumRequestError) as context:
+            connector.get_experiments()
+        self.assertEqual(context.exception.status_code, 429)
+
+        self.clock.now += 0.5
+        connector.get_experiments()
+
+    def test_queue_delay(self):
+        connector = self.connector(queue_delay=10)
+        first = connector.create_experiment(1, AcQuantumBackendType.SIMULATE, 'first')
+        second = connector.create_experiment(1, AcQuantumBackendType.SIMULATE, 'second')
+        for experiment_id in (first, second):
+            connector.update_experiment(experiment_id, [ac_gates.XGate(1, 1), ac_gates.Measure(2, 1)])
+            connector.run_experiment(experiment_id, AcQuantumBackendType.SIMULATE, 1, 100)
+            self.clock.now += 1
+
+        [queued] = connector.get_result(second).get_results()
+        self.assertIsNone(queued.finish_time)
+        self.assertEqual(queued.process, '[2]')
+
+        self.clock.now += 10
+        [result] = connector.get_result(second).get_results()
+        self.assertIsNotNone(result.finish_time)
+        self.assertDictEqual(result.data, {'1': 1.0})
+
+    def test_provider(self):
+        clock = Clock()
+        connector = AcQuantumLatencyConnector(AcQuantumLocalConnector(), latency=0.01, queue_delay=0.05, seed=1,
+                                              clock=clock, sleep=clock.sleep)
+
+        provider = AcQuantumProvider(connector_factory=lambda: connector)
+        provider.enable_account(AcQuantumCredentials('user', 'password'))
+        [backend] = provider.backends('SIMULATE')
+
+        experiment = Mock(instructions=[], config=Mock(qubit_layout=None))
+        qobj = Mock(qobj_id='qobj', config=Mock(shots=100, seed=3), experiments=[experiment])
+        qobj.experiments[0].header.name = 'bell'
+        qobj.experiments[0].header.as_dict.return_value = {'name': 'bell'}
+        gates = [ac_gates.HGate(1, 1), ac_gates.HGate(1, 2), ac_gates.CPhase(2, [1, 2]), ac_gates.HGate(3, 2),
+                 ac_gates.Measure(4, 1), ac_gates.Measure(4, 2)]
+
+        with mock.patch.object(AcQuantumJob, '_translate_experiment', return_value=(gates, 2, None)):
+            job = backend.run(qobj)
+
+        self.assertEqual(job.status(), AcQuantumJobStatus.QUEUED)
+        counts = job.counts(wait=0.01)
+        self.assertEqual(job.status(), AcQuantumJobStatus.DONE)
+        self.assertListEqual(sorted(counts.values.tolist()), [0, 3])
+        self.assertGreater(connector.request_counts()['get_result'], 2)
@@ -0,0 +1,101 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import copy
+import pickle
+from unittest import TestCase, mock
+from unittest.mock import Mock
+
+from qiskit.result import Result
+
+from acquantumconnector.model.response import AcQuantumResultResponse, AcQuantumResult
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.experimentcode import AcQuantumExperimentMetadata
+from acquantum_qiskit.lazyresult import AcQuantumLazyResult
+from acquantum_qiskit.metadatastore import AcQuantumMemoryMetadataStore
+
+result_dict = {
+    'results': [{
+        'status': 'DONE', 'success': True, 'name': 'circuit', 'seed': 1, 'shots': 10,
+        'data': {'counts': {'0x0': 5, '0x3': 5}}, 'start_time': '2019-01-11', 'finish_time': '2019-01-12',
+        'header': {'name': 'circuit'}
+    }],
+    'backend_name': 'SIMULATE',
+    'backend_version': '0.0.1',
+    'qobj_id': 'qobj',
+    'job_id': '1',
+    'success': True,
+    'header': {'backend_name': 'SIMULATE'},
+    'date': '2019-01-12T00:00:00'
+}
+
+
+class TestAcQuantumLazyResult(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_materialize_on_first_use(self):
+        builder = Mock(return_value=result_dict)
+        result = AcQuantumLazyResult(builder, 'SIMULATE', '0.0.1', '1', True)
+
+        self.assertIsInstance(result, Result)
+        self.assertTrue(result.success)
+        self.assertEqual(result.job_id, '1')
+        self.assertFalse(result.is_materialized())
+        builder.assert_not_called()
+
+        self.assertEqual(result.qobj_id, 'qobj')
+        self.assertEqual(len(result.results), 1)
+        self.assertTrue(result.is_materialized())
+        builder.assert_called_once_with()
+
+    def test_pickle(self):
+        result = pickle.loads(pickle.dumps(AcQuantumLazyResult(lambda: result_dict, 'SIMULATE', '0.0.1', '1', True)))
+
+        self.assertIs(type(result), Result)
+        self.assertEqual(result.qobj_id, 'qobj')
+        self.assertEqual(result.get_counts('circuit'), Result.from_dict(result_dict).get_counts('circuit'))
+
+    def test_deepcopy(self):
+        lazy_result = AcQuantumLazyResult(lambda: result_dict, 'SIMULATE', '0.0.1', '1', True)
+        result = copy.deepcopy(lazy_result)
+
+        self.assertIs(type(result), Result)
+        self.assertTrue(lazy_result.is_materialized())
+        self.assertEqual(result.to_dict(), lazy_result.to_dict())
+        self.assertIsNot(result.results[0], lazy_result.results[0])
+
+    def test_job_result(self):
+        api_mock = Mock()
+        response = AcQuantumResultResponse(
+            simulated_result=[AcQuantumResult(result_id=12, seed=100, shots=10, start_time='2019-01-11',
+                                              measure_qubits=2, finish_time='2019-01-12', data={'11': 1.0})])
+        store = AcQuantumMemoryMetadataStore()
+        store.put(1, AcQuantumExperimentMetadata('qobj', 'circuit', {'name': 'circuit'}))
+        backend_mock = Mock()
+        backend_mock.configuration.return_value = Mock(backend_name='SIMULATE', backend_version='0.0.1')
+        backend_mock.metadata_store.return_value = store
+        backend_mock.result_cache.return_value = None
+
+        job = AcQuantumJob(backend_mock, '1', api_mock, False)
+        with mock.patch.object(job, '_experiment_metadata', wraps=job._experiment_metadata) as metadata_mock:
+            result = job._result_from_job_response([response])
+            self.assertTrue(result.success)
+            metadata_mock.assert_not_called()
+
+            self.assertEqual(result.qobj_id, 'qobj')
+            metadata_mock.assert_called_once_with(1)
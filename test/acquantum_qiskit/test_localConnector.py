@@ -0,0 +1,114 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+from unittest.mock import Mock
+
+import acquantumconnector.model.gates as ac_gates
+from acquantumconnector.model.backendtype import AcQuantumBackendType
+from acquantumconnector.model.errors import AcQuantumRequestError
+from acquantumconnector.model.response import AcQuantumResultResponse
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.backendconfiguration import AcQuantumBackendConfiguration
+from acquantum_qiskit.counts import AcQuantumCounts
+from acquantum_qiskit.experimentcode import AcQuantumExperimentMetadata
+from acquantum_qiskit.localconnector import AcQuantumLocalConnector
+from acquantum_qiskit.metadatastore import AcQuantumMemoryMetadataStore
+
+
+class TestLocalConnector(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connector = AcQuantumLocalConnector()
+
+    def test_run_experiment(self):
+        experiment_id = self.connector.create_experiment(2, AcQuantumBackendType.SIMULATE, 'bell')
+        gates = [ac_gates.HGate(1, 1), ac_gates.HGate(1, 2), ac_gates.CPhase(2, [1, 2]), ac_gates.HGate(3, 2),
+                 ac_gates.Measure(4, 1), ac_gates.Measure(4, 2)]
+        self.connector.update_experiment(experiment_id, gates, code='code')
+        self.assertListEqual(self.connector.get_result(experiment_id).get_results() or [], [])
+
+        self.connector.run_experiment(experiment_id, AcQuantumBackendType.SIMULATE, 2, 1000, seed=42)
+
+        [result] = self.connector.get_result(experiment_id).get_results()
+        self.assertIsNotNone(result.finish_time)
+        self.assertIsNone(result.exception)
+        self.assertListEqual(result.measure_qubits, [1, 2])
+        self.assertListEqual(sorted(result.data.keys()), ['00', '11'])
+        counts = AcQuantumCounts.from_data(result.data, result.shots)
+        self.assertEqual(sum(counts.counts()), 1000)
+
+        experiment = self.connector.get_experiment(experiment_id)
+        self.assertEqual(experiment.code, 'code')
+        self.assertEqual(experiment.detail.bit_width, 2)
+        self.assertEqual(len(experiment.data), 6)
+
+    def test_run_experiment_without_seed(self):
+        experiment_id = self.connector.create_experiment(2, AcQuantumBackendType.SIMULATE, 'bell')
+        self.connector.update_experiment(experiment_id, [ac_gates.HGate(1, 1), ac_gates.Measure(2, 1)])
+
+        self.connector.run_experiment(experiment_id, AcQuantumBackendType.SIMULATE, 2, 100)
+        [result] = self.connector.get_result(experiment_id).get_results()
+        self.assertIsInstance(result.seed, int)
+
+        self.connector.run_experiment(experiment_id, AcQuantumBackendType.SIMULATE, 2, 100, seed=result.seed)
+        self.assertDictEqual(self.connector.get_result(experiment_id).get_results()[1].data, result.data)
+
+        store = AcQuantumMemoryMetadataStore()
+        store.put(experiment_id, AcQuantumExperimentMetadata('qobj', 'bell', {'name': 'bell'}))
+        backend_mock = Mock()
+        backend_mock.configuration.return_value = Mock(backend_name='SIMULATE', backend_version='0.0.1')
+        backend_mock.metadata_store.return_value = store
+        backend_mock.result_cache.return_value = None
+        job = AcQuantumJob(backend_mock, str(experiment_id), self.connector, False)
+
+        qiskit_result = job._result_from_job_response([AcQuantumResultResponse(simulated_result=[result])])
+        self.assertTrue(qiskit_result.success)
+        self.assertEqual(qiskit_result.results[0].seed, result.seed)
+
+    def test_run_experiment_failure(self):
+        experiment_id = self.connector.create_experiment(1, AcQuantumBackendType.REAL, 'failing')
+        self.connector.update_experiment(experiment_id, [ac_gates.HGate(1, 2)])
+
+        self.connector.run_experiment(experiment_id, AcQuantumBackendType.REAL, 1, 100)
+
+        response = self.connector.get_result(experiment_id)
+        self.assertListEqual(response.simulated_result, [])
+        self.assertIsNotNone(response.real_result[0].exception)
+
+        with self.assertRaises(AcQuantumRequestError):
+            self.connector.create_experiment(12, AcQuantumBackendType.REAL, 'too wide')
+
+    def test_experiments(self):
+        first = self.connector.create_experiment(1, AcQuantumBackendType.SIMULATE, 'first')
+        second = self.connector.create_experiment(1, AcQuantumBackendType.REAL, 'second')
+
+        self.assertListEqual([(e.experiment_id, e.experiment_type) for e in self.connector.get_experiments()],
+                             [(first, 'SIMULATE'), (second, 'REAL')])
+
+        self.connector.delete_experiment(first)
+        self.assertListEqual([e.name for e in self.connector.get_experiments()], ['second'])
+        with self.assertRaises(AcQuantumRequestError):
+            self.connector.get_experiment(first)
+
+    def test_backends(self):
+        configs = [AcQuantumBackendConfiguration.from_dict(c) for c in self.connector.available_backends()]
+        self.assertListEqual([c.backend_name for c in configs], ['SIMULATE', 'REAL'])
+
+        raw_config = self.connector.get_backend_config()
+        self.assertEqual(raw_config.system_status.config_value.status, 'ONLINE')
+        self.assertEqual(raw_config.system_config.config_value.measure_size_upper_limit, 11)
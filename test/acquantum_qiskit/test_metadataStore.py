@@ -0,0 +1,85 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import os
+import tempfile
+from unittest import TestCase
+from unittest.mock import Mock
+
+from acquantum_qiskit.acquantumjob import AcQuantumJob
+from acquantum_qiskit.experimentcode import AcQuantumExperimentMetadata, encode_experiment_code
+from acquantum_qiskit.metadatastore import AcQuantumMemoryMetadataStore, AcQuantumSqliteMetadataStore
+from acquantum_qiskit.models import AcQuantumExperiment
+
+
+def metadata(name):
+    return AcQuantumExperimentMetadata('qobj', name, {'name': name, 'memory_slots': 2}, [0, 2])
+
+
+class TestAcQuantumMetadataStore(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        super().tearDown()
+
+    def test_memory_store(self):
+        store = AcQuantumMemoryMetadataStore(max_entries=2)
+        store.put(1, metadata('first'))
+        store.put(2, metadata('second'))
+        self.assertEqual(store.get(1), metadata('first'))
+
+        store.put(3, metadata('third'))
+        self.assertIsNone(store.get(2))
+        self.assertEqual(store.get('1'), metadata('first'))
+
+        store.remove(1)
+        self.assertIsNone(store.get(1))
+
+    def test_sqlite_store(self):
+        path = os.path.join(self.directory.name, 'store', 'metadata.sqlite')
+        AcQuantumSqliteMetadataStore(path).put(1, metadata('first'))
+
+        store = AcQuantumSqliteMetadataStore(path)
+        self.assertEqual(store.get(1), metadata('first'))
+        self.assertIsNone(store.get(2))
+
+        store.put(1, metadata('changed'))
+        self.assertEqual(store.get(1), metadata('changed'))
+        store.remove(1)
+        self.assertIsNone(store.get(1))
+
+    def test_job_experiment_metadata(self):
+        store = AcQuantumMemoryMetadataStore()
+        store.put(1, metadata('first'))
+        qobj = Mock(qobj_id='qobj', experiments=[Mock(config=None)])
+        qobj.experiments[0].header.name = 'second'
+        qobj.experiments[0].header.as_dict.return_value = {'name': 'second', 'memory_slots': 2}
+
+        api_mock = Mock()
+        api_mock.get_experiment.return_value = AcQuantumExperiment(None, None, encode_experiment_code(qobj, [0, 2]))
+        backend_mock = Mock()
+        backend_mock.metadata_store.return_value = store
+        job = AcQuantumJob(backend_mock, '1,2', api_mock, False)
+
+        self.assertEqual(job._experiment_metadata(1), metadata('first'))
+        api_mock.get_experiment.assert_not_called()
+
+        self.assertEqual(job._experiment_metadata(2), metadata('second'))
+        self.assertEqual(job._experiment_metadata(2), metadata('second'))
+        api_mock.get_experiment.assert_called_once_with(2)
@@ -0,0 +1,52 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+
+from acquantum_qiskit.pollingstrategy import AcQuantumPollingStrategy, AcQuantumFixedPollingStrategy
+
+
+class TestAcQuantumPollingStrategy(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_backoff(self):
+        strategy = AcQuantumPollingStrategy(initial_interval=1, max_interval=10, backoff_factor=2, jitter=0)
+        self.assertListEqual([strategy.interval(a) for a in range(5)], [1, 2, 4, 8, 10])
+
+    def test_queue_position(self):
+        strategy = AcQuantumPollingStrategy(initial_interval=1, max_interval=100, jitter=0, queue_factor=0.5)
+        self.assertEqual(strategy.interval(0, '0'), 1)
+        self.assertEqual(strategy.interval(0, '32'), 17)
+        self.assertEqual(strategy.interval(0, ''), 1)
+        self.assertEqual(strategy.interval(0, None), 1)
+        self.assertEqual(strategy.interval(0, '1000'), 100)
+
+    def test_jitter(self):
+        strategy = AcQuantumPollingStrategy(initial_interval=10, max_interval=20, jitter=0.1)
+        for _ in range(100):
+            self.assertTrue(9 <= strategy.interval(0) <= 11)
+
+    def test_fixed(self):
+        strategy = AcQuantumFixedPollingStrategy(3)
+        self.assertEqual(strategy.interval(0, '50'), 3)
+        self.assertEqual(strategy.interval(20), 3)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            AcQuantumPollingStrategy(initial_interval=10, max_interval=1)
+        with self.assertRaises(ValueError):
+            AcQuantumPollingStrategy(backoff_factor=0.5)
@@ -0,0 +1,54 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from types import SimpleNamespace
+from unittest import TestCase
+
+import acquantumconnector.model.gates as ac_gates
+
+from acquantum_qiskit.gatetranslator import AcQuantumOperation, translate_cx
+from acquantum_qiskit.qubitlayout import used_qubits, compact_operations, expand_value
+
+
+class TestQubitLayout(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_used_qubits(self):
+        experiment = SimpleNamespace(instructions=[
+            SimpleNamespace(name='h', qubits=[7]),
+            SimpleNamespace(name='barrier', qubits=[0, 1, 3, 7]),
+            SimpleNamespace(name='cx', qubits=[7, 3]),
+            SimpleNamespace(name='measure', qubits=[3], memory=[0])
+        ])
+        self.assertListEqual(used_qubits(experiment), [3, 7])
+
+    def test_compact_operations(self):
+        operations = [AcQuantumOperation(ac_gates.RzGate, (7,), (90,))] + translate_cx(None, (7, 3))
+        for operation in operations[1:]:
+            operation.span = (7, 3)
+
+        compacted = compact_operations(operations, [3, 7])
+
+        self.assertListEqual(compacted, [AcQuantumOperation(ac_gates.RzGate, (1,), (90,))] + translate_cx(None, (1, 0)))
+        self.assertEqual(compacted[2].span, (1, 0))
+        self.assertEqual(operations[0].qubits, (7,))
+
+    def test_expand_value(self):
+        self.assertEqual(expand_value(0b00, [3, 7]), 0)
+        self.assertEqual(expand_value(0b01, [3, 7]), 0b1000)
+        self.assertEqual(expand_value(0b11, [3, 7]), 0b10001000)
+        self.assertEqual(expand_value(0b11, [0, 1]), 0b11)
@@ -0,0 +1,63 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+import os
+import tempfile
+import time
+from unittest import TestCase
+
+from acquantum_qiskit.resultcache import AcQuantumResultCache
+
+
+class TestAcQuantumResultCache(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self._directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        self._directory.cleanup()
+        super().tearDown()
+
+    def test_put_get(self):
+        cache = AcQuantumResultCache(self._directory.name)
+        result_dict = {'job_id': '1,2', 'results': [{'name': 'test', 'data': {'counts': {'0x1': 10}}}]}
+        cache.put('1,2', result_dict)
+        self.assertDictEqual(cache.get('1,2'), result_dict)
+        self.assertIsNone(cache.get('3'))
+
+    def test_shared_between_instances(self):
+        AcQuantumResultCache(self._directory.name).put('1', {'job_id': '1'})
+        self.assertDictEqual(AcQuantumResultCache(self._directory.name).get('1'), {'job_id': '1'})
+
+    def test_eviction(self):
+        cache = AcQuantumResultCache(self._directory.name, max_bytes=1000)
+        payload = {'data': 'x' * 300}
+        for job_id in ['1', '2', '3']:
+            cache.put(job_id, payload)
+            time.sleep(0.01)
+        # using an entry makes it the most recent one
+        cache.get('1')
+        cache.put('4', payload)
+        self.assertIsNone(cache.get('2'))
+        self.assertIsNotNone(cache.get('1'))
+        self.assertIsNotNone(cache.get('4'))
+
+    def test_clear(self):
+        cache = AcQuantumResultCache(self._directory.name)
+        cache.put('1', {})
+        cache.put('2', {})
+        cache.clear()
+        self.assertListEqual(os.listdir(self._directory.name), [])
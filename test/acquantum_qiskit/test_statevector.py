@@ -0,0 +1,64 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from unittest import TestCase
+
+import numpy as np
+
+from acquantum_qiskit.statevector import simulate, sample, gate_matrix
+
+
+def gate(x, y, text, **kwargs):
+    return dict(x=x, y=y, text=text, gateDetail={}, **kwargs)
+
+
+class TestStatevector(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+
+    def test_gate_matrix(self):
+        np.testing.assert_allclose(gate_matrix('RX_180'), -1j * gate_matrix('X'), atol=1e-12)
+        np.testing.assert_allclose(gate_matrix('RY_180'), -1j * gate_matrix('Y'), atol=1e-12)
+        np.testing.assert_allclose(gate_matrix('RZ_90.0'), np.exp(-1j * np.pi / 4) * gate_matrix('S'), atol=1e-12)
+        with self.assertRaises(ValueError):
+            gate_matrix('U')
+
+    def test_simulate(self):
+        # CNOT from qubit 0 to qubit 2 as H-CP-H, qubit 1 stays zero
+        gates = [gate(1, 1, 'H'), gate(1, 3, 'H'), gate(2, 1, 'CP', y1=3), gate(3, 3, 'H'),
+                 gate(4, 1, 'M'), gate(4, 3, 'M')]
+
+        state, measured = simulate(gates, 3)
+
+        np.testing.assert_allclose(np.abs(state) ** 2, [0.5, 0, 0, 0, 0, 0.5, 0, 0], atol=1e-12)
+        self.assertListEqual(measured, [0, 2])
+
+        state, measured = simulate([gate(1, 2, 'X'), gate(1, 1, 'X'), gate(2, 1, 'X'), gate(2, 2, 'CCP', y1=1, y2=3)],
+                                   3)
+        np.testing.assert_allclose(state, [0, 0, 1, 0, 0, 0, 0, 0], atol=1e-12)
+        self.assertListEqual(measured, [0, 1, 2])
+
+        with self.assertRaises(ValueError):
+            simulate([gate(1, 3, 'X')], 2)
+
+    def test_sample(self):
+        state = np.full(8, 1 / np.sqrt(8), dtype=np.complex128)
+
+        data = sample(state, [1], 1000, seed=7)
+
+        self.assertListEqual(sorted(data.keys()), ['000', '010'])
+        self.assertAlmostEqual(sum(data.values()), 1.0)
+        self.assertDictEqual(data, sample(state, [1], 1000, seed=7))
@@ -0,0 +1,125 @@
+#  Copyright (c) 2019.  Carsten Blank
+#
+#   Licensed under the Apache License, Version 2.0 (the "License");
+#   you may not use this file except in compliance with the License.
+#   You may obtain a copy of the License at
+#
+#       http://www.apache.org/licenses/LICENSE-2.0
+#
+#   Unless required by applicable law or agreed to in writing, software
+#   distributed under the License is distributed on an "AS IS" BASIS,
+#   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#   See the License for the specific language governing permissions and
+#   limitations under the License.
+
+
+from types import SimpleNamespace
+from unittest import TestCase, mock
+
+import acquantumconnector.model.gates as ac_gates
+
+from acquantum_qiskit import translationcache
+from acquantum_qiskit.gatetranslator import AcQuantumOperation, register_gate_translator, translate_cx
+from acquantum_qiskit.translationcache import AcQuantumTranslationCache, AcQuantumTranslationTemplate, \
+    structural_key
+
+
+class RotationGate:
+    pass
+
+
+class CnotGate:
+    pass
+
+
+def translate_rotation(op, qubits):
+    [theta] = op.param
+    return [AcQuantumOperation(ac_gates.HGate, qubits), AcQuantumOperation(ac_gates.RzGate, qubits, (theta,))]
+
+
+def instruction(name, qubits, params=None):
+    return SimpleNamespace(name=name, qubits=qubits, memory=[], params=params or [])
+
+
+def qobj(*instructions):
+    header = SimpleNamespace(qubit_labels=[['q', 0], ['q', 1]], clbit_labels=[])
+    return SimpleNamespace(experiments=[SimpleNamespace(header=header, instructions=list(instructions))])
+
+
+def template():
+    operations = translate_rotation(SimpleNamespace(param=[10]), (0,)) + translate_cx(None, (0, 1))
+    for operation, source in zip(operations, [0, 0, 1, 1, 1]):
+        operation.source = source
+    return AcQuantumTranslationTemplate.from_operations(operations, [RotationGate, CnotGate])
+
+
+def as_instruction(name, params):
+    return SimpleNamespace(name=name, param=list(params))
+
+
+@mock.patch.object(translationcache, '_instruction', as_instruction)
+class TestAcQuantumTranslationCache(TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        register_gate_translator(RotationGate, translate_rotation)
+        register_gate_translator(CnotGate, translate_cx)
+
+    def test_structural_key(self):
+        first = qobj(instruction('rz', [0], [10]), instruction('cx', [0, 1]))
+        second = qobj(instruction('rz', [0], [20]), instruction('cx', [0, 1]))
+        third = qobj(instruction('rz', [1], [10]), instruction('cx', [0, 1]))
+
+        self.assertEqual(structural_key(first.experiments[0]), structural_key(second.experiments[0]))
+        self.assertNotEqual(structural_key(first.experiments[0]), structural_key(third.experiments[0]))
+
+    def test_bind(self):
+        cached = template()
+        self.assertEqual(len(cached.rebindings), 1)
+
+        operations = cached.bind([instruction('rz', [0], [20]), instruction('cx', [0, 1])])
+
+        self.assertEqual(operations[1], AcQuantumOperation(ac_gates.RzGate, (0,), (20,)))
+        self.assertEqual(operations[2:], translate_cx(None, (0, 1)))
+        self.assertEqual(cached.operations[1].params, (10,))
+        self.assertIsNot(operations[0], cached.operations[0])
+
+
+class TestAcQuantumTranslationCacheCircuits(TestCase):
+
+    @staticmethod
+    def sample(first, second, first_qubit=0):
+        import qiskit.extensions.standard as standard
+        from qiskit.circuit import QuantumCircuit, QuantumRegister
+        from qiskit.converters import circuits_to_qobj
+
+        q = QuantumRegister(2, "q")
+        qc = QuantumCircuit(q, name="Sample")
+        standard.ry(qc, first, q[first_qubit])
+        standard.cx(qc, q[0], q[1])
+        standard.rz(qc, second, q[1])
+        return circuits_to_qobj([qc], backend_name='SIMULATE')
+
+    @staticmethod
+    def angles(operations):
+        return [(operation.gate, operation.qubits, float(operation.params[0]))
+                for operation in operations if operation.gate in (ac_gates.RyGate, ac_gates.RzGate)]
+
+    def test_translate(self):
+        cache = AcQuantumTranslationCache(max_size=1)
+
+        first = cache.translate(self.sample(180, 90))
+        self.assertEqual(self.angles(first), [(ac_gates.RyGate, (0,), 180), (ac_gates.RzGate, (1,), 90)])
+
+        for first_angle, second_angle in [(0, 45), (90, 270)]:
+            operations = cache.translate(self.sample(first_angle, second_angle))
+            self.assertEqual(self.angles(operations),
+                             [(ac_gates.RyGate, (0,), first_angle), (ac_gates.RzGate, (1,), second_angle)])
+            self.assertEqual([o.gate for o in operations], [o.gate for o in first])
+        self.assertEqual((cache.hits, cache.misses), (2, 1))
+
+        cache.translate(self.sample(180, 90, first_qubit=1))
+        self.assertEqual(len(cache), 1)
+        operations = cache.translate(self.sample(30, 60))
+        self.assertEqual((cache.hits, cache.misses), (2, 3))
+        self.assertEqual(self.angles(operations), [(ac_gates.RyGate, (0,), 30), (ac_gates.RzGate, (1,), 60)])